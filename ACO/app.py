@@ -4,17 +4,12 @@ import threading
 import time
 import os
 import sys
-import numpy as np
-import matplotlib
-matplotlib.use('TkAgg')
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
 
 # permitir imports relativos
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from src.aco import AntColony
-from src.tsp import random_coords, coords_to_distance_matrix, load_latlon_csv, haversine_distance_matrix
+# Arranque rápido: numpy, matplotlib y `src` no se importan aquí. El solver se importa
+# al inicializar la primera instancia y las figuras se crean en `ensure_plots()`.
 
 
 class ACOGui(tk.Tk):
@@ -30,6 +25,7 @@ class ACOGui(tk.Tk):
         # image handles for pheromone heatmap (so we can update in-place)
         self.pher_im = None
         self.pher_colorbar = None
+        self.fig_route = None
 
     def create_widgets(self):
         control_frame = ttk.Frame(self)
@@ -103,14 +99,11 @@ class ACOGui(tk.Tk):
 
         right_bottom = ttk.Frame(plot_frame)
         right_bottom.pack(side=tk.BOTTOM, fill=tk.BOTH, expand=True)
+        self.right_top, self.right_bottom = right_top, right_bottom
 
-        self.fig_route, self.ax_route = plt.subplots(figsize=(6,4))
-        self.canvas_route = FigureCanvasTkAgg(self.fig_route, master=right_top)
-        self.canvas_route.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
-
-        self.fig_pher, self.ax_pher = plt.subplots(figsize=(4,4))
-        self.canvas_pher = FigureCanvasTkAgg(self.fig_pher, master=right_bottom)
-        self.canvas_pher.get_tk_widget().pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # the figures are created on first use (ensure_plots); until then, a placeholder
+        self.plot_placeholder = ttk.Label(right_top, text='Inicializa una instancia para ver la ruta y la feromona')
+        self.plot_placeholder.pack(expand=True)
 
         # log of best distances
         log_frame = ttk.Frame(right_bottom)
@@ -119,7 +112,30 @@ class ACOGui(tk.Tk):
         self.log_listbox = tk.Listbox(log_frame, height=12, width=30)
         self.log_listbox.pack(fill=tk.BOTH, expand=True)
 
+    def ensure_plots(self):
+        """Create the matplotlib figures the first time they are needed (importing matplotlib dominates startup)."""
+        if self.fig_route is not None:
+            return
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        self.plot_placeholder.destroy()
+        # plain Figure objects: embedded canvases do not need pyplot's global figure manager
+        self.fig_route = Figure(figsize=(6,4))
+        self.ax_route = self.fig_route.add_subplot()
+        self.canvas_route = FigureCanvasTkAgg(self.fig_route, master=self.right_top)
+        self.canvas_route.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+
+        self.fig_pher = Figure(figsize=(4,4))
+        self.ax_pher = self.fig_pher.add_subplot()
+        self.canvas_pher = FigureCanvasTkAgg(self.fig_pher, master=self.right_bottom)
+        self.canvas_pher.get_tk_widget().pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
     def initialize(self):
+        import numpy as np
+        from src.aco import AntColony
+        from src.tsp import random_coords, coords_to_distance_matrix, load_latlon_csv, haversine_distance_matrix
+
         try:
             if self.instance_var.get() == 'Aleatoria':
                 coords = random_coords(self.num_cities.get(), seed=self.seed_var.get(), scale=100)
@@ -132,7 +148,7 @@ class ACOGui(tk.Tk):
                 dist = haversine_distance_matrix(coords)
             self.coords = coords
             self.names = names
-            self.aco = AntColony(distances=dist, n_ants=int(self.n_ants.get()), n_best=int(self.n_best.get()), n_iterations=int(self.n_iterations.get()), decay=float(self.decay.get()), alpha=float(self.alpha.get()), beta=float(self.beta.get()), q=float(self.q.get()))
+            self.aco = AntColony(distances=dist, n_ants=int(self.n_ants.get()), n_best=int(self.n_best.get()), n_iterations=int(self.n_iterations.get()), decay=float(self.decay.get()), alpha=float(self.alpha.get()), beta=float(self.beta.get()), q=float(self.q.get()), rng=self.seed_var.get())
             self.aco.reset()
             self.status.set('Inicializado')
             self.update_plots()
@@ -150,6 +166,10 @@ class ACOGui(tk.Tk):
     def _run_thread_target(self):
         # run in separate thread
         self._pause_flag = False
+        if len(self.aco.distances) <= self.aco.exact_threshold:
+            # instancia pequeña: misma solución exacta que AntColony.run()
+            self._run_exact()
+            return
         while self.aco.iteration < self.aco.n_iterations and not getattr(self, '_stop_run', False):
             # handle pause
             while getattr(self, '_paused', False):
@@ -171,6 +191,24 @@ class ACOGui(tk.Tk):
         self.after(0, lambda: self.status.set(f'Finished. Iter {self.aco.iteration} Best {self.aco.best_distance:.4f}'))
         self._stop_run = False
 
+    def _run_exact(self):
+        from src.aco import STOP_EXACT
+
+        self.aco.reset()
+        self.aco._run_exact()
+        self.aco.stop_reason = STOP_EXACT
+        best = self.aco.best_distance
+
+        def show():
+            self.progress['maximum'] = 1
+            self.progress['value'] = 1
+            self.log_listbox.insert(tk.END, f'Exacta (N={len(self.aco.distances)}): {best:.4f}')
+            self.update_plots()
+            self.status.set(f'Finished. Solución exacta Best {best:.4f}')
+
+        self.after(0, show)
+        self._stop_run = False
+
     def run_ui(self):
         if not self.aco:
             messagebox.showwarning('Atención', 'Inicializa la instancia primero')
@@ -230,6 +268,7 @@ class ACOGui(tk.Tk):
             self.log_listbox.delete(0)
 
     def update_plots(self):
+        self.ensure_plots()
         # pheromone heatmap: update image data instead of recreating colorbar
         if self.aco:
             pher = self.aco.get_pheromone_matrix()
@@ -0,0 +1,56 @@
+import sys
+import os
+import argparse
+import time
+
+import numpy as np
+
+# permitir imports relativos al proyecto
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.aco import AntColony
+from src.batch import solve_batch
+from src.exact import MAX_EXACT_CITIES, solve_exact
+from src.tsp import random_coords, coords_to_distance_matrix
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rendimiento (instancias/s) del solver por lotes frente a AntColony')
+    parser.add_argument('--instances', type=int, default=500)
+    parser.add_argument('--min-n', type=int, default=10)
+    parser.add_argument('--max-n', type=int, default=30)
+    parser.add_argument('--iterations', type=int, default=100)
+    parser.add_argument('--sequential-sample', type=int, default=10, help='Instancias resueltas una a una para comparar')
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(0)
+    sizes = rng.randint(args.min_n, args.max_n + 1, size=args.instances)
+    instances = [coords_to_distance_matrix(random_coords(int(n), seed=i)) for i, n in enumerate(sizes)]
+    params = dict(n_ants=10, n_best=3, n_iterations=args.iterations, decay=0.3, alpha=1, beta=3)
+
+    t0 = time.perf_counter()
+    results = solve_batch(instances, **params)
+    t_batch = time.perf_counter() - t0
+
+    sample = instances[:args.sequential_sample]
+    t0 = time.perf_counter()
+    for d in sample:
+        AntColony(d, **params).run()
+    t_seq = (time.perf_counter() - t0) / len(sample) * len(instances)
+
+    # referencia exacta para las instancias que la admiten
+    gaps = []
+    for (_, found), d in zip(results, instances):
+        if len(d) <= MAX_EXACT_CITIES - 2:
+            optimum = solve_exact(d)[1]
+            gaps.append((found - optimum) / optimum)
+
+    print(f'Instancias: {args.instances} (N entre {args.min_n} y {args.max_n}), {args.iterations} iteraciones')
+    print(f'Lote:       {t_batch:8.2f} s  -> {args.instances / t_batch:8.1f} instancias/s')
+    print(f'Secuencial: {t_seq:8.2f} s  -> {args.instances / t_seq:8.1f} instancias/s (estimado con {len(sample)})')
+    if gaps:
+        print(f'Gap medio frente al óptimo (N <= {MAX_EXACT_CITIES - 2}, {len(gaps)} instancias): {np.mean(gaps):.2%}')
+
+
+if __name__ == '__main__':
+    main()
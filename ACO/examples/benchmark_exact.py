@@ -0,0 +1,39 @@
+import sys
+import os
+import argparse
+import time
+
+# permitir imports relativos al proyecto
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.aco import AntColony
+from src.exact import solve_exact
+from src.tsp import random_coords, coords_to_distance_matrix
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compara ACO con la solución exacta (Held-Karp DP) como referencia')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[8, 10, 12, 14, 16])
+    parser.add_argument('--seeds', type=int, default=3, help='Instancias por tamaño')
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'N':>4} {'seed':>5} {'óptimo':>10} {'t_exacto(s)':>12} {'ACO':>10} {'t_ACO(s)':>10} {'gap':>8}")
+    for n in args.sizes:
+        for seed in range(args.seeds):
+            dist = coords_to_distance_matrix(random_coords(n, seed=seed, scale=100))
+            t0 = time.perf_counter()
+            _, optimum = solve_exact(dist)
+            t_exact = time.perf_counter() - t0
+
+            # exact_threshold=0 fuerza la búsqueda estocástica para poder compararla
+            aco = AntColony(dist, n_ants=20, n_best=5, n_iterations=args.iterations, decay=0.3, alpha=1, beta=3, exact_threshold=0)
+            t0 = time.perf_counter()
+            _, found = aco.run()
+            t_aco = time.perf_counter() - t0
+            gap = (found - optimum) / optimum
+            print(f"{n:>4} {seed:>5} {optimum:>10.2f} {t_exact:>12.4f} {found:>10.2f} {t_aco:>10.4f} {gap:>8.2%}")
+
+
+if __name__ == '__main__':
+    main()
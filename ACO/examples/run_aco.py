@@ -64,7 +64,7 @@ def main():
     # imprimir fórmulas para que el usuario las vea
     print_formulas()
 
-    aco = AntColony(dist_matrix, n_ants=20, n_best=5, n_iterations=200, decay=0.3, alpha=1, beta=3)
+    aco = AntColony(dist_matrix, n_ants=20, n_best=5, n_iterations=200, decay=0.3, alpha=1, beta=3, rng=args.seed)
     best_route, best_dist = aco.run(verbose=True)
 
     print('\nMejor distancia encontrada:', best_dist)
@@ -0,0 +1,11 @@
+import os
+import sys
+
+# permitir imports relativos (y que los procesos del pool encuentren `src`)
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from src.service import main
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,8 @@
 from .aco import AntColony
+from .batch import BatchAntColony, solve_batch
+from .bounds import held_karp_bound
+from .decompose import decompose_solve
+from .exact import solve_exact
+from .paco import PopulationAntColony
 
-__all__ = ["AntColony"]
+__all__ = ["AntColony", "PopulationAntColony", "BatchAntColony", "solve_batch", "held_karp_bound", "decompose_solve", "solve_exact"]
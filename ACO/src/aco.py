@@ -1,5 +1,16 @@
 import numpy as np
 
+from .bounds import held_karp_bound, optimality_gap
+from .exact import EXACT_THRESHOLD, solve_exact
+from .seeding import build_seed_tour
+
+# motivo por el que terminó `run()` (queda en `AntColony.stop_reason`)
+STOP_MAX_ITERATIONS = 'max_iterations'
+STOP_TARGET_GAP = 'target_gap'
+STOP_CALLBACK = 'callback'
+STOP_EXACT = 'exact'
+
+
 class AntColony:
     """Algoritmo de colonia de hormigas (ACO) para el TSP.
 
@@ -21,15 +32,27 @@ class AntColony:
     - decay: tasa de evaporación (rho).
     - alpha, beta: parámetros que ponderan feromona y heurística.
     - q: constante Q para el depósito de feromona (por defecto 1.0).
+    - target_gap: gap de optimalidad relativo (p.ej. 0.02 = 2%) respecto a la
+      cota inferior de Held-Karp; `run()` se detiene al alcanzarlo. None = sin parada.
+    - exact_threshold: si N <= exact_threshold, `run()` resuelve la instancia de forma
+      exacta (Held-Karp DP, ver `src/exact.py`) en lugar de iterar. 0 desactiva el atajo.
+    - seeding: heurística constructiva para sembrar el estado inicial ('nn', 'greedy',
+      'sfc' o None). El tour semilla pasa a ser la mejor ruta inicial y fija
+      $\tau_0 = n_{best} Q / (\rho L_{seed})$ (equilibrio de evaporación/depósito, como en MMAS).
+    - coords: coordenadas de las ciudades (solo necesarias para `seeding='sfc'`).
+    - seed_deposit: si es True, deposita además Q / L_seed sobre los arcos del tour semilla.
+    - rng: generador aleatorio propio (`np.random.Generator`) o semilla (int o
+      `SeedSequence`); None = semilla aleatoria. La colonia no usa el estado global
+      de `np.random`, así que varias colonias en hilos o procesos no comparten estado
+      y cada una es reproducible con su semilla.
     """
 
-    def __init__(self, distances, n_ants=10, n_best=3, n_iterations=100, decay=0.5, alpha=1, beta=2, q=1.0):
+    def __init__(self, distances, n_ants=10, n_best=3, n_iterations=100, decay=0.5, alpha=1, beta=2, q=1.0,
+                 target_gap=None, exact_threshold=EXACT_THRESHOLD, seeding=None, coords=None, seed_deposit=False,
+                 rng=None):
         self.distances = np.array(distances)
         n = len(self.distances)
-        # inicializar feromonas uniformes
-        self.pheromone = np.ones((n, n)) / n
-        # guardar copia inicial para reset
-        self._initial_pheromone = self.pheromone.copy()
+        self.rng = np.random.default_rng(rng)
         self.n_ants = n_ants
         self.n_best = n_best
         self.n_iterations = n_iterations
@@ -37,11 +60,56 @@ class AntColony:
         self.alpha = alpha
         self.beta = beta
         self.q = q
+        self.target_gap = target_gap
+        self.exact_threshold = exact_threshold
+        self.seeding = seeding
+        # mejor solución inicial (la semilla, si la hay) que se restaura en reset
+        self._initial_best = (None, float('inf'))
+        # inicializar feromonas uniformes (o a partir del tour semilla)
+        tau0 = 1.0 / n
+        if seeding is not None:
+            tau0 = self._seed(seeding, coords)
+        self._init_pheromone(tau0, [self._initial_best] if seeding is not None and seed_deposit else [])
+        # cota inferior de Held-Karp (se calcula bajo demanda y no cambia con reset)
+        self.lower_bound = None
         # estado del algoritmo (iteraciones, mejor solución)
         self.iteration = 0
-        self.best_route = None
-        self.best_distance = float('inf')
+        self.best_route, self.best_distance = self._initial_best
         self.last_solutions = []
+        self.stop_reason = None
+
+    def _seed(self, method, coords=None):
+        """Construye el tour semilla (mejor ruta inicial) y devuelve el tau0 correspondiente."""
+        route, dist = build_seed_tour(method, distances=self.distances, coords=coords)
+        self._initial_best = (route, dist)
+        if self.decay > 0 and dist > 0:
+            return self.n_best * self.q / (self.decay * dist)
+        return 1.0 / len(self.distances)
+
+    def _init_pheromone(self, tau0, deposits):
+        """Matriz densa inicial con valor tau0 más el depósito de `deposits` (lista de (ruta, distancia))."""
+        n = len(self.distances)
+        self.pheromone = np.full((n, n), tau0)
+        self._spread_pheromone(deposits)
+        # guardar copia inicial para reset
+        self._initial_pheromone = self.pheromone.copy()
+
+    def _pheromone_row(self, current):
+        """Feromona de los arcos current -> j para todo j."""
+        return self.pheromone[current]
+
+    def warm_start(self, pheromone, best_route=None, best_distance=float('inf')):
+        """Fija el estado inicial a partir de una ejecución previa (feromona y mejor ruta).
+
+        El estado se conserva en `reset()`, de modo que `run()` continúa desde él.
+        """
+        pheromone = np.array(pheromone, dtype=float)
+        if pheromone.shape != self.distances.shape:
+            raise ValueError(f'La feromona {pheromone.shape} no coincide con la instancia {self.distances.shape}')
+        self._initial_pheromone = pheromone
+        if best_route is not None:
+            self._initial_best = ([int(x) for x in best_route], float(best_distance))
+        self.reset()
 
     def _route_distance(self, route):
         distance = 0.0
@@ -54,43 +122,47 @@ class AntColony:
     def transition_probabilities(self, current, visited):
         """Devuelve el vector de probabilidades P_{current->j} sobre las ciudades no visitadas.
 
-        Implementa directamente la fórmula de transición mencionada en la docstring.
+        Implementa directamente la fórmula de transición mencionada en la docstring,
+        vectorizada sobre todas las ciudades j. `visited` puede ser un conjunto de
+        índices o una máscara booleana de tamaño N.
         """
         n = len(self.distances)
-        probs = np.zeros(n)
-        for j in range(n):
-            if j in visited:
-                probs[j] = 0.0
-            else:
-                tau = self.pheromone[current, j] ** self.alpha
-                eta = (1.0 / self.distances[current, j]) ** self.beta if self.distances[current, j] > 0 else 0.0
-                probs[j] = tau * eta
+        d = self.distances[current]
+        eta = np.divide(1.0, d, out=np.zeros(n), where=d > 0) ** self.beta
+        probs = self._pheromone_row(current) ** self.alpha * eta
+        if isinstance(visited, np.ndarray):
+            probs[visited] = 0.0
+        elif visited:
+            probs[list(visited)] = 0.0
         total = probs.sum()
         if total > 0:
             probs = probs / total
         return probs
 
     def _generate_route(self, start):
+        n = len(self.distances)
         route = [int(start)]
-        visited = set(route)
-        while len(route) < len(self.distances):
-            current = route[-1]
-            probs = self.transition_probabilities(current, visited)
-            choices = [i for i in range(len(probs)) if i not in visited]
-            if len(choices) == 0:
-                break
-            if probs.sum() == 0:
-                next_city = int(np.random.choice(choices))
+        visited = np.zeros(n, dtype=bool)
+        visited[start] = True
+        # un número aleatorio por paso, generados de una vez para toda la ruta
+        draws = self.rng.random(n - 1)
+        for t in range(n - 1):
+            probs = self.transition_probabilities(route[-1], visited)
+            cumulative = np.cumsum(probs)
+            if cumulative[-1] <= 0:
+                unvisited = np.flatnonzero(~visited)
+                next_city = int(unvisited[int(draws[t] * len(unvisited))])
             else:
-                next_city = int(np.random.choice(range(len(probs)), p=probs))
+                # muestreo por ruleta: equivalente a rng.choice(n, p=probs)
+                next_city = int(np.searchsorted(cumulative, draws[t] * cumulative[-1], side='right'))
+                next_city = min(next_city, n - 1)
             route.append(next_city)
-            visited.add(next_city)
+            visited[next_city] = True
         return route
 
     def _generate_solutions(self):
         solutions = []
-        for _ in range(self.n_ants):
-            start = np.random.randint(len(self.distances))
+        for start in self.rng.integers(len(self.distances), size=self.n_ants):
             route = self._generate_route(start)
             dist = self._route_distance(route)
             solutions.append((route, dist))
@@ -106,18 +178,68 @@ class AntColony:
                 b = int(route[(i + 1) % len(route)])
                 self.pheromone[a, b] += deposit
 
+    def get_lower_bound(self):
+        """Devuelve (y cachea) la cota inferior de Held-Karp de la instancia."""
+        if self.lower_bound is None:
+            ub = self.best_distance if self.best_distance != float('inf') else None
+            self.lower_bound = held_karp_bound(self.distances, upper_bound=ub)
+        return self.lower_bound
+
+    def get_gap(self):
+        """Gap relativo entre la mejor ruta actual y la cota inferior (None si no hay ruta)."""
+        if self.best_route is None:
+            return None
+        return optimality_gap(self.best_distance, self.get_lower_bound())
+
     def get_pheromone_matrix(self):
         return self.pheromone.copy()
 
-    def run(self, verbose=False):
+    def run(self, verbose=False, callback=None):
+        """Ejecuta el algoritmo completo.
+
+        `callback(colony)` se invoca tras cada iteración (y una vez tras la solución
+        exacta); si devuelve True la ejecución se detiene. El motivo de la parada
+        queda en `stop_reason` (`STOP_CALLBACK` si la detuvo el callback).
+        """
         # ejecutar varias iteraciones usando step() para mantener consistencia
         self.reset()
-        best_route = None
-        best_distance = float('inf')
+        if len(self.distances) <= self.exact_threshold:
+            result = self._run_exact(verbose)
+            self.stop_reason = STOP_EXACT
+            if callback is not None:
+                callback(self)
+            return result
+        self.stop_reason = STOP_MAX_ITERATIONS
         for iteration in range(self.n_iterations):
             it, bd = self.step()
             if verbose and (iteration % max(1, self.n_iterations // 10) == 0):
                 print(f"Iter {iteration+1}/{self.n_iterations}: best distance {bd:.4f}")
+            if callback is not None and callback(self):
+                self.stop_reason = STOP_CALLBACK
+                break
+            if self.target_gap is not None:
+                gap = self.get_gap()
+                if gap is not None and gap <= self.target_gap:
+                    if verbose:
+                        print(f"Gap {gap:.2%} <= {self.target_gap:.2%}: parada en iter {it}")
+                    self.stop_reason = STOP_TARGET_GAP
+                    break
+        return self.best_route, self.best_distance
+
+    def _run_exact(self, verbose=False):
+        """Atajo para instancias pequeñas: solución óptima por programación dinámica.
+
+        La ruta óptima deposita feromona una vez para que la matriz siga siendo
+        representativa en las visualizaciones.
+        """
+        route, dist = solve_exact(self.distances)
+        self.best_route, self.best_distance = route, dist
+        self.last_solutions = [(route, dist)]
+        # la solución es óptima: sirve como cota inferior exacta (gap 0)
+        self.lower_bound = dist
+        self._spread_pheromone(self.last_solutions)
+        if verbose:
+            print(f"Solución exacta (N={len(self.distances)}): distancia {dist:.4f}")
         return self.best_route, self.best_distance
 
     def step(self):
@@ -126,10 +248,7 @@ class AntColony:
         Devuelve (iteration, best_distance) tras la iteración.
         """
         solutions = self._generate_solutions()
-        # evaporación
-        self.pheromone = (1 - self.decay) * self.pheromone
-        # depósito
-        self._spread_pheromone(solutions)
+        self._update_pheromone(solutions)
         # actualizar mejor global
         iteration_best = min(solutions, key=lambda x: x[1])
         if iteration_best[1] < self.best_distance:
@@ -138,20 +257,38 @@ class AntColony:
         self.last_solutions = solutions
         return self.iteration, self.best_distance
 
+    def _update_pheromone(self, solutions):
+        # evaporación
+        self.pheromone = (1 - self.decay) * self.pheromone
+        # depósito
+        self._spread_pheromone(solutions)
+
     def reset(self):
         """Reinicia feromonas y estado del algoritmo al valor inicial."""
         self.pheromone = self._initial_pheromone.copy()
         self.iteration = 0
-        self.best_route = None
-        self.best_distance = float('inf')
+        self.best_route, self.best_distance = self._initial_best
         self.last_solutions = []
+        self.stop_reason = None
 
     def get_state(self):
-        """Devuelve un dict con el estado actual útil para la interfaz."""
+        """Devuelve un dict con el estado actual útil para la interfaz.
+
+        La cota inferior (y el gap) solo se incluyen si ya se calcularon o si hay
+        `target_gap`. La cota de Held-Karp es costosa y la interfaz llama a este
+        método en su hilo principal tras cada paso.
+        """
+        if self.target_gap is not None:
+            self.get_lower_bound()
+        gap = None
+        if self.best_route is not None and self.lower_bound is not None:
+            gap = optimality_gap(self.best_distance, self.lower_bound)
         return {
             'iteration': self.iteration,
             'best_route': [int(x) for x in self.best_route] if self.best_route is not None else None,
             'best_distance': float(self.best_distance) if self.best_distance != float('inf') else None,
-            'pheromone': self.pheromone.copy(),
+            'pheromone': self.get_pheromone_matrix(),
             'last_solutions': self.last_solutions,
+            'lower_bound': self.lower_bound,
+            'gap': gap,
         }
@@ -0,0 +1,143 @@
+import numpy as np
+
+from .exact import solve_exact
+
+# Hasta este tamaño el DP exacto resuelve más instancias/s que el lote ACO (y es óptimo)
+BATCH_EXACT_THRESHOLD = 12
+
+
+class BatchAntColony:
+    """Colonias de hormigas para B instancias TSP resueltas a la vez.
+
+    Las B instancias se apilan en arrays (B, N, N) (rellenando con ciudades ficticias
+    ya visitadas si los tamaños difieren) y la construcción de rutas, su evaluación
+    y la actualización de feromona se vectorizan sobre el eje del lote y de las
+    hormigas: una iteración cuesta O(N) operaciones NumPy independientemente de B.
+
+    Usa las mismas fórmulas y parámetros que `AntColony` (ver `src/aco.py`).
+
+    Parámetros:
+    - distances_list: lista de B matrices de distancias (tamaños posiblemente distintos).
+    - n_ants, n_best, n_iterations, decay, alpha, beta, q, rng: como en `AntColony`.
+    """
+
+    def __init__(self, distances_list, n_ants=10, n_best=3, n_iterations=100, decay=0.5, alpha=1, beta=2, q=1.0,
+                 rng=None):
+        self.rng = np.random.default_rng(rng)
+        self.sizes = np.array([len(d) for d in distances_list], dtype=int)
+        B, N = len(distances_list), int(self.sizes.max())
+        self.distances = np.zeros((B, N, N))
+        for b, d in enumerate(distances_list):
+            n = self.sizes[b]
+            self.distances[b, :n, :n] = d
+        self.n_ants = n_ants
+        self.n_best = min(n_best, n_ants)
+        self.n_iterations = n_iterations
+        self.decay = decay
+        self.alpha = alpha
+        self.beta = beta
+        self.q = q
+        # heurística fija: eta^beta (0 en la diagonal y en el relleno)
+        d = self.distances
+        self._eta = np.divide(1.0, d, out=np.zeros_like(d), where=d > 0) ** beta
+        # ciudades de relleno: se marcan como visitadas desde el principio
+        self._padding = np.arange(N)[None, :] >= self.sizes[:, None]
+        self.reset()
+
+    def reset(self):
+        """Reinicia feromonas (1/n por instancia) y mejores soluciones."""
+        B, N = len(self.sizes), self.distances.shape[1]
+        self.pheromone = np.broadcast_to((1.0 / self.sizes)[:, None, None], (B, N, N)).copy()
+        self.iteration = 0
+        self.best_tours = np.zeros((B, N), dtype=int)
+        self.best_distances = np.full(B, np.inf)
+
+    def _construct(self):
+        """Construye n_ants rutas por instancia. Devuelve tours (B, A, N)."""
+        B, N = len(self.sizes), self.distances.shape[1]
+        A = self.n_ants
+        b_idx = np.arange(B)[:, None]
+        visited = np.repeat(self._padding[:, None, :], A, axis=1)
+        tours = np.zeros((B, A, N), dtype=int)
+        current = (self.rng.random((B, A)) * self.sizes[:, None]).astype(int)
+        tours[:, :, 0] = current
+        np.put_along_axis(visited, current[..., None], True, axis=2)
+        tau_alpha = self.pheromone ** self.alpha
+        for t in range(1, N):
+            weights = tau_alpha[b_idx, current] * self._eta[b_idx, current]
+            weights[visited] = 0.0
+            total = weights.sum(axis=2)
+            # distancias nulas: elegir uniformemente entre las no visitadas
+            stuck = total <= 0
+            if stuck.any():
+                weights[stuck] = ~visited[stuck]
+                total = weights.sum(axis=2)
+            cumulative = np.cumsum(weights, axis=2)
+            r = self.rng.random((B, A)) * total
+            nxt = (cumulative > r[..., None]).argmax(axis=2)
+            # instancias ya completas (más pequeñas que N): quedarse en la última ciudad
+            nxt = np.where(total > 0, nxt, current)
+            np.put_along_axis(visited, nxt[..., None], True, axis=2)
+            tours[:, :, t] = nxt
+            current = nxt
+        return tours
+
+    def _lengths(self, tours):
+        b_idx = np.arange(len(self.sizes))[:, None, None]
+        # los pasos de relleno son lazos (i, i) con distancia 0
+        return self.distances[b_idx, tours, np.roll(tours, -1, axis=2)].sum(axis=2)
+
+    def step(self):
+        """Una iteración para todo el lote. Devuelve (iteration, best_distances)."""
+        tours = self._construct()
+        lengths = self._lengths(tours)
+        # evaporación
+        self.pheromone *= (1 - self.decay)
+        # depósito de las n_best mejores hormigas de cada instancia
+        order = np.argsort(lengths, axis=1)[:, :self.n_best]
+        best_tours = np.take_along_axis(tours, order[..., None], axis=1)
+        deposit = self.q / (np.take_along_axis(lengths, order, axis=1) + 1e-10)
+        B, K, N = best_tours.shape
+        b_idx = np.broadcast_to(np.arange(B)[:, None, None], (B, K, N))
+        np.add.at(self.pheromone, (b_idx, best_tours, np.roll(best_tours, -1, axis=2)),
+                  np.broadcast_to(deposit[..., None], (B, K, N)))
+        # actualizar mejor global por instancia
+        it_best = order[:, 0]
+        it_len = lengths[np.arange(B), it_best]
+        improved = it_len < self.best_distances
+        self.best_distances = np.where(improved, it_len, self.best_distances)
+        self.best_tours[improved] = tours[np.flatnonzero(improved), it_best[improved]]
+        self.iteration += 1
+        return self.iteration, self.best_distances
+
+    def run(self):
+        """Ejecuta n_iterations y devuelve una lista de (route, distance) por instancia."""
+        self.reset()
+        for _ in range(self.n_iterations):
+            self.step()
+        return self.results()
+
+    def results(self):
+        return [([int(x) for x in self.best_tours[b, :n]], float(self.best_distances[b]))
+                for b, n in enumerate(self.sizes)]
+
+
+def solve_batch(distances_list, exact_threshold=BATCH_EXACT_THRESHOLD, **params):
+    """Resuelve muchas instancias pequeñas.
+
+    Las instancias con N <= exact_threshold se resuelven de forma exacta
+    (`solve_exact`); el resto se agrupa en una única `BatchAntColony`.
+    Devuelve una lista de (route, distance) en el mismo orden de entrada.
+    """
+    results = [None] * len(distances_list)
+    pending = []
+    for i, d in enumerate(distances_list):
+        if len(d) <= exact_threshold:
+            results[i] = solve_exact(d)
+        else:
+            pending.append(i)
+    if pending:
+        colony = BatchAntColony([distances_list[i] for i in pending], **params)
+        for i, result in zip(pending, colony.run()):
+            results[i] = result
+    return results
@@ -0,0 +1,106 @@
+import numpy as np
+
+from .seeding import nearest_neighbour_tour
+from .tsp import route_distance
+
+
+def _symmetric_costs(distances):
+    """Devuelve una matriz simétrica válida para la cota (min(d_ij, d_ji)).
+
+    Para instancias asimétricas cualquier tour usa cada arista en un solo
+    sentido, así que tomar el mínimo de ambos sentidos mantiene la cota válida.
+    """
+    d = np.array(distances, dtype=float)
+    return np.minimum(d, d.T)
+
+
+def one_tree(costs, pi):
+    """Calcula el 1-árbol mínimo con costes modificados c_ij + pi_i + pi_j.
+
+    El nodo especial es el 0: se construye el árbol de expansión mínima (Prim)
+    sobre los nodos 1..n-1 y se añaden las dos aristas más baratas del nodo 0.
+
+    Devuelve (coste_modificado, grados) donde `grados` es el grado de cada nodo
+    en el 1-árbol.
+    """
+    n = len(costs)
+    c = costs + pi[:, None] + pi[None, :]
+    degrees = np.zeros(n, dtype=int)
+    total = 0.0
+    # Prim sobre los nodos 1..n-1
+    in_tree = np.zeros(n, dtype=bool)
+    in_tree[0] = True  # el nodo especial queda fuera del MST
+    in_tree[1] = True
+    best = c[1].copy()
+    parent = np.ones(n, dtype=int)
+    for _ in range(n - 2):
+        candidates = np.where(in_tree, np.inf, best)
+        j = int(np.argmin(candidates))
+        total += candidates[j]
+        degrees[j] += 1
+        degrees[parent[j]] += 1
+        in_tree[j] = True
+        closer = c[j] < best
+        best = np.where(closer, c[j], best)
+        parent = np.where(closer, j, parent)
+    # dos aristas más baratas desde el nodo especial
+    two = np.argpartition(c[0, 1:], 1)[:2] + 1
+    total += c[0, two].sum()
+    degrees[0] = 2
+    degrees[two] += 1
+    return total, degrees
+
+
+def held_karp_bound(distances, upper_bound=None, max_iterations=100, step=2.0, patience=10):
+    """Cota inferior de Held-Karp (1-árbol) mediante optimización por subgradiente.
+
+    Se maximiza $L(\\pi) = C_{1tree}(\\pi) - 2\\sum_i \\pi_i$ actualizando
+    $\\pi \\leftarrow \\pi + t (d - 2)$ con paso
+    $t = \\lambda (UB - L) / \\lVert d - 2 \\rVert^2$.
+
+    Parámetros:
+    - distances: matriz NxN de distancias.
+    - upper_bound: longitud de un tour conocido (si es None se usa vecino más cercano).
+    - max_iterations: iteraciones de subgradiente.
+    - step: valor inicial de lambda (se divide por 2 tras `patience` iteraciones sin mejora).
+
+    Devuelve la mejor cota inferior encontrada (float).
+    """
+    costs = _symmetric_costs(distances)
+    n = len(costs)
+    if n < 3:
+        return float(2 * costs[0, 1]) if n == 2 else 0.0
+    if upper_bound is None or not np.isfinite(upper_bound):
+        upper_bound = route_distance(nearest_neighbour_tour(costs), costs)
+    pi = np.zeros(n)
+    best = -np.inf
+    lam = step
+    stale = 0
+    for _ in range(max_iterations):
+        tree_cost, degrees = one_tree(costs, pi)
+        bound = tree_cost - 2.0 * pi.sum()
+        if bound > best + 1e-12:
+            best = bound
+            stale = 0
+        else:
+            stale += 1
+            if stale >= patience:
+                lam /= 2.0
+                stale = 0
+        g = degrees - 2
+        norm = float(g @ g)
+        if norm == 0:
+            # el 1-árbol es un tour: la cota es óptima
+            break
+        t = lam * (upper_bound - bound) / norm
+        if t <= 1e-12:
+            break
+        pi = pi + t * g
+    return float(best)
+
+
+def optimality_gap(tour_length, lower_bound):
+    """Gap relativo (L - LB) / LB; None si alguno de los valores no es válido."""
+    if lower_bound is None or tour_length is None or not np.isfinite(tour_length) or lower_bound <= 0:
+        return None
+    return max(0.0, (tour_length - lower_bound) / lower_bound)
@@ -0,0 +1,198 @@
+"""Resolución de instancias TSP muy grandes por descomposición espacial.
+
+Etapas:
+1. Particionar las coordenadas en clusters compactos (bisección recursiva por la mediana).
+2. Resolver el sub-tour de cada cluster con una `AntColony` independiente, en paralelo.
+3. Resolver el TSP de orden de clusters sobre sus centroides (recursivo si hay muchos).
+4. Coser los sub-tours eligiendo punto de entrada/salida y sentido de cada cluster.
+5. Reparar las uniones con 2-opt local en una ventana alrededor de cada costura.
+6. Mejorar la ruta completa con 2-opt y Or-opt sobre listas de vecinos
+   (`local_search.py`), que corrige también los defectos de los sub-tours y del
+   orden de clusters que las ventanas no alcanzan.
+
+Nunca se construye una matriz NxN global: solo matrices de tamaño cluster x cluster.
+Las distancias son Euclídeas sobre las coordenadas (x, y).
+
+Cada colonia recibe su propio flujo aleatorio, derivado con `SeedSequence.spawn`
+de la semilla de `decompose_solve`: los procesos del pool no comparten estado
+aleatorio y, con la misma semilla, el resultado es reproducible.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .aco import AntColony
+from .local_search import improve_tour
+from .tsp import coords_to_distance_matrix
+
+# parámetros por defecto de las colonias de cada cluster
+DEFAULT_COLONY_PARAMS = {'n_ants': 10, 'n_best': 3, 'n_iterations': 30, 'decay': 0.3,
+                         'alpha': 1, 'beta': 3, 'seeding': 'nn'}
+
+
+def partition_coords(coords, cluster_size):
+    """Bisección recursiva por la mediana del eje más largo.
+
+    Devuelve una lista de arrays de índices, cada uno con <= cluster_size ciudades.
+    """
+    coords = np.asarray(coords, dtype=float)
+    pending = [np.arange(len(coords))]
+    clusters = []
+    while pending:
+        idx = pending.pop()
+        if len(idx) <= cluster_size:
+            clusters.append(idx)
+            continue
+        pts = coords[idx]
+        axis = int(np.argmax(pts.max(axis=0) - pts.min(axis=0)))
+        half = len(idx) // 2
+        order = np.argpartition(pts[:, axis], half)
+        pending.append(idx[order[half:]])
+        pending.append(idx[order[:half]])
+    return clusters
+
+
+def _solve_cluster(args):
+    """Resuelve el sub-tour cerrado de un cluster (se ejecuta en un proceso del pool)."""
+    idx, pts, params, seed = args
+    if len(idx) <= 3:
+        return idx
+    aco = AntColony(coords_to_distance_matrix(pts), coords=pts, rng=seed, **params)
+    route, _ = aco.run()
+    return idx[np.asarray(route, dtype=int)]
+
+
+def _solve_order(centroids, cluster_size, colony_params, workers, seed):
+    """Orden de visita de los clusters: TSP sobre los centroides."""
+    if len(centroids) <= 3:
+        return np.arange(len(centroids))
+    if len(centroids) <= 4 * cluster_size:
+        return _solve_cluster((np.arange(len(centroids)), centroids, colony_params, seed))
+    # demasiados clusters para una sola colonia: aplicar la misma descomposición
+    return decompose_solve(centroids, cluster_size=cluster_size, colony_params=colony_params, workers=workers,
+                           seed=seed)[0]
+
+
+def _stitch(coords, tours, centroids):
+    """Concatena los sub-tours en el orden dado.
+
+    Cada cluster es un ciclo; se corta por el arco (exit, entry) que minimiza
+    d(prev, entry) - d(exit, entry) + d(exit, siguiente_centroide), probando ambos sentidos.
+    Devuelve (route, joins) donde `joins` son las posiciones de cada costura.
+    """
+    pieces = []
+    joins = []
+    prev = centroids[-1]
+    position = 0
+    for k, tour in enumerate(tours):
+        pts = coords[tour]
+        nxt = centroids[(k + 1) % len(tours)]
+        d_prev = np.hypot(*(pts - prev).T)
+        d_next = np.hypot(*(pts - nxt).T)
+        # sentido hacia delante: entrar en i, salir por i-1; hacia atrás: entrar en i, salir por i+1
+        d_cycle = np.hypot(*(pts - np.roll(pts, -1, axis=0)).T)  # arco i -> i+1
+        forward = d_prev - np.roll(d_cycle, 1) + np.roll(d_next, 1)
+        backward = d_prev - d_cycle + np.roll(d_next, -1)
+        i_f, i_b = int(np.argmin(forward)), int(np.argmin(backward))
+        if forward[i_f] <= backward[i_b]:
+            piece = np.roll(tour, -i_f)
+        else:
+            piece = np.roll(tour[::-1], i_b + 1 - len(tour))
+        pieces.append(piece)
+        joins.append(position)
+        position += len(piece)
+        prev = coords[piece[-1]]
+    return np.concatenate(pieces), joins
+
+
+def two_opt_window(route, coords, center, window, max_passes=20):
+    """2-opt restringido a las posiciones [center - window, center + window] de la ruta.
+
+    La ventana es cíclica: cerca del principio o del final de la ruta incluye el
+    arco de cierre `route[-1] -> route[0]` (la costura entre el último y el primer
+    cluster). Evalúa de forma vectorizada todos los pares de arcos de la ventana y
+    aplica el mejor movimiento hasta que no haya mejora. Modifica `route` in situ.
+    """
+    n = len(route)
+    if n < 5:
+        return route
+    # rotar para que la ventana no cruce el extremo del array (el ciclo es el mismo)
+    shift = n // 2 - center
+    rotated = np.roll(route, shift)
+    _two_opt_range(rotated, coords, max(0, n // 2 - window), min(n - 1, n // 2 + window), max_passes)
+    route[:] = np.roll(rotated, -shift)
+    return route
+
+
+def _two_opt_range(route, coords, lo, hi, max_passes):
+    n = len(route)
+    for _ in range(max_passes):
+        i = np.arange(lo, hi)
+        a, b = coords[route[i]], coords[route[(i + 1) % n]]
+        # arcos (a_i, b_i) y (a_j, b_j) con i < j -> reconectar (a_i, a_j) y (b_i, b_j)
+        ii, jj = np.triu_indices(len(i), k=2)
+        if len(ii) == 0:
+            return route
+        before = np.hypot(*(a[ii] - b[ii]).T) + np.hypot(*(a[jj] - b[jj]).T)
+        after = np.hypot(*(a[ii] - a[jj]).T) + np.hypot(*(b[ii] - b[jj]).T)
+        delta = after - before
+        best = int(np.argmin(delta))
+        if delta[best] >= -1e-12:
+            return route
+        s, e = i[ii[best]] + 1, i[jj[best]]
+        route[s:e + 1] = route[s:e + 1][::-1]
+    return route
+
+
+def decompose_solve(coords, cluster_size=40, colony_params=None, workers=None, window=8, seed=None,
+                    local_search=True):
+    """Resuelve un TSP Euclídeo grande por descomposición en clusters.
+
+    Parámetros:
+    - coords: array (N, 2) de coordenadas.
+    - cluster_size: tamaño máximo de cada cluster (si es <= `exact_threshold`, cada
+      colonia resuelve su cluster de forma exacta).
+    - colony_params: argumentos de `AntColony` para las colonias de cada cluster.
+    - workers: procesos para resolver clusters en paralelo (None = todos los núcleos).
+    - window: semiancho de la ventana de 2-opt alrededor de cada costura.
+    - seed: semilla (int o `SeedSequence`) de la que se derivan los flujos aleatorios
+      de todas las colonias; None = semilla aleatoria.
+    - local_search: si es True, 2-opt + Or-opt global sobre la ruta cosida.
+
+    Devuelve (route, distance).
+    """
+    coords = np.asarray(coords, dtype=float)
+    n = len(coords)
+    params = dict(DEFAULT_COLONY_PARAMS)
+    params.update(colony_params or {})
+    seed = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    if n <= cluster_size:
+        route = _solve_cluster((np.arange(n), coords, params, seed))
+        return route, _route_length(coords, route)
+
+    clusters = partition_coords(coords, cluster_size)
+    # un flujo independiente por cluster y otro para el orden de los clusters
+    *cluster_seeds, order_seed = seed.spawn(len(clusters) + 1)
+    tasks = [(idx, coords[idx], params, s) for idx, s in zip(clusters, cluster_seeds)]
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            tours = list(pool.map(_solve_cluster, tasks, chunksize=max(1, len(tasks) // (4 * workers))))
+    else:
+        tours = [_solve_cluster(task) for task in tasks]
+
+    centroids = np.array([coords[idx].mean(axis=0) for idx in clusters])
+    order = _solve_order(centroids, cluster_size, params, workers, order_seed)
+    route, joins = _stitch(coords, [tours[k] for k in order], centroids[order])
+    for center in joins:
+        two_opt_window(route, coords, center, window)
+    if local_search:
+        route = improve_tour(route, coords)
+    return route, _route_length(coords, route)
+
+
+def _route_length(coords, route):
+    pts = coords[np.asarray(route, dtype=int)]
+    return float(np.hypot(*(pts - np.roll(pts, -1, axis=0)).T).sum())
@@ -0,0 +1,68 @@
+import numpy as np
+
+from .tsp import route_distance
+
+# Por encima de este tamaño la tabla 2^(n-1) x (n-1) deja de caber cómodamente en memoria
+MAX_EXACT_CITIES = 18
+# Tamaño por debajo del cual `AntColony.run()` usa directamente el solver exacto
+EXACT_THRESHOLD = 15
+
+
+def solve_exact(distances):
+    """Resuelve el TSP de forma exacta con la programación dinámica de Held-Karp.
+
+    $C(S, j) = \\min_{i \\in S \\setminus \\{j\\}} C(S \\setminus \\{j\\}, i) + d_{ij}$
+
+    La ciudad 0 es el origen; los subconjuntos se codifican como máscaras de bits
+    sobre las ciudades 1..n-1 y se procesan por capas de cardinalidad, vectorizando
+    con NumPy sobre todos los subconjuntos de la capa. Memoria: O(2^(n-1) (n-1)).
+
+    Devuelve (route, distance) con la ruta empezando en la ciudad 0.
+    """
+    d = np.array(distances, dtype=float)
+    n = len(d)
+    if n > MAX_EXACT_CITIES:
+        raise ValueError(f'solve_exact admite como máximo {MAX_EXACT_CITIES} ciudades (recibidas {n})')
+    if n <= 3:
+        route = list(range(n))
+        return route, route_distance(route, d)
+
+    m = n - 1
+    full = (1 << m) - 1
+    sub = d[1:, 1:]  # distancias entre ciudades 1..n-1 (indices 0..m-1)
+    dp = np.full((1 << m, m), np.inf)
+    parent = np.full((1 << m, m), -1, dtype=np.int8)
+    singles = 1 << np.arange(m)
+    dp[singles, np.arange(m)] = d[0, 1:]
+
+    masks = np.arange(1 << m)
+    popcount = np.zeros(1 << m, dtype=np.int8)
+    for j in range(m):
+        popcount += (masks >> j) & 1
+    for size in range(2, m + 1):
+        layer = masks[popcount == size]
+        for j in range(m):
+            subsets = layer[(layer >> j) & 1 == 1]
+            prev = subsets ^ (1 << j)
+            # candidatos: llegar a j desde cada i del subconjunto previo (inf si i no está)
+            cand = dp[prev] + sub[:, j]
+            best_i = np.argmin(cand, axis=1)
+            dp[subsets, j] = cand[np.arange(len(subsets)), best_i]
+            parent[subsets, j] = best_i
+
+    closing = dp[full] + d[1:, 0]
+    last = int(np.argmin(closing))
+    distance = float(closing[last])
+
+    # reconstrucción hacia atrás
+    route = []
+    mask, j = full, last
+    while j != -1:
+        route.append(j + 1)
+        prev_j = int(parent[mask, j])
+        mask ^= 1 << j
+        j = prev_j
+    route.append(0)
+    route.reverse()
+    return route, distance
+
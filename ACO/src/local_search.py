@@ -0,0 +1,227 @@
+"""Búsqueda local global para rutas TSP Euclídeas grandes.
+
+Mejora una ruta completa sin matriz NxN: las distancias se calculan bajo demanda a
+partir de las coordenadas y cada ciudad solo prueba movimientos hacia sus `k`
+vecinas más cercanas (listas de vecinos), con una cola de ciudades activas
+("don't look bits"): tras un movimiento solo se vuelven a revisar las ciudades de
+los arcos que cambiaron.
+
+- `neighbour_lists`: k vecinas más cercanas por rejilla uniforme (aproximadas en
+  los bordes de celda, suficiente para generar candidatos).
+- `two_opt`: 2-opt; invierte siempre el lado más corto del ciclo.
+- `or_opt`: mueve segmentos de 1 a `max_segment` ciudades junto a una vecina.
+- `improve_tour`: alterna ambos hasta que una ronda no mejora.
+"""
+
+from collections import deque
+
+import numpy as np
+
+EPS = 1e-10
+
+
+def neighbour_lists(coords, k=8):
+    """Array (N, k) con las k ciudades más cercanas a cada una (sin la propia)."""
+    coords = np.asarray(coords, dtype=float)
+    n = len(coords)
+    k = min(k, n - 1)
+    low = coords.min(axis=0)
+    span = np.maximum(coords.max(axis=0) - low, 1e-12)
+    # rejilla de side x side celdas con ~2 ciudades por celda
+    side = max(1, int(np.sqrt(n / 2)))
+    cell = np.minimum(((coords - low) / span * side).astype(int), side - 1)
+    cell_id = cell[:, 0] * side + cell[:, 1]
+    order = np.argsort(cell_id, kind='stable')
+    ids = np.arange(side * side)
+    starts = np.searchsorted(cell_id[order], ids)
+    ends = np.searchsorted(cell_id[order], ids, side='right')
+
+    neighbours = np.empty((n, k), dtype=int)
+    for c in np.unique(cell_id):
+        cx, cy = divmod(int(c), side)
+        members = order[starts[c]:ends[c]]
+        # ampliar el bloque de celdas alrededor hasta tener al menos k candidatas
+        radius = 1
+        while True:
+            y0, y1 = max(0, cy - radius), min(side - 1, cy + radius)
+            # para cada columna x, las celdas y0..y1 son contiguas en `order`
+            candidates = np.concatenate([order[starts[x * side + y0]:ends[x * side + y1]]
+                                         for x in range(max(0, cx - radius), min(side, cx + radius + 1))])
+            if len(candidates) > k or radius >= side:
+                break
+            radius += 1
+        diff = coords[members][:, None, :] - coords[candidates][None, :, :]
+        d = np.hypot(diff[..., 0], diff[..., 1])
+        d[members[:, None] == candidates[None, :]] = np.inf
+        nearest = np.argpartition(d, k - 1, axis=1)[:, :k]
+        rows = np.arange(len(members))[:, None]
+        nearest = np.take_along_axis(nearest, np.argsort(d[rows, nearest], axis=1), axis=1)
+        neighbours[members] = candidates[nearest]
+    return neighbours
+
+
+class _Tour:
+    """Ruta como array con la posición de cada ciudad y distancias bajo demanda."""
+
+    def __init__(self, route, coords):
+        self.n = len(route)
+        self.tour = np.asarray(route, dtype=int).copy()
+        self.pos = np.empty(self.n, dtype=int)
+        self.pos[self.tour] = np.arange(self.n)
+        # listas de Python: el acceso escalar es mucho más rápido que sobre arrays
+        self.xs = coords[:, 0].tolist()
+        self.ys = coords[:, 1].tolist()
+
+    def dist(self, a, b):
+        return ((self.xs[a] - self.xs[b]) ** 2 + (self.ys[a] - self.ys[b]) ** 2) ** 0.5
+
+    def at(self, i):
+        return int(self.tour[i % self.n])
+
+    def reverse(self, i, j):
+        """Invierte las posiciones i..j (cíclicas), o el complemento si es más corto."""
+        n = self.n
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            i, j, length = (j + 1) % n, (i - 1) % n, n - length
+        idx = (i + np.arange(length)) % n
+        segment = self.tour[idx][::-1]
+        self.tour[idx] = segment
+        self.pos[segment] = idx
+
+    def reinsert(self, indices, piece, after, before):
+        """Quita las posiciones `indices` e inserta `piece` entre `after` y `before`."""
+        rest = np.delete(self.tour, indices)
+        j = int(np.flatnonzero(rest == after)[0])
+        if int(rest[(j + 1) % len(rest)]) == before:
+            self.tour = np.insert(rest, j + 1, piece)
+        else:
+            self.tour = np.insert(rest, j, piece[::-1])
+        self.pos[self.tour] = np.arange(self.n)
+
+
+def _activate(queue, queued, cities):
+    for city in cities:
+        if not queued[city]:
+            queued[city] = True
+            queue.append(city)
+
+
+def two_opt(route, coords, neighbours):
+    """2-opt con listas de vecinos. Modifica `route` in situ y la devuelve."""
+    n = len(route)
+    if n < 5:
+        return route
+    t = _Tour(route, np.asarray(coords, dtype=float))
+    neighbours = neighbours.tolist()
+    queue, queued = deque(t.tour.tolist()), [True] * n
+    while queue:
+        a = queue.popleft()
+        queued[a] = False
+        for direction in (1, -1):
+            i = int(t.pos[a])
+            b = t.at(i + direction)
+            d_ab = t.dist(a, b)
+            move = None
+            for c in neighbours[a]:
+                d_ac = t.dist(a, c)
+                if d_ac >= d_ab:
+                    break
+                j = int(t.pos[c])
+                d = t.at(j + direction)
+                if c == b or d == a:
+                    continue
+                # arcos (a, b) y (c, d) -> (a, c) y (b, d)
+                if d_ac + t.dist(b, d) - d_ab - t.dist(c, d) < -EPS:
+                    move = (i, j, c, d)
+                    break
+            if move is not None:
+                i, j, c, d = move
+                if direction == 1:
+                    t.reverse(i + 1, j)
+                else:
+                    t.reverse(j, i - 1)
+                _activate(queue, queued, (a, b, c, d))
+                break
+    route[:] = t.tour
+    return route
+
+
+def or_opt(route, coords, neighbours, max_segment=3):
+    """Or-opt con listas de vecinos. Modifica `route` in situ y la devuelve."""
+    n = len(route)
+    if n < 8:
+        return route
+    t = _Tour(route, np.asarray(coords, dtype=float))
+    neighbours = neighbours.tolist()
+    queue, queued = deque(t.tour.tolist()), [True] * n
+    while queue:
+        a = queue.popleft()
+        queued[a] = False
+        move = _or_move(t, neighbours, a, max_segment)
+        if move is None:
+            continue
+        indices, segment, end, c, e, p, nx = move
+        # la pieza entra como c, end, ..., otro extremo, e
+        piece = np.array(segment if segment[0] == end else segment[::-1])
+        t.reinsert(indices, piece, c, e)
+        _activate(queue, queued, (*segment, c, e, p, nx))
+    route[:] = t.tour
+    return route
+
+
+def _or_move(t, neighbours, a, max_segment):
+    """Primer movimiento de Or-opt que mejora un segmento que empieza o acaba en `a`."""
+    n = t.n
+    i = int(t.pos[a])
+    for length in range(1, max_segment + 1):
+        for start in (i, i - length + 1):
+            indices = [(start + k) % n for k in range(length)]
+            segment = [int(t.tour[k]) for k in indices]
+            p, nx = t.at(start - 1), t.at(start + length)
+            if p in segment or nx in segment:
+                continue
+            # ganancia de quitar el segmento y unir p con nx
+            removal = t.dist(p, segment[0]) + t.dist(segment[-1], nx) - t.dist(p, nx)
+            if removal <= EPS:
+                continue
+            inside = set(segment)
+            for end, other in ((segment[0], segment[-1]), (segment[-1], segment[0])):
+                for c in neighbours[end]:
+                    d_ce = t.dist(c, end)
+                    if d_ce >= removal:
+                        break
+                    if c in inside:
+                        continue
+                    j = int(t.pos[c])
+                    for e in (t.at(j + 1), t.at(j - 1)):
+                        if e in inside or {c, e} == {p, nx}:
+                            continue
+                        if removal - (d_ce + t.dist(other, e) - t.dist(c, e)) > EPS:
+                            return indices, segment, end, c, e, p, nx
+    return None
+
+
+def improve_tour(route, coords, neighbours=None, k=8, max_rounds=10):
+    """Alterna 2-opt y Or-opt hasta que una ronda no mejora. Devuelve la ruta mejorada."""
+    coords = np.asarray(coords, dtype=float)
+    route = np.asarray(route, dtype=int).copy()
+    if len(route) < 5:
+        return route
+    if neighbours is None:
+        neighbours = neighbour_lists(coords, k)
+    length = _length(coords, route)
+    for _ in range(max_rounds):
+        two_opt(route, coords, neighbours)
+        or_opt(route, coords, neighbours)
+        new_length = _length(coords, route)
+        if new_length > length - EPS:
+            break
+        length = new_length
+    return route
+
+
+def _length(coords, route):
+    pts = coords[route]
+    diff = pts - np.roll(pts, -1, axis=0)
+    return float(np.hypot(diff[:, 0], diff[:, 1]).sum())
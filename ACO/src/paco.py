@@ -0,0 +1,115 @@
+import numpy as np
+
+from .aco import AntColony
+
+
+class PopulationAntColony(AntColony):
+    """ACO basado en población (P-ACO, Guntsch & Middendorf) para el TSP.
+
+    En lugar de una matriz de feromona densa con evaporación, se mantiene una
+    población de k tours y la feromona se deriva de sus arcos:
+
+      $\\tau_{ij} = \\tau_{init} + \\Delta \\cdot |\\{\\pi \\in P : (i,j) \\in \\pi\\}|$
+
+    con $\\Delta = \\tau_{init} (n - 2) / k$ (así $\\tau_{max} = (n - 1) \\tau_{init}$, como en
+    la formulación original con $\\tau_{init} = 1/(n-1)$, $\\tau_{max} = 1$).
+
+    Cada iteración el mejor tour de la iteración entra en la población y, si está
+    llena, sale uno (el más antiguo con `replacement='fifo'`, el peor con
+    `replacement='quality'`). Cada tour se guarda como arrays de sucesor y
+    predecesor, así que la memoria y el coste de actualización son O(k·N) y O(k)
+    por fila de transición, sin pasada de evaporación sobre N².
+
+    Parámetros adicionales a los de `AntColony`:
+    - population_size: tamaño k de la población.
+    - replacement: 'fifo' o 'quality'.
+    `decay`, `n_best` y `q` solo intervienen en el tau0 de la siembra.
+    """
+
+    def __init__(self, distances, population_size=5, replacement='fifo', **kwargs):
+        if replacement not in ('fifo', 'quality'):
+            raise ValueError(f"replacement debe ser 'fifo' o 'quality' (recibido {replacement!r})")
+        self.population_size = population_size
+        self.replacement = replacement
+        super().__init__(distances, **kwargs)
+
+    def _init_pheromone(self, tau0, deposits):
+        n = len(self.distances)
+        k = self.population_size
+        self.tau_init = tau0
+        self.delta = tau0 * max(n - 2, 1) / k
+        self._succ = np.zeros((k, n), dtype=np.int32)
+        self._pred = np.zeros((k, n), dtype=np.int32)
+        self._lengths = np.full(k, np.inf)
+        self._size = 0
+        self._next = 0
+        self._spread_pheromone(deposits)
+        self._initial_population = self._population_state()
+
+    def _population_state(self):
+        return (self._succ.copy(), self._pred.copy(), self._lengths.copy(), self._size, self._next)
+
+    def _pheromone_row(self, current):
+        n = len(self.distances)
+        m = self._size
+        row = np.full(n, self.tau_init)
+        if m:
+            neighbours = np.concatenate((self._succ[:m, current], self._pred[:m, current]))
+            row += self.delta * np.bincount(neighbours, minlength=n)
+        return row
+
+    def _add_to_population(self, route, dist):
+        """Inserta un tour: O(N) para codificarlo, O(1) para retirar el saliente."""
+        if self._size < self.population_size:
+            slot = self._size
+            self._size += 1
+        elif self.replacement == 'fifo':
+            slot = self._next
+        else:
+            slot = int(np.argmax(self._lengths))
+            if dist >= self._lengths[slot]:
+                return
+        route = np.asarray(route, dtype=np.int32)
+        self._succ[slot, route] = np.roll(route, -1)
+        self._pred[slot, route] = np.roll(route, 1)
+        self._lengths[slot] = dist
+        self._next = (slot + 1) % self.population_size
+
+    def _spread_pheromone(self, solutions):
+        for route, dist in solutions:
+            self._add_to_population(route, dist)
+
+    def _update_pheromone(self, solutions):
+        # sin evaporación: solo entra el mejor de la iteración (y sale uno si está llena)
+        self._spread_pheromone([min(solutions, key=lambda x: x[1])])
+
+    def get_pheromone_matrix(self):
+        """Materializa la matriz NxN equivalente (solo para visualización)."""
+        n = len(self.distances)
+        m = self._size
+        pher = np.full((n, n), self.tau_init)
+        rows = np.tile(np.arange(n), 2 * m)
+        cols = np.concatenate((self._succ[:m].ravel(), self._pred[:m].ravel()))
+        np.add.at(pher, (rows, cols), self.delta)
+        return pher
+
+    def warm_start(self, pheromone=None, best_route=None, best_distance=float('inf')):
+        """Arranque en caliente: la mejor ruta previa entra en la población inicial.
+
+        La matriz `pheromone` se ignora porque la feromona se deriva de la población.
+        """
+        if best_route is not None:
+            self._initial_best = ([int(x) for x in best_route], float(best_distance))
+            self.reset()
+            self._add_to_population(self._initial_best[0], self._initial_best[1])
+            self._initial_population = self._population_state()
+        self.reset()
+
+    def reset(self):
+        """Reinicia la población y el estado del algoritmo al valor inicial."""
+        succ, pred, lengths, size, nxt = self._initial_population
+        self._succ, self._pred, self._lengths = succ.copy(), pred.copy(), lengths.copy()
+        self._size, self._next = size, nxt
+        self.iteration = 0
+        self.best_route, self.best_distance = self._initial_best
+        self.last_solutions = []
@@ -0,0 +1,127 @@
+import numpy as np
+
+from .tsp import route_distance
+
+SEEDING_METHODS = ('nn', 'greedy', 'sfc')
+
+
+def nearest_neighbour_tour(distances, start=0):
+    """Tour de vecino más cercano: desde `start`, ir siempre a la ciudad no visitada más próxima."""
+    d = np.asarray(distances, dtype=float)
+    n = len(d)
+    visited = np.zeros(n, dtype=bool)
+    route = [int(start)]
+    visited[start] = True
+    current = int(start)
+    for _ in range(n - 1):
+        row = np.where(visited, np.inf, d[current])
+        current = int(np.argmin(row))
+        route.append(current)
+        visited[current] = True
+    return route
+
+
+def greedy_edge_tour(distances):
+    """Heurística de aristas voraz (greedy matching).
+
+    Recorre las aristas de menor a mayor coste y acepta una arista si ambos
+    extremos tienen grado < 2 y no cierra un ciclo prematuro (union-find).
+    """
+    d = np.asarray(distances, dtype=float)
+    n = len(d)
+    if n < 3:
+        return list(range(n))
+    sym = np.minimum(d, d.T)
+    iu, ju = np.triu_indices(n, k=1)
+    order = np.argsort(sym[iu, ju], kind='stable')
+    degree = np.zeros(n, dtype=int)
+    parent = list(range(n))
+    adjacency = [[] for _ in range(n)]
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    accepted = 0
+    for k in order:
+        a, b = int(iu[k]), int(ju[k])
+        if degree[a] >= 2 or degree[b] >= 2:
+            continue
+        ra, rb = find(a), find(b)
+        if ra == rb:
+            continue
+        parent[ra] = rb
+        degree[a] += 1
+        degree[b] += 1
+        adjacency[a].append(b)
+        adjacency[b].append(a)
+        accepted += 1
+        if accepted == n - 1:
+            break
+
+    # el resultado es un camino hamiltoniano: recorrerlo desde un extremo
+    start = int(np.flatnonzero(degree < 2)[0])
+    route = [start]
+    prev, current = -1, start
+    while len(route) < n:
+        nxt = adjacency[current][0] if adjacency[current][0] != prev else adjacency[current][1]
+        route.append(nxt)
+        prev, current = current, nxt
+    return route
+
+
+def _hilbert_index(x, y, order):
+    """Índice de Hilbert (vectorizado) de puntos enteros en una rejilla 2^order x 2^order."""
+    x = x.astype(np.int64).copy()
+    y = y.astype(np.int64).copy()
+    d = np.zeros_like(x)
+    s = 1 << (order - 1)
+    while s > 0:
+        rx = ((x & s) > 0).astype(np.int64)
+        ry = ((y & s) > 0).astype(np.int64)
+        d += s * s * ((3 * rx) ^ ry)
+        # rotar el cuadrante
+        flip = (ry == 0) & (rx == 1)
+        x = np.where(flip, s - 1 - x, x)
+        y = np.where(flip, s - 1 - y, y)
+        swap = ry == 0
+        x, y = np.where(swap, y, x), np.where(swap, x, y)
+        s >>= 1
+    return d
+
+
+def space_filling_curve_tour(coords, order=16):
+    """Ordena las ciudades según su posición sobre una curva de Hilbert.
+
+    Es O(N log N) y no necesita la matriz de distancias, por lo que sirve
+    incluso para instancias muy grandes.
+    """
+    c = np.asarray(coords, dtype=float)
+    lo = c.min(axis=0)
+    span = (c.max(axis=0) - lo).max()
+    if span == 0:
+        return list(range(len(c)))
+    grid = ((c - lo) / span * ((1 << order) - 1)).astype(np.int64)
+    keys = _hilbert_index(grid[:, 0], grid[:, 1], order)
+    return [int(i) for i in np.argsort(keys, kind='stable')]
+
+
+def build_seed_tour(method, distances=None, coords=None):
+    """Construye un tour inicial con el método indicado ('nn', 'greedy' o 'sfc').
+
+    Devuelve (route, distance). 'sfc' requiere `coords`; el resto requiere `distances`.
+    """
+    if method == 'nn':
+        route = nearest_neighbour_tour(distances)
+    elif method == 'greedy':
+        route = greedy_edge_tour(distances)
+    elif method == 'sfc':
+        if coords is None:
+            raise ValueError("La siembra 'sfc' necesita las coordenadas de la instancia")
+        route = space_filling_curve_tour(coords)
+    else:
+        raise ValueError(f"Método de siembra desconocido: {method!r} (opciones: {', '.join(SEEDING_METHODS)})")
+    distance = route_distance(route, distances) if distances is not None else None
+    return route, distance
@@ -0,0 +1,440 @@
+"""Servicio HTTP local (asyncio) para resolver instancias TSP con `AntColony`.
+
+Endpoints (JSON):
+- POST   /jobs              crea un trabajo. Cuerpo: {"distances": NxN} | {"coords": [[x, y], ...]}
+                            | {"latlon": [[lat, lon], ...]}, opcional "params" (argumentos de
+                            `AntColony`), "priority" (entero, mayor = antes) y "seed" (entero,
+                            para reproducir el resultado). 202 -> {"id": ...}.
+                            Si la cola está llena responde 503 con cabecera Retry-After.
+- GET    /jobs              lista de trabajos y su estado.
+- GET    /jobs/<id>         estado, progreso y resultado.
+- GET    /jobs/<id>/events  progreso por iteración como server-sent events.
+- DELETE /jobs/<id>         cancela un trabajo en cola o en ejecución.
+- GET    /health            estado del pool y de la cola.
+
+Los trabajos terminados se conservan `finished_ttl` segundos (y como mucho
+`max_finished`); después su id responde 404.
+
+Con `--store DIR` las soluciones se guardan en un `SolutionStore` compartido: las
+peticiones repetidas se responden al instante y las de mayor presupuesto continúan
+desde la feromona guardada.
+
+Las resoluciones se ejecutan en un `ProcessPoolExecutor` acotado y precalentado;
+el bucle de eventos solo encola, reparte progreso y atiende conexiones, así que
+nunca se bloquea esperando a un cálculo. Cada trabajo sin "seed" recibe un flujo
+aleatorio propio derivado con `SeedSequence.spawn` de la semilla del servicio, de
+modo que los procesos del pool nunca comparten estado aleatorio.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from .aco import AntColony
+from .store import SolutionStore, solve_cached
+from .tsp import coords_to_distance_matrix, haversine_distance_matrix
+
+# parámetros de AntColony que se aceptan desde el cliente
+ALLOWED_PARAMS = ('n_ants', 'n_best', 'n_iterations', 'decay', 'alpha', 'beta', 'q',
+                  'target_gap', 'exact_threshold', 'seeding', 'seed_deposit')
+TERMINAL_STATES = ('done', 'cancelled', 'failed')
+# el progreso (y la consulta de cancelación) cruza procesos: solo cada tantas
+# iteraciones o cuando mejora la mejor distancia
+PROGRESS_EVERY = 10
+_REASONS = {200: 'OK', 202: 'Accepted', 400: 'Bad Request', 404: 'Not Found',
+            405: 'Method Not Allowed', 409: 'Conflict', 503: 'Service Unavailable'}
+
+
+def _warm_up():
+    """Tarea vacía para arrancar los procesos del pool antes del primer trabajo."""
+    return True
+
+
+def build_instance(payload):
+    """Devuelve (distances, coords) a partir del cuerpo de la petición."""
+    if 'distances' in payload:
+        return payload['distances'], None
+    if 'coords' in payload:
+        return coords_to_distance_matrix(payload['coords']), payload['coords']
+    if 'latlon' in payload:
+        return haversine_distance_matrix(payload['latlon']), None
+    raise ValueError("La instancia necesita 'distances', 'coords' o 'latlon'")
+
+
+def _solve_job(job_id, payload, progress, cancelled, store_path=None, store_max_bytes=None, seed=None):
+    """Resuelve un trabajo dentro de un proceso del pool.
+
+    Publica (job_id, iteration, best_distance, gap) en `progress` y consulta si
+    `cancelled` contiene el id del trabajo cada `PROGRESS_EVERY` iteraciones o cuando
+    mejora la mejor distancia. La parada por `target_gap` la hace `AntColony.run`.
+    `seed` (int o `SeedSequence`) inicializa el generador aleatorio de la colonia.
+    """
+    distances, coords = build_instance(payload)
+    params = {k: v for k, v in payload.get('params', {}).items() if k in ALLOWED_PARAMS}
+    params['rng'] = np.random.default_rng(seed)
+    state = {'cancelled': False, 'reported': float('inf')}
+
+    def on_iteration(colony):
+        if colony.iteration % PROGRESS_EVERY and colony.best_distance >= state['reported']:
+            return False
+        state['reported'] = colony.best_distance
+        gap = colony.get_gap() if colony.target_gap is not None else None
+        progress.put((job_id, colony.iteration, colony.best_distance, gap))
+        state['cancelled'] = bool(cancelled.get(job_id))
+        return state['cancelled']
+
+    if store_path is not None:
+        store = SolutionStore(store_path, max_bytes=store_max_bytes)
+        try:
+            route, dist, info = solve_cached(distances, store, callback=on_iteration, coords=coords, **params)
+        finally:
+            store.close()
+        iterations, cached = info['iterations'], info['cached']
+    else:
+        aco = AntColony(distances, coords=coords, **params)
+        route, dist = aco.run(callback=on_iteration)
+        iterations, cached = aco.iteration, False
+    return {
+        'cancelled': state['cancelled'],
+        'best_route': [int(x) for x in route] if route is not None else None,
+        'best_distance': float(dist) if route is not None else None,
+        'iterations': iterations,
+        'cached': cached,
+    }
+
+
+class Job:
+    """Estado de un trabajo en el servicio (vive solo en el proceso principal)."""
+
+    def __init__(self, job_id, payload, priority, seed=None):
+        self.id = job_id
+        self.payload = payload
+        self.priority = priority
+        self.seed = seed
+        self.status = 'queued'
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.progress = None
+        self.result = None
+        self.error = None
+        # colas de los clientes SSE suscritos
+        self.subscribers = set()
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'status': self.status,
+            'priority': self.priority,
+            'created': self.created,
+            'started': self.started,
+            'finished': self.finished,
+            'progress': self.progress,
+            'result': self.result,
+            'error': self.error,
+        }
+
+    def publish(self, event, data):
+        for queue in self.subscribers:
+            queue.put_nowait((event, data))
+
+
+class ACOService:
+    """Cola con prioridades + pool de procesos + servidor HTTP mínimo.
+
+    Parámetros:
+    - workers: procesos del pool (y número máximo de resoluciones simultáneas).
+    - queue_size: trabajos en espera admitidos antes de rechazar con 503.
+    - store_path, store_max_bytes: almacén de soluciones compartido (opcional).
+    - seed: semilla de la que se derivan los flujos aleatorios de los trabajos.
+    - finished_ttl, max_finished: segundos que se conserva un trabajo terminado y
+      número máximo de trabajos terminados (los más antiguos se olvidan antes).
+    """
+
+    def __init__(self, host='127.0.0.1', port=8765, workers=None, queue_size=64,
+                 store_path=None, store_max_bytes=512 * 1024 * 1024, seed=None,
+                 finished_ttl=3600, max_finished=1000):
+        self.host = host
+        self.port = port
+        self.workers = workers or max(1, multiprocessing.cpu_count() - 1)
+        self.queue_size = queue_size
+        self.store_path = store_path
+        self.store_max_bytes = store_max_bytes
+        self.finished_ttl = finished_ttl
+        self.max_finished = max_finished
+        self.jobs = {}
+        # ids de los trabajos terminados, por orden de finalización
+        self._finished = OrderedDict()
+        self._seed_sequence = np.random.SeedSequence(seed)
+        self._ids = itertools.count(1)
+        self._seq = itertools.count()
+        self._queue = None
+        # trabajos en estado 'queued' (los cancelados en cola no cuentan aunque sigan en _queue)
+        self._queued = 0
+        self._pool = None
+        self._manager = None
+        self._progress = None
+        self._cancelled = None
+        self._io = None
+        self._tasks = []
+        self._server = None
+
+    # ciclo de vida -----------------------------------------------------
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        # sin maxsize: la contrapresión usa `_queued`, que descuenta los cancelados en cola
+        self._queue = asyncio.PriorityQueue()
+        self._manager = multiprocessing.Manager()
+        self._progress = self._manager.Queue()
+        self._cancelled = self._manager.dict()
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        # hilo dedicado a leer el progreso del Manager sin bloquear el bucle
+        self._io = ThreadPoolExecutor(max_workers=1)
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _warm_up) for _ in range(self.workers)))
+        self._tasks = [asyncio.create_task(self._dispatcher()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._pump_progress()))
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+
+    async def serve_forever(self):
+        await self.start()
+        print(f'Servicio ACO en http://{self.host}:{self.port} ({self.workers} procesos, cola {self.queue_size})')
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+        for job_id, job in self.jobs.items():
+            if job.status == 'running':
+                self._cancelled[job_id] = True
+        for task in self._tasks:
+            task.cancel()
+        self._progress.put(None)
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._io.shutdown(wait=True)
+        self._manager.shutdown()
+
+    # trabajos ----------------------------------------------------------
+
+    def submit(self, payload, priority=0, seed=None):
+        """Encola un trabajo; lanza asyncio.QueueFull si no hay sitio (backpressure)."""
+        self._evict_finished()
+        if self._queued >= self.queue_size:
+            raise asyncio.QueueFull
+        # flujo por orden de llegada (no de ejecución), salvo que el cliente fije su semilla
+        if seed is None:
+            seed = self._seed_sequence.spawn(1)[0]
+        job = Job(str(next(self._ids)), payload, priority, seed)
+        self._queue.put_nowait((-priority, next(self._seq), job.id))
+        self._queued += 1
+        self.jobs[job.id] = job
+        return job
+
+    def cancel(self, job_id):
+        job = self.jobs[job_id]
+        if job.status == 'queued':
+            # deja de contar para la contrapresión; el repartidor descartará su entrada de la cola
+            self._queued -= 1
+            self._finish(job, 'cancelled')
+        elif job.status == 'running':
+            self._cancelled[job_id] = True
+        return job
+
+    def _finish(self, job, status, result=None, error=None):
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished = time.time()
+        job.payload = None
+        job.publish('end', job.to_dict())
+        self._finished[job.id] = job.finished
+        self._evict_finished()
+
+    def _evict_finished(self):
+        """Olvida los trabajos terminados que caducaron o exceden `max_finished`."""
+        expiry = time.time() - self.finished_ttl
+        while self._finished:
+            job_id, finished = next(iter(self._finished.items()))
+            if finished > expiry and len(self._finished) <= self.max_finished:
+                break
+            del self._finished[job_id]
+            self.jobs.pop(job_id, None)
+
+    async def _dispatcher(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            _, _, job_id = await self._queue.get()
+            job = self.jobs.get(job_id)
+            if job is None or job.status != 'queued':
+                continue
+            self._queued -= 1
+            job.status = 'running'
+            job.started = time.time()
+            job.publish('status', {'status': 'running'})
+            try:
+                result = await loop.run_in_executor(
+                    self._pool, _solve_job, job.id, job.payload, self._progress, self._cancelled,
+                    self.store_path, self.store_max_bytes, job.seed)
+            except Exception as e:
+                self._finish(job, 'failed', error=str(e))
+            else:
+                status = 'cancelled' if result.pop('cancelled') else 'done'
+                self._finish(job, status, result=result)
+            finally:
+                self._cancelled.pop(job_id, None)
+
+    async def _pump_progress(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            msg = await loop.run_in_executor(self._io, self._progress.get)
+            if msg is None:
+                return
+            job_id, iteration, best, gap = msg
+            job = self.jobs.get(job_id)
+            if job is None or job.status in TERMINAL_STATES:
+                continue
+            job.progress = {'iteration': iteration, 'best_distance': best, 'gap': gap}
+            job.publish('progress', job.progress)
+
+    # HTTP --------------------------------------------------------------
+
+    async def _handle(self, reader, writer):
+        try:
+            request_line = await reader.readline()
+            if not request_line:
+                return
+            method, path, _ = request_line.decode('latin-1').split(' ', 2)
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                key, _, value = line.decode('latin-1').partition(':')
+                headers[key.strip().lower()] = value.strip()
+            body = b''
+            if int(headers.get('content-length', 0)) > 0:
+                body = await reader.readexactly(int(headers['content-length']))
+            await self._route(method, path.split('?', 1)[0].rstrip('/'), body, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except ValueError:
+            await self._send_json(writer, 400, {'error': 'Petición mal formada'})
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, body, writer):
+        parts = [p for p in path.split('/') if p]
+        if parts == ['health'] and method == 'GET':
+            running = sum(1 for j in self.jobs.values() if j.status == 'running')
+            return await self._send_json(writer, 200, {
+                'workers': self.workers, 'running': running,
+                'queued': self._queued, 'queue_size': self.queue_size})
+        if parts == ['jobs'] and method == 'POST':
+            return await self._create_job(body, writer)
+        if parts == ['jobs'] and method == 'GET':
+            return await self._send_json(writer, 200, [
+                {'id': j.id, 'status': j.status, 'priority': j.priority} for j in self.jobs.values()])
+        if len(parts) >= 2 and parts[0] == 'jobs':
+            job = self.jobs.get(parts[1])
+            if job is None:
+                return await self._send_json(writer, 404, {'error': 'Trabajo no encontrado'})
+            if len(parts) == 2 and method == 'GET':
+                return await self._send_json(writer, 200, job.to_dict())
+            if len(parts) == 2 and method == 'DELETE':
+                if job.status in TERMINAL_STATES:
+                    return await self._send_json(writer, 409, {'error': f'El trabajo ya está {job.status}'})
+                return await self._send_json(writer, 202, self.cancel(job.id).to_dict())
+            if len(parts) == 3 and parts[2] == 'events' and method == 'GET':
+                return await self._stream_events(job, writer)
+        return await self._send_json(writer, 404, {'error': 'Ruta no encontrada'})
+
+    async def _create_job(self, body, writer):
+        loop = asyncio.get_running_loop()
+        try:
+            # instancias grandes: decodificar fuera del bucle de eventos
+            payload = await loop.run_in_executor(None, json.loads, body or b'{}')
+            if not any(k in payload for k in ('distances', 'coords', 'latlon')):
+                raise ValueError("La instancia necesita 'distances', 'coords' o 'latlon'")
+            priority = int(payload.pop('priority', 0))
+            seed = payload.pop('seed', None)
+            if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool) or seed < 0):
+                raise ValueError("'seed' debe ser un entero no negativo")
+        except (ValueError, TypeError) as e:
+            return await self._send_json(writer, 400, {'error': str(e)})
+        try:
+            job = self.submit(payload, priority, seed)
+        except asyncio.QueueFull:
+            return await self._send_json(writer, 503, {'error': 'Cola llena, reintentar más tarde'},
+                                         extra_headers={'Retry-After': '1'})
+        await self._send_json(writer, 202, {'id': job.id, 'status': job.status})
+
+    async def _stream_events(self, job, writer):
+        writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n'
+                     b'Cache-Control: no-cache\r\nConnection: close\r\n\r\n')
+        if job.status in TERMINAL_STATES:
+            writer.write(_sse('end', job.to_dict()))
+            await writer.drain()
+            return
+        queue = asyncio.Queue()
+        job.subscribers.add(queue)
+        try:
+            writer.write(_sse('status', {'status': job.status, 'progress': job.progress}))
+            await writer.drain()
+            while True:
+                event, data = await queue.get()
+                # si el cliente es lento, enviar solo el progreso más reciente
+                while event == 'progress' and not queue.empty():
+                    event, data = queue.get_nowait()
+                writer.write(_sse(event, data))
+                await writer.drain()
+                if event == 'end':
+                    return
+        finally:
+            job.subscribers.discard(queue)
+
+    async def _send_json(self, writer, status, data, extra_headers=None):
+        body = json.dumps(data).encode('utf-8')
+        head = [f'HTTP/1.1 {status} {_REASONS.get(status, "")}',
+                'Content-Type: application/json',
+                f'Content-Length: {len(body)}',
+                'Connection: close']
+        for key, value in (extra_headers or {}).items():
+            head.append(f'{key}: {value}')
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+
+def _sse(event, data):
+    return f'event: {event}\ndata: {json.dumps(data)}\n\n'.encode('utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Servicio HTTP local de trabajos ACO')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=None, help='Procesos del pool (por defecto nº de CPUs - 1)')
+    parser.add_argument('--queue-size', type=int, default=64, help='Trabajos en espera antes de responder 503')
+    parser.add_argument('--store', default=None, help='Directorio del almacén de soluciones (opcional)')
+    parser.add_argument('--store-max-mb', type=int, default=512, help='Tamaño máximo del almacén en MB')
+    parser.add_argument('--seed', type=int, default=None, help='Semilla de los flujos aleatorios de los trabajos')
+    parser.add_argument('--job-ttl', type=float, default=3600, help='Segundos que se conserva un trabajo terminado')
+    parser.add_argument('--max-finished', type=int, default=1000, help='Trabajos terminados que se conservan como máximo')
+    args = parser.parse_args()
+    service = ACOService(args.host, args.port, args.workers, args.queue_size,
+                         store_path=args.store, store_max_bytes=args.store_max_mb * 1024 * 1024,
+                         seed=args.seed, finished_ttl=args.job_ttl, max_finished=args.max_finished)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,166 @@
+"""Almacén persistente de soluciones (SQLite + blobs `.npz`) con arranque en caliente.
+
+Cada entrada se indexa por el hash de la instancia (matriz de distancias) y de los
+parámetros que determinan la dinámica de la colonia; el presupuesto
+(`n_iterations`, `target_gap`) no forma parte de la clave. Se guarda la mejor ruta,
+su longitud, las iteraciones acumuladas y la matriz de feromona final, y se
+desalojan las entradas usadas hace más tiempo cuando los blobs superan `max_bytes`.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zipfile
+
+import numpy as np
+
+from .aco import STOP_CALLBACK, AntColony
+
+# parámetros que no cambian la instancia ni la dinámica, solo cuánto se itera
+BUDGET_PARAMS = ('n_iterations', 'target_gap')
+
+
+def instance_key(distances, params):
+    """Hash estable de (distancias, parámetros sin presupuesto)."""
+    d = np.ascontiguousarray(distances, dtype=np.float64)
+    h = hashlib.sha256()
+    h.update(str(d.shape).encode())
+    h.update(d.tobytes())
+    # el generador aleatorio tampoco identifica la instancia
+    relevant = {k: v for k, v in sorted(params.items()) if k not in BUDGET_PARAMS and k != 'rng'}
+    h.update(json.dumps(relevant, sort_keys=True, default=str).encode())
+    return h.hexdigest()
+
+
+class SolutionStore:
+    """Índice SQLite con las soluciones y un fichero `.npz` por entrada.
+
+    Parámetros:
+    - path: directorio del almacén (se crea si no existe).
+    - max_bytes: tamaño máximo total de los blobs antes de desalojar (LRU).
+    """
+
+    def __init__(self, path, max_bytes=512 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(path, exist_ok=True)
+        self._db = sqlite3.connect(os.path.join(path, 'index.sqlite'), timeout=30)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS solutions ('
+            ' key TEXT PRIMARY KEY, n INTEGER, best_distance REAL, best_route TEXT,'
+            ' iterations INTEGER, optimal INTEGER, blob TEXT, size INTEGER,'
+            ' created REAL, last_used REAL)')
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+    def get(self, key, load_pheromone=True):
+        """Devuelve la entrada como dict (con 'pheromone' si se pide) o None."""
+        row = self._db.execute(
+            'SELECT n, best_distance, best_route, iterations, optimal, blob FROM solutions WHERE key = ?',
+            (key,)).fetchone()
+        if row is None:
+            return None
+        n, best_distance, best_route, iterations, optimal, blob = row
+        record = {'key': key, 'n': n, 'best_distance': best_distance, 'best_route': json.loads(best_route),
+                  'iterations': iterations, 'optimal': bool(optimal), 'pheromone': None}
+        if load_pheromone:
+            try:
+                with np.load(os.path.join(self.path, blob)) as data:
+                    record['pheromone'] = data['pheromone']
+            except (OSError, zipfile.BadZipFile, ValueError, EOFError, KeyError):
+                # blob perdido o dañado: la entrada ya no sirve para arrancar en caliente
+                self._delete(key, blob)
+                return None
+        self._db.execute('UPDATE solutions SET last_used = ? WHERE key = ?', (time.time(), key))
+        self._db.commit()
+        return record
+
+    def put(self, key, best_route, best_distance, iterations, pheromone, optimal=False):
+        """Guarda (o reemplaza) una entrada y desaloja si se supera `max_bytes`."""
+        blob = f'{key}.npz'
+        blob_path = os.path.join(self.path, blob)
+        # fichero temporal + os.replace: otro proceso del pool nunca lee un blob a medio escribir
+        tmp_path = f'{blob_path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, pheromone=np.asarray(pheromone))
+            os.replace(tmp_path, blob_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        size = os.path.getsize(blob_path)
+        now = time.time()
+        self._db.execute(
+            'INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?, ?, ?, ?, ?, '
+            ' COALESCE((SELECT created FROM solutions WHERE key = ?), ?), ?)',
+            (key, len(best_route), float(best_distance), json.dumps([int(x) for x in best_route]),
+             int(iterations), int(optimal), blob, size, key, now, now))
+        self._db.commit()
+        self.evict()
+
+    def evict(self):
+        """Elimina las entradas menos usadas recientemente hasta caber en `max_bytes`."""
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM solutions').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, blob, size in self._db.execute(
+                'SELECT key, blob, size FROM solutions ORDER BY last_used ASC').fetchall():
+            self._delete(key, blob)
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def _delete(self, key, blob):
+        self._db.execute('DELETE FROM solutions WHERE key = ?', (key,))
+        self._db.commit()
+        try:
+            os.remove(os.path.join(self.path, blob))
+        except FileNotFoundError:
+            pass
+
+    def stats(self):
+        entries, total = self._db.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM solutions').fetchone()
+        return {'entries': entries, 'bytes': total, 'max_bytes': self.max_bytes}
+
+
+def solve_cached(distances, store, verbose=False, callback=None, coords=None, **params):
+    """Resuelve con `AntColony` reutilizando el almacén.
+
+    - Si hay una entrada con al menos `n_iterations` iteraciones (o es óptima) se
+      devuelve al instante.
+    - Si hay una entrada con menos presupuesto, la colonia arranca desde su feromona
+      y mejor ruta y ejecuta solo las iteraciones que faltan.
+
+    Devuelve (best_route, best_distance, info) con info = {'cached', 'iterations',
+    'stop_reason'}. Si el callback detuvo la ejecución (p. ej. una cancelación) el
+    resultado no se guarda: una ejecución interrumpida no debe servir de punto de
+    partida como si hubiera completado su presupuesto.
+    """
+    distances = np.asarray(distances, dtype=float)
+    key = instance_key(distances, params)
+    budget = params.get('n_iterations', 100)
+    # primero solo los metadatos: un acierto devuelve la ruta sin leer la feromona N x N
+    record = store.get(key, load_pheromone=False)
+    if record is not None and (record['optimal'] or record['iterations'] >= budget):
+        return record['best_route'], record['best_distance'], {
+            'cached': True, 'iterations': record['iterations'], 'stop_reason': None}
+    if record is not None:
+        # arranque en caliente: ahora sí hace falta la feromona (None si se perdió el blob)
+        record = store.get(key)
+
+    done = record['iterations'] if record is not None else 0
+    aco = AntColony(distances, coords=coords, **dict(params, n_iterations=budget - done))
+    if record is not None:
+        aco.warm_start(record['pheromone'], record['best_route'], record['best_distance'])
+    route, dist = aco.run(verbose=verbose, callback=callback)
+    if aco.stop_reason != STOP_CALLBACK:
+        optimal = len(distances) <= aco.exact_threshold
+        store.put(key, route, dist, done + aco.iteration, aco.get_pheromone_matrix(), optimal=optimal)
+    return route, dist, {'cached': False, 'iterations': done + aco.iteration, 'stop_reason': aco.stop_reason}
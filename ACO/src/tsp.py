@@ -1,19 +1,9 @@
 import numpy as np
-import math
 
 def coords_to_distance_matrix(coords):
-    coords = np.array(coords)
-    n = len(coords)
-    dist = np.zeros((n, n))
-    for i in range(n):
-        for j in range(n):
-            if i == j:
-                dist[i, j] = 0.0
-            else:
-                dx = coords[i, 0] - coords[j, 0]
-                dy = coords[i, 1] - coords[j, 1]
-                dist[i, j] = math.hypot(dx, dy)
-    return dist
+    coords = np.asarray(coords, dtype=float)
+    diff = coords[:, None, :2] - coords[None, :, :2]
+    return np.hypot(diff[..., 0], diff[..., 1])
 
 def haversine_distance_matrix(latlon_coords):
     """Calcula matriz de distancias en km usando la fórmula Haversine.
@@ -21,21 +11,15 @@ def haversine_distance_matrix(latlon_coords):
     `latlon_coords` debe ser iterable de pares (lat, lon) en grados.
     """
     coords = np.array(latlon_coords, dtype=float)
-    n = len(coords)
     R = 6371.0  # radio de la Tierra en km
-    dist = np.zeros((n, n))
     lat = np.radians(coords[:, 0])
     lon = np.radians(coords[:, 1])
-    for i in range(n):
-        for j in range(n):
-            if i == j:
-                dist[i, j] = 0.0
-            else:
-                dlat = lat[j] - lat[i]
-                dlon = lon[j] - lon[i]
-                a = math.sin(dlat/2)**2 + math.cos(lat[i]) * math.cos(lat[j]) * math.sin(dlon/2)**2
-                c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-                dist[i, j] = R * c
+    dlat = lat[None, :] - lat[:, None]
+    dlon = lon[None, :] - lon[:, None]
+    a = np.sin(dlat/2)**2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlon/2)**2
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
+    dist = R * c
+    np.fill_diagonal(dist, 0.0)
     return dist
 
 def random_coords(n, seed=None, scale=100):
@@ -46,10 +30,10 @@ def route_to_coords(route, coords):
     return [coords[i] for i in route]
 
 def route_distance(route, dist_matrix):
-    d = 0.0
-    for i in range(len(route)):
-        d += dist_matrix[route[i], route[(i+1)%len(route)]]
-    return d
+    route = np.asarray(route, dtype=int)
+    if len(route) == 0:
+        return 0.0
+    return float(np.asarray(dist_matrix)[route, np.roll(route, -1)].sum())
 
 def format_route(route):
     return ' -> '.join(str(r) for r in route)
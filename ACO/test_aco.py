@@ -0,0 +1,128 @@
+"""Pruebas deterministas del solver (semillas fijas con `rng=` / `seed=`).
+
+Se ejecutan con `python -m pytest` desde esta carpeta, o con `python test_aco.py`.
+"""
+
+import itertools
+import tempfile
+
+import numpy as np
+
+from src.aco import STOP_CALLBACK, STOP_EXACT, AntColony
+from src.bounds import held_karp_bound
+from src.decompose import decompose_solve
+from src.exact import solve_exact
+from src.local_search import improve_tour
+from src.store import SolutionStore, instance_key, solve_cached
+from src.tsp import coords_to_distance_matrix, random_coords, route_distance
+
+
+def brute_force(dist):
+    n = len(dist)
+    return min(route_distance((0,) + p, dist) for p in itertools.permutations(range(1, n)))
+
+
+def test_exact_matches_brute_force():
+    for seed in range(3):
+        dist = coords_to_distance_matrix(random_coords(8, seed=seed))
+        route, length = solve_exact(dist)
+        assert sorted(route) == list(range(8))
+        assert np.isclose(length, route_distance(route, dist))
+        assert np.isclose(length, brute_force(dist))
+
+
+def test_held_karp_bound_below_optimum():
+    dist = coords_to_distance_matrix(random_coords(12, seed=4))
+    _, optimum = solve_exact(dist)
+    bound = held_karp_bound(dist, upper_bound=optimum)
+    assert 0.8 * optimum <= bound <= optimum + 1e-9
+
+
+def test_run_uses_exact_solver_for_small_instances():
+    dist = coords_to_distance_matrix(random_coords(9, seed=2))
+    colony = AntColony(dist, n_iterations=20, rng=1)
+    _, length = colony.run()
+    assert colony.stop_reason == STOP_EXACT
+    assert np.isclose(length, solve_exact(dist)[1])
+
+
+def test_same_seed_same_result():
+    dist = coords_to_distance_matrix(random_coords(30, seed=5))
+    a = AntColony(dist, n_iterations=15, exact_threshold=0, rng=3).run()
+    b = AntColony(dist, n_iterations=15, exact_threshold=0, rng=3).run()
+    assert list(a[0]) == list(b[0])
+    assert a[1] == b[1]
+
+
+def test_store_hit_and_warm_start():
+    dist = coords_to_distance_matrix(random_coords(25, seed=6))
+    params = dict(n_ants=5, n_best=2, decay=0.3, exact_threshold=0, rng=0)
+    with tempfile.TemporaryDirectory() as path:
+        store = SolutionStore(path)
+        _, first, info = solve_cached(dist, store, n_iterations=10, **params)
+        assert not info['cached'] and info['iterations'] == 10
+        _, again, info = solve_cached(dist, store, n_iterations=10, **params)
+        assert info['cached'] and again == first
+        # más presupuesto: arranca desde la entrada y solo itera lo que falta
+        _, longer, info = solve_cached(dist, store, n_iterations=25, **params)
+        assert not info['cached'] and info['iterations'] == 25
+        assert longer <= first
+        store.close()
+
+
+def test_store_skips_cancelled_runs():
+    dist = coords_to_distance_matrix(random_coords(25, seed=6))
+    with tempfile.TemporaryDirectory() as path:
+        store = SolutionStore(path)
+        _, _, info = solve_cached(dist, store, callback=lambda colony: True, n_iterations=10,
+                                  exact_threshold=0, rng=0)
+        assert info['stop_reason'] == STOP_CALLBACK
+        assert store.stats()['entries'] == 0
+        store.close()
+
+
+def test_store_evicts_least_recently_used():
+    pheromone = np.ones((20, 20))
+    route = list(range(20))
+    with tempfile.TemporaryDirectory() as path:
+        store = SolutionStore(path)
+        store.put('a', route, 1.0, 10, pheromone)
+        size = store.stats()['bytes']
+        store.max_bytes = 2 * size
+        store.put('b', route, 1.0, 10, pheromone)
+        store.get('a')
+        store.put('c', route, 1.0, 10, pheromone)
+        assert store.get('b') is None
+        assert store.get('a') is not None and store.get('c') is not None
+        store.close()
+
+
+def test_instance_key_ignores_budget_and_rng():
+    dist = coords_to_distance_matrix(random_coords(6, seed=0))
+    assert instance_key(dist, {'alpha': 1, 'n_iterations': 10, 'rng': 1}) == instance_key(dist, {'alpha': 1})
+    assert instance_key(dist, {'alpha': 1}) != instance_key(dist, {'alpha': 2})
+
+
+def test_decompose_is_valid_and_reproducible():
+    coords = np.random.default_rng(0).uniform(0, 100, (300, 2))
+    route, length = decompose_solve(coords, cluster_size=40, workers=1, seed=1)
+    again, _ = decompose_solve(coords, cluster_size=40, workers=1, seed=1)
+    assert sorted(route) == list(range(300))
+    assert np.array_equal(route, again)
+    assert np.isclose(length, route_distance(route, coords_to_distance_matrix(coords)))
+
+
+def test_improve_tour_never_lengthens():
+    coords = np.random.default_rng(3).uniform(0, 100, (200, 2))
+    dist = coords_to_distance_matrix(coords)
+    start = np.random.default_rng(4).permutation(200)
+    route = improve_tour(start, coords)
+    assert sorted(route) == list(range(200))
+    assert route_distance(route, dist) < 0.5 * route_distance(start, dist)
+
+
+if __name__ == '__main__':
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f'{name}: ok')
@@ -0,0 +1,152 @@
+"""
+Benchmark del PSO
+-----------------
+Barre funciones de referencia, dimensiones y tamaños de enjambre y mide para cada
+caso: tiempo total, evaluaciones por segundo, evaluaciones y tiempo hasta alcanzar
+el valor objetivo y (con `--memory`) el pico de memoria reservada.
+
+Escribe un informe JSON (metadatos del entorno + resultados) y un CSV con las
+mismas filas, de modo que dos ejecuciones se pueden comparar para detectar
+regresiones de rendimiento.
+
+Ejemplo:
+    python benchmark.py --functions sphere,ackley,rastrigin --dims 10,100,1000 \\
+        --particles 30,300 --iterations 200 --seeds 3 --out reports/pso_bench
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import time
+import tracemalloc
+
+import numpy as np
+
+from function import BENCHMARK_FUNCTIONS
+from history import HISTORY_NONE
+from pso import PSO
+from stopping import StopCriteria
+
+
+def _int_list(text: str) -> list[int]:
+    return [int(x) for x in text.split(",") if x]
+
+
+def run_case(name: str, dim: int, particles: int, iterations: int, seed: int, target: float,
+             stop_at_target: bool = False, memory: bool = False, topology: str = "gbest") -> dict:
+    """Ejecuta un caso del benchmark y devuelve sus métricas como diccionario."""
+    function = BENCHMARK_FUNCTIONS[name](dim)
+    reached = {}
+
+    def on_iteration(metrics):
+        if not reached and metrics.best_value <= target:
+            reached["evaluations"] = metrics.evaluations
+            reached["time"] = metrics.elapsed
+
+    swarm = PSO(topology=topology, rng=seed)
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    swarm.calculate_function(
+        particles, iterations, function, True,
+        history=HISTORY_NONE,
+        telemetry=on_iteration,
+        stop=StopCriteria(target_value=target) if stop_at_target else None,
+    )
+    elapsed = time.perf_counter() - start
+    peak = None
+    if memory:
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+
+    return {
+        "function": name,
+        "dim": dim,
+        "particles": particles,
+        "seed": seed,
+        "topology": topology,
+        "iterations": swarm.iterations_run,
+        "evaluations": swarm.evaluations,
+        "time_s": elapsed,
+        "evals_per_second": swarm.evaluations / elapsed if elapsed > 0 else 0.0,
+        "best_value": float(swarm.best_value),
+        "target": target,
+        "evals_to_target": reached.get("evaluations"),
+        "time_to_target_s": reached.get("time"),
+        "peak_memory_mb": peak,
+        "stop_reason": swarm.stop_reason,
+    }
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def write_reports(path: str, args: dict, results: list[dict]):
+    """Escribe `<path>.json` y `<path>.csv`."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path + ".json", "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "args": args, "results": results}, f, indent=2)
+    with open(path + ".csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0]))
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de escalabilidad del PSO")
+    parser.add_argument("--functions", default="sphere,ackley,griewank,schwefel,levy,rosenbrock,rastrigin",
+                        help=f"Lista separada por comas ({', '.join(BENCHMARK_FUNCTIONS)})")
+    parser.add_argument("--dims", type=_int_list, default=[10, 100, 1000])
+    parser.add_argument("--particles", type=_int_list, default=[30, 300])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seeds", type=int, default=3)
+    parser.add_argument("--target", type=float, default=1e-2, help="Valor objetivo para medir evaluaciones/tiempo hasta alcanzarlo")
+    parser.add_argument("--stop-at-target", action="store_true", help="Parar cada caso al alcanzar el objetivo")
+    parser.add_argument("--topology", default="gbest")
+    parser.add_argument("--memory", action="store_true", help="Medir el pico de memoria con tracemalloc (más lento)")
+    parser.add_argument("--out", default="pso_benchmark", help="Prefijo de los informes (.json y .csv)")
+    args = parser.parse_args()
+
+    functions = [f for f in args.functions.split(",") if f]
+    unknown = [f for f in functions if f not in BENCHMARK_FUNCTIONS]
+    if unknown:
+        parser.error(f"Funciones desconocidas: {unknown}")
+
+    results = []
+    print(f"{'función':<11}{'dim':>6}{'part.':>7}{'tiempo s':>10}{'eval/s':>12}{'mejor':>13}{'eval→obj':>10}")
+    for name in functions:
+        for dim in args.dims:
+            for particles in args.particles:
+                rows = [
+                    run_case(name, dim, particles, args.iterations, seed, args.target,
+                             args.stop_at_target, args.memory, args.topology)
+                    for seed in range(args.seeds)
+                ]
+                results.extend(rows)
+                hits = [r["evals_to_target"] for r in rows if r["evals_to_target"] is not None]
+                print(
+                    f"{name:<11}{dim:>6}{particles:>7}"
+                    f"{np.median([r['time_s'] for r in rows]):>10.3f}"
+                    f"{np.median([r['evals_per_second'] for r in rows]):>12.0f}"
+                    f"{np.median([r['best_value'] for r in rows]):>13.4g}"
+                    f"{(f'{np.median(hits):.0f}' if hits else '-'):>10}"
+                )
+
+    write_reports(args.out, vars(args), results)
+    print(f"Informes: {args.out}.json, {args.out}.csv")
+
+
+if __name__ == "__main__":
+    main()
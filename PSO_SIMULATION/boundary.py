@@ -0,0 +1,66 @@
+"""
+Límites del espacio de búsqueda en el PSO
+-----------------------------------------
+Cuando la función objetivo declara límites por dimensión (`IFunction.set_bounds`),
+el PSO inicializa el enjambre dentro de ellos, limita la velocidad a una fracción
+del rango de cada dimensión y, tras mover las partículas, aplica una política de
+frontera a las coordenadas que se salen (todo vectorizado sobre el enjambre):
+
+- `clip`: la coordenada se lleva al límite y la velocidad se conserva.
+- `absorb`: la coordenada se lleva al límite y esa componente de la velocidad se anula.
+- `reflect`: la coordenada se refleja dentro del dominio y esa componente de la
+  velocidad cambia de signo.
+- `random`: la coordenada se reinicia al azar dentro del dominio y esa componente
+  de la velocidad se anula.
+"""
+
+import numpy as np
+
+BOUNDARY_CLIP = "clip"
+BOUNDARY_ABSORB = "absorb"
+BOUNDARY_REFLECT = "reflect"
+BOUNDARY_RANDOM = "random"
+BOUNDARY_POLICIES = (BOUNDARY_CLIP, BOUNDARY_ABSORB, BOUNDARY_REFLECT, BOUNDARY_RANDOM)
+
+
+def clamp_velocity(velocities: np.ndarray, vmax: np.ndarray) -> np.ndarray:
+    """Limita cada componente de la velocidad a `[-vmax, vmax]` (por dimensión)."""
+    return np.clip(velocities, -vmax, vmax)
+
+
+def apply_boundary(
+    policy: str,
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    rng: np.random.Generator | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Devuelve `(positions, velocities)` con la política `policy` aplicada a las
+    coordenadas fuera de `[lower, upper]`. No modifica los arrays de entrada.
+    `rng` es el generador de la política `random` (uno nuevo si es `None`).
+    """
+    outside = (positions < lower) | (positions > upper)
+    if not outside.any():
+        return positions, velocities
+    velocities = velocities.copy()
+    if policy == BOUNDARY_CLIP:
+        positions = np.clip(positions, lower, upper)
+    elif policy == BOUNDARY_ABSORB:
+        positions = np.clip(positions, lower, upper)
+        velocities[outside] = 0.0
+    elif policy == BOUNDARY_REFLECT:
+        # reflexión repetida (por si el salto es mayor que el dominio): periodo 2 * ancho
+        width = upper - lower
+        offset = np.mod(positions - lower, 2 * width)
+        positions = lower + np.where(offset > width, 2 * width - offset, offset)
+        velocities[outside] = -velocities[outside]
+    elif policy == BOUNDARY_RANDOM:
+        rng = rng if rng is not None else np.random.default_rng()
+        fresh = rng.uniform(lower, upper, size=positions.shape)
+        positions = np.where(outside, fresh, positions)
+        velocities[outside] = 0.0
+    else:
+        raise ValueError(f"Política de frontera desconocida: {policy!r} (opciones: {BOUNDARY_POLICIES})")
+    return positions, velocities
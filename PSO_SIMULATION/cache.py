@@ -0,0 +1,180 @@
+"""
+Caché de evaluaciones de la función objetivo
+--------------------------------------------
+Cerca de la convergencia muchas partículas vuelven a evaluar casi la misma
+posición. `CachedFunction` envuelve una `IFunction` costosa y memoriza sus
+resultados:
+
+- Las posiciones se cuantizan a una rejilla de paso `tolerance` por dimensión;
+  dos posiciones en la misma celda comparten resultado (el de la primera que se
+  evaluó), así que los resultados solo cambian dentro de esa tolerancia.
+- Los resultados se guardan en una caché LRU acotada a `max_size` entradas.
+- `evaluate(X)` busca todo el lote de una vez: elimina del lote los aciertos y
+  las filas repetidas y solo envía las posiciones nuevas a la función envuelta.
+
+`stats()` informa de aciertos, fallos, tasa de aciertos y tamaño; los fallos son
+las evaluaciones reales de la función envuelta.
+
+La caché vive en el proceso que la consulta. Con el evaluador paralelo, el PSO
+la consulta en el proceso principal y solo reparte las celdas nuevas, con la
+función envuelta (`PSO.evaluate`, `PSO.submit_particle`). Así sirve también con
+`executor="process"`. Si se envía la propia `CachedFunction` a un pool de procesos,
+cada tarea recibe una copia y lo que aprende se pierde.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from function import IFunction
+
+
+class CachedFunction(IFunction):
+    """
+    Envoltorio con caché LRU para una `IFunction`.
+
+    Args:
+        function (IFunction): Función objetivo envuelta.
+        tolerance (float): Paso de cuantización por dimensión.
+        max_size (int): Entradas máximas de la caché.
+    """
+
+    def __init__(self, function: IFunction, tolerance: float = 1e-8, max_size: int = 100_000):
+        if tolerance <= 0:
+            raise ValueError("tolerance debe ser positiva")
+        self.function: IFunction = function
+        self.tolerance: float = tolerance
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._cache: OrderedDict[bytes, float] = OrderedDict()
+        self._lock = threading.RLock()
+        # la implementación por defecto de `evaluate` escribe en `variables`: no es reentrante
+        self._serialize: bool = type(function).evaluate is IFunction.evaluate
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def vector_size(self) -> int:
+        return self.function.vector_size
+
+    @vector_size.setter
+    def vector_size(self, val):
+        self.function.vector_size = val
+
+    @property
+    def variables(self) -> list[float]:
+        return self.function.variables
+
+    @variables.setter
+    def variables(self, val):
+        self.function.variables = val
+
+    @property
+    def bounds(self):
+        return self.function.bounds
+
+    @bounds.setter
+    def bounds(self, val):
+        self.function.bounds = val
+
+    def execute(self) -> float:
+        """Evalúa (con caché) el vector actual de `variables`."""
+        return float(self.evaluate(np.array(self.variables, dtype=float))[0])
+
+    def evaluate(self, X: np.ndarray, evaluate=None) -> np.ndarray:
+        """
+        Evalúa las filas de `X`; solo las celdas que no están en la caché (sin repetir)
+        se envían a la función envuelta, o a `evaluate(filas)` si se indica (el PSO lo
+        usa para repartirlas en su evaluador paralelo).
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        unique, first, inverse = np.unique(self.cells(X), axis=0, return_index=True, return_inverse=True)
+        keys = [row.tobytes() for row in unique]
+        values = np.empty(len(unique))
+        missing = []
+        with self._lock:
+            for k, key in enumerate(keys):
+                value = self._cache.get(key)
+                if value is None:
+                    missing.append(k)
+                else:
+                    self._cache.move_to_end(key)
+                    values[k] = value
+            self.misses += len(missing)
+            self.hits += len(X) - len(missing)
+
+        if missing:
+            rows = X[first[missing]]
+            if evaluate is not None:
+                computed = np.asarray(evaluate(rows), dtype=float)
+            elif self._serialize:
+                with self._lock:
+                    computed = np.asarray(self.function.evaluate(rows), dtype=float)
+            else:
+                computed = np.asarray(self.function.evaluate(rows), dtype=float)
+            values[missing] = computed
+            self._store([keys[k] for k in missing], computed)
+        return values[inverse.reshape(-1)]
+
+    def cells(self, X: np.ndarray) -> np.ndarray:
+        """
+        Celda de cada fila de `X` como float64 redondeado. Un cast a entero desbordaría
+        con |x| / tolerance > 2^63 y mezclaría puntos distintos en la misma celda.
+        """
+        # + 0.0 convierte -0.0 en 0.0, para que ambos den la misma clave
+        return np.round(np.asarray(X, dtype=float) / self.tolerance) + 0.0
+
+    def lookup(self, x: np.ndarray) -> float | None:
+        """Valor en caché del punto `x` (cuenta como acierto o fallo), o None."""
+        key = self.cells(x).tobytes()
+        with self._lock:
+            value = self._cache.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def store(self, x: np.ndarray, value: float):
+        """Guarda el valor del punto `x`, evaluado fuera de la caché tras un `lookup` fallido."""
+        self._store([self.cells(x).tobytes()], [value])
+
+    def _store(self, keys: list[bytes], values):
+        with self._lock:
+            for key, value in zip(keys, values):
+                self._cache[key] = float(value)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def stats(self) -> dict:
+        """Aciertos, fallos (evaluaciones reales), tasa de aciertos y tamaño de la caché."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._cache),
+            "max_size": self.max_size,
+        }
+
+    def clear(self):
+        """Vacía la caché y reinicia las estadísticas."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+    def obtain_array_vector(self) -> list[float]:
+        return self.function.obtain_array_vector()
+
+    def initialize_vector(self):
+        self.function.initialize_vector()
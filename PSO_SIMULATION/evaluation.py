@@ -0,0 +1,99 @@
+"""
+Evaluación paralela de la función objetivo
+------------------------------------------
+`ParallelEvaluator` reparte la evaluación del enjambre en un ejecutor de
+`concurrent.futures` (hilos, procesos o uno propio del usuario). Sirve para los
+dos modos del PSO:
+
+- `sync`: cada iteración el enjambre completo se divide en bloques que se evalúan
+  en paralelo con `IFunction.evaluate` (`ParallelEvaluator.evaluate`).
+- `async` (estado estacionario): cada partícula se evalúa por separado
+  (`ParallelEvaluator.submit`) y el PSO actualiza pbest/gbest en cuanto llega
+  cada resultado, sin esperar a las evaluaciones más lentas.
+
+Los hilos convienen si la función libera el GIL (NumPy, E/S, procesos externos);
+para objetivos en Python puro conviene `"process"` (la función debe poder
+serializarse con pickle).
+"""
+
+import copy
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from function import IFunction
+
+EVAL_SYNC = "sync"
+EVAL_ASYNC = "async"
+EVAL_MODES = (EVAL_SYNC, EVAL_ASYNC)
+
+_local = threading.local()
+
+
+def _evaluate_rows(function: IFunction, X: np.ndarray) -> np.ndarray:
+    return np.asarray(function.evaluate(X), dtype=float)
+
+
+def _evaluate_rows_threaded(function: IFunction, X: np.ndarray) -> np.ndarray:
+    # La implementación por defecto de `evaluate` escribe en `function.variables`;
+    # cada hilo usa su propia copia para no pisarse con los demás.
+    if type(function).evaluate is IFunction.evaluate:
+        copies = getattr(_local, "functions", None)
+        if copies is None:
+            copies = _local.functions = {}
+        entry = copies.get(id(function))
+        if entry is None or entry[0] is not function:
+            entry = copies[id(function)] = (function, copy.deepcopy(function))
+        function = entry[1]
+    return _evaluate_rows(function, X)
+
+
+class ParallelEvaluator:
+    """
+    Evalúa una `IFunction` sobre un ejecutor de `concurrent.futures`.
+
+    Args:
+        executor (str | Executor): `"thread"`, `"process"` o un `Executor` ya creado
+            (que no se cierra en `shutdown`).
+        workers (int | None): Trabajadores del pool creado (por defecto `os.cpu_count()`).
+    """
+
+    def __init__(self, executor: str | Executor = "thread", workers: int | None = None):
+        self.workers: int = workers or os.cpu_count() or 1
+        self._owned: bool = not isinstance(executor, Executor)
+        self._task = _evaluate_rows
+        if executor == "thread":
+            self.executor: Executor = ThreadPoolExecutor(max_workers=self.workers)
+            self._task = _evaluate_rows_threaded
+        elif executor == "process":
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        elif isinstance(executor, Executor):
+            self.executor = executor
+            if isinstance(executor, ThreadPoolExecutor):
+                self._task = _evaluate_rows_threaded
+        else:
+            raise ValueError(f"Ejecutor desconocido: {executor!r} (opciones: 'thread', 'process' o un Executor)")
+
+    def evaluate(self, function: IFunction, X: np.ndarray) -> np.ndarray:
+        """Evalúa todas las filas de `X` repartidas en un bloque por trabajador."""
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        blocks = np.array_split(X, min(self.workers, len(X)))
+        futures = [self.executor.submit(self._task, function, block) for block in blocks]
+        return np.concatenate([f.result() for f in futures])
+
+    def submit(self, function: IFunction, x: np.ndarray) -> Future:
+        """Lanza la evaluación de un único punto; el futuro devuelve un array de un valor."""
+        return self.executor.submit(self._task, function, np.array(x, dtype=float, ndmin=2))
+
+    def shutdown(self):
+        """Cierra el pool si lo creó este evaluador."""
+        if self._owned:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
@@ -0,0 +1,285 @@
+"""
+Estudios de parámetros del PSO
+------------------------------
+Ejecuta una rejilla (o una muestra aleatoria) de configuraciones del PSO ×
+funciones × dimensiones × semillas en un pool de procesos y resume los
+resultados por (configuración, función, dimensión): mediana y rango
+intercuartílico del mejor valor, tasa de éxito (mejor valor <= objetivo) y
+evaluaciones hasta el objetivo.
+
+Cada celda terminada se añade a un fichero de checkpoint JSONL; al relanzar el
+mismo estudio con el mismo checkpoint solo se ejecutan las celdas que faltan.
+Cada celda guarda su trayectoria (evaluaciones, mejor valor) en cada mejora, y
+las evaluaciones hasta el objetivo se calculan al resumir. Así un checkpoint
+sirve para cualquier `--target`.
+
+Claves de configuración reconocidas:
+- de `PSO(...)`: c1, c2, w_max, w_min, topology, neighbours, boundary, velocity_clamp.
+- de la ejecución: particles, iterations, constriction.
+
+Ejemplo (rejilla):
+    python experiments.py --grid c1=1.5,2.05 c2=1.5,2.05 topology=gbest,von_neumann \\
+        --functions rastrigin,ackley --dims 10 --seeds 10 --checkpoint study.jsonl --out study.csv
+
+Ejemplo (muestra aleatoria de 20 configuraciones):
+    python experiments.py --sample 20 --grid c1=0.5:2.5 c2=0.5:2.5 w_max=0.6:1.0 ...
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from function import BENCHMARK_FUNCTIONS
+from history import HISTORY_NONE
+from pso import PSO
+
+PSO_KEYS = ("c1", "c2", "w_max", "w_min", "topology", "neighbours", "boundary", "velocity_clamp")
+RUN_DEFAULTS = {"particles": 30, "iterations": 200, "constriction": False}
+
+
+def grid_configs(space: dict[str, list]) -> list[dict]:
+    """Producto cartesiano de los valores de cada parámetro."""
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[n] for n in names))]
+
+
+def sample_configs(space: dict, n: int, seed: int = 0) -> list[dict]:
+    """
+    `n` configuraciones aleatorias: los parámetros con rango `(low, high)` se
+    muestrean uniformemente y los que tienen una lista de valores, al azar entre ellos.
+    """
+    rng = np.random.default_rng(seed)
+    configs = []
+    for _ in range(n):
+        config = {}
+        for name, values in space.items():
+            if isinstance(values, tuple):
+                config[name] = float(rng.uniform(*values))
+            else:
+                config[name] = values[int(rng.integers(len(values)))]
+        configs.append(config)
+    return configs
+
+
+def cell_key(config: dict, function: str, dim: int, seed: int) -> str:
+    return json.dumps([config, function, dim, seed], sort_keys=True)
+
+
+def run_cell(config: dict, function: str, dim: int, seed: int) -> dict:
+    """Ejecuta una celda del estudio (en un proceso de trabajo) y devuelve su resultado."""
+    run = {**RUN_DEFAULTS, **{k: v for k, v in config.items() if k not in PSO_KEYS}}
+    trajectory = []
+
+    def on_iteration(metrics):
+        if not trajectory or metrics.best_value < trajectory[-1][1]:
+            trajectory.append([metrics.evaluations, float(metrics.best_value)])
+
+    swarm = PSO(**{k: v for k, v in config.items() if k in PSO_KEYS}, rng=seed)
+    start = time.perf_counter()
+    swarm.calculate_function(
+        int(run["particles"]), int(run["iterations"]), BENCHMARK_FUNCTIONS[function](dim),
+        bool(run["constriction"]), history=HISTORY_NONE, telemetry=on_iteration,
+    )
+    return {
+        "key": cell_key(config, function, dim, seed),
+        "config": config,
+        "function": function,
+        "dim": dim,
+        "seed": seed,
+        "best_value": float(swarm.best_value),
+        "evaluations": swarm.evaluations,
+        "trajectory": trajectory,
+        "time_s": time.perf_counter() - start,
+    }
+
+
+def load_checkpoint(path: str | None) -> dict[str, dict]:
+    """Resultados ya terminados del checkpoint, indexados por celda."""
+    done = {}
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    result = json.loads(line)
+                except json.JSONDecodeError:
+                    # última línea a medio escribir si el estudio se interrumpió
+                    continue
+                # los checkpoints sin trayectoria (formato anterior) se vuelven a ejecutar
+                if "trajectory" in result:
+                    done[result["key"]] = result
+    return done
+
+
+def evals_to_target(result: dict, target: float) -> int | None:
+    """Evaluaciones hasta que el mejor valor de la celda alcanzó `target` (None si no lo alcanzó)."""
+    for evaluations, best_value in result["trajectory"]:
+        if best_value <= target:
+            return evaluations
+    return None
+
+
+def run_study(
+    configs: list[dict],
+    functions: list[str],
+    dims: list[int],
+    seeds: int,
+    checkpoint: str | None = None,
+    workers: int | None = None,
+    callback=None,
+) -> list[dict]:
+    """
+    Ejecuta todas las celdas pendientes y devuelve los resultados de todo el estudio.
+
+    Args:
+        configs (list[dict]): Configuraciones (ver claves reconocidas en el módulo).
+        functions (list[str]): Nombres de `BENCHMARK_FUNCTIONS`.
+        dims (list[int]): Dimensiones.
+        seeds (int): Semillas por celda (0..seeds-1, comunes a todas las configuraciones).
+        checkpoint (str | None): Fichero JSONL de checkpoint.
+        workers (int | None): Procesos de trabajo (0 ejecuta en este proceso).
+        callback (Callable[[dict, int, int], None] | None): `callback(result, hechas, total)`.
+    """
+    done = load_checkpoint(checkpoint)
+    cells = [
+        (config, function, dim, seed)
+        for config in configs for function in functions for dim in dims for seed in range(seeds)
+    ]
+    keys = [cell_key(*cell) for cell in cells]
+    pending = [cell for cell, key in zip(cells, keys) if key not in done]
+    total, finished = len(cells), len(cells) - len(pending)
+
+    out = open(checkpoint, "a", encoding="utf-8") if checkpoint else None
+    try:
+        def store(result):
+            nonlocal finished
+            done[result["key"]] = result
+            finished += 1
+            if out is not None:
+                out.write(json.dumps(result) + "\n")
+                out.flush()
+            if callback is not None:
+                callback(result, finished, total)
+
+        if workers == 0:
+            for cell in pending:
+                store(run_cell(*cell))
+        elif pending:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(run_cell, *cell) for cell in pending]
+                for future in as_completed(futures):
+                    store(future.result())
+    finally:
+        if out is not None:
+            out.close()
+    return [done[key] for key in keys]
+
+
+def aggregate(results: list[dict], target: float) -> list[dict]:
+    """Resumen por (configuración, función, dimensión), ordenado por mediana del mejor valor."""
+    groups: dict[str, list[dict]] = {}
+    for result in results:
+        key = json.dumps([result["config"], result["function"], result["dim"]], sort_keys=True)
+        groups.setdefault(key, []).append(result)
+    rows = []
+    for group in groups.values():
+        best = np.array([r["best_value"] for r in group])
+        hits = [e for e in (evals_to_target(r, target) for r in group) if e is not None]
+        q25, median, q75 = np.percentile(best, [25, 50, 75])
+        first = group[0]
+        rows.append({
+            **first["config"],
+            "function": first["function"],
+            "dim": first["dim"],
+            "runs": len(group),
+            "median": float(median),
+            "iqr": float(q75 - q25),
+            "success_rate": float(np.mean(best <= target)),
+            "median_evals_to_target": float(np.median(hits)) if hits else None,
+            "mean_time_s": float(np.mean([r["time_s"] for r in group])),
+        })
+    rows.sort(key=lambda r: (r["function"], r["dim"], -r["success_rate"], r["median"]))
+    return rows
+
+
+def _parse_value(text: str):
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return {"true": True, "false": False}.get(text.lower(), text)
+
+
+def _parse_space(items: list[str]) -> dict:
+    """`nombre=v1,v2,...` (lista de valores) o `nombre=low:high` (rango para muestreo)."""
+    space = {}
+    for item in items:
+        name, _, values = item.partition("=")
+        if ":" in values:
+            low, high = values.split(":")
+            space[name] = (float(low), float(high))
+        else:
+            space[name] = [_parse_value(v) for v in values.split(",")]
+    return space
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estudio de parámetros del PSO (rejilla o muestra aleatoria)")
+    parser.add_argument("--grid", nargs="+", default=["c1=1.5,2.05", "c2=1.5,2.05"],
+                        help="Parámetros: nombre=v1,v2 (valores) o nombre=low:high (rango, con --sample)")
+    parser.add_argument("--sample", type=int, default=0, help="Número de configuraciones aleatorias (0 = rejilla)")
+    parser.add_argument("--functions", default="rastrigin")
+    parser.add_argument("--dims", default="10")
+    parser.add_argument("--seeds", type=int, default=10)
+    parser.add_argument("--target", type=float, default=1e-2)
+    parser.add_argument("--checkpoint", default="study.jsonl")
+    parser.add_argument("--out", default="study_summary.csv")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    space = _parse_space(args.grid)
+    if args.sample:
+        configs = sample_configs(space, args.sample)
+    else:
+        if any(isinstance(v, tuple) for v in space.values()):
+            parser.error("Los rangos low:high solo se admiten con --sample")
+        configs = grid_configs(space)
+    functions = [f for f in args.functions.split(",") if f]
+    unknown = [f for f in functions if f not in BENCHMARK_FUNCTIONS]
+    if unknown:
+        parser.error(f"Funciones desconocidas: {unknown}")
+    dims = [int(d) for d in args.dims.split(",") if d]
+
+    def progress(result, finished, total):
+        print(f"[{finished}/{total}] {result['function']} d={result['dim']} seed={result['seed']} "
+              f"{result['config']} -> {result['best_value']:.4g}")
+
+    results = run_study(configs, functions, dims, args.seeds,
+                        checkpoint=args.checkpoint, workers=args.workers, callback=progress)
+    rows = aggregate(results, args.target)
+    with open(args.out, "w", newline="", encoding="utf-8") as f:
+        fieldnames = list(dict.fromkeys(k for row in rows for k in row))
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    print(f"\n{'configuración':<60} {'función':<12}{'dim':>5}{'mediana':>12}{'IQR':>11}{'éxito':>7}{'eval→obj':>10}")
+    for row in rows:
+        config = {k: v for k, v in row.items() if k in space}
+        evals = row["median_evals_to_target"]
+        print(f"{json.dumps(config):<60} {row['function']:<12}{row['dim']:>5}{row['median']:>12.4g}"
+              f"{row['iqr']:>11.3g}{row['success_rate']:>7.0%}{(f'{evals:.0f}' if evals else '-'):>10}")
+    print(f"\nResumen: {args.out}  Checkpoint: {args.checkpoint}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,15 @@ Módulo de funciones objetivo para PSO
 --------------------------------------
 Este archivo define una interfaz abstracta `IFunction` y varias implementaciones
 concretas (funciones cuadrática, Rosenbrock, y Rastrigin), además de utilidades
-como `Variable`, `BoundedVariable` y `VectorResult`.
+como `Variable`, `BoundedVariable`, `VectorResult` y `ScalarFunctionAdapter`.
+
+Para pruebas de rendimiento incluye también funciones de referencia
+n-dimensionales (Sphere, Ackley, Griewank, Schwefel, Levy y Rosenbrock
+n-dimensional) con su dominio habitual declarado como límites.
+
+Además de la evaluación escalar (`execute`), toda `IFunction` ofrece la evaluación
+por lotes `evaluate(X)` sobre una matriz `(m, vector_size)`; las funciones
+incorporadas la implementan vectorizada con NumPy.
 
 Las clases poseen documentación detallada para facilitar su comprensión.
 """
@@ -22,8 +30,18 @@ class IFunction(ABC):
     - Una lista de variables (`variables`)
     - Un método de ejecución (`execute`) que calcule el valor de la función
     - Métodos para inicializar y obtener el vector de variables
+
+    El método `evaluate` (evaluación por lotes) tiene una implementación por defecto
+    basada en `execute`, de modo que las funciones que solo definen la versión
+    escalar siguen funcionando; las subclases pueden sobrescribirlo vectorizado.
+
+    Opcionalmente la función puede declarar límites por dimensión (`set_bounds`),
+    guardados como una lista de `BoundedVariable` en `bounds`; el PSO los usa para
+    inicializar el enjambre y mantenerlo dentro del dominio.
     """
 
+    bounds: list["BoundedVariable"] | None = None
+
     @property
     @abstractmethod
     def vector_size(self) -> int:
@@ -53,6 +71,47 @@ class IFunction(ABC):
         """Ejecuta la función objetivo con los valores actuales del vector y retorna su resultado."""
         pass
 
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        """
+        Evalúa la función en cada fila de `X` (forma `(m, vector_size)`) y retorna `m` valores.
+
+        Implementación por defecto (adaptador escalar): copia cada fila en `variables`
+        y llama a `execute()`.
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        values = np.empty(len(X))
+        for k, row in enumerate(X):
+            for i in range(self.vector_size):
+                self.variables[i] = row[i]
+            values[k] = self.execute()
+        return values
+
+    def set_bounds(self, lower, upper) -> "IFunction":
+        """
+        Declara límites por dimensión.
+
+        Args:
+            lower (float | Sequence[float]): Límite inferior (uno común o uno por dimensión).
+            upper (float | Sequence[float]): Límite superior (uno común o uno por dimensión).
+
+        Returns:
+            IFunction: La propia función, para encadenar (`RastriginFunction(10, 2).set_bounds(-5.12, 5.12)`).
+        """
+        lower = np.broadcast_to(np.asarray(lower, dtype=float), (self.vector_size,))
+        upper = np.broadcast_to(np.asarray(upper, dtype=float), (self.vector_size,))
+        if np.any(lower >= upper):
+            raise ValueError("Cada límite inferior debe ser menor que el superior")
+        self.bounds = [BoundedVariable((lo + up) / 2, lo, up) for lo, up in zip(lower, upper)]
+        return self
+
+    def bounds_arrays(self) -> tuple[np.ndarray, np.ndarray] | None:
+        """Límites como arrays `(lower, upper)` de forma `(vector_size,)`, o None si no hay."""
+        if not self.bounds:
+            return None
+        lower = np.array([b.min_value for b in self.bounds], dtype=float)
+        upper = np.array([b.max_value for b in self.bounds], dtype=float)
+        return lower, upper
+
     @abstractmethod
     def obtain_array_vector(self) -> list[float]:
         """Retorna un vector del mismo tamaño que `variables`, inicializado en ceros."""
@@ -121,6 +180,11 @@ class QuadraticFunction(IFunction):
         y = self.variables[1]
         return self.a * (x - self.b) ** 2 + self.c * (y - self.d) ** 2
 
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        """Evaluación vectorizada sobre las filas de `X`."""
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        return self.a * (X[:, 0] - self.b) ** 2 + self.c * (X[:, 1] - self.d) ** 2
+
     def add_variable(self, variable: float):
         """Agrega una variable adicional (no utilizada en esta función)."""
         self.variables.append(variable)
@@ -173,6 +237,12 @@ class RosenbrockFunction(IFunction):
         y = self.variables[1]
         return self.a * (self.b - x) ** 2 + (y - x ** 2) ** 2
 
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        """Evaluación vectorizada sobre las filas de `X`."""
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        x, y = X[:, 0], X[:, 1]
+        return self.a * (self.b - x) ** 2 + (y - x ** 2) ** 2
+
     def add_variable(self, variable: float):
         self.variables.append(variable)
 
@@ -225,6 +295,11 @@ class RastriginFunction(IFunction):
             sumatory += x_i ** 2 - self.A * math.cos(2 * math.pi * x_i)
         return self.A * self.n + sumatory
 
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        """Evaluación vectorizada sobre las filas de `X`."""
+        X = np.atleast_2d(np.asarray(X, dtype=float))[:, : self.n]
+        return self.A * self.n + np.sum(X ** 2 - self.A * np.cos(2 * np.pi * X), axis=1)
+
     def add_variable(self, variable: float):
         self.variables.append(variable)
 
@@ -232,6 +307,224 @@ class RastriginFunction(IFunction):
         return [0 for _ in self.variables]
 
 
+class BenchmarkFunction(IFunction):
+    """
+    Base de las funciones de referencia n-dimensionales.
+
+    Las subclases definen `evaluate` (vectorizado), `domain` (límites habituales,
+    que se declaran con `set_bounds`) y `optimum` (valor mínimo global); `execute`
+    evalúa el vector `variables` a través de `evaluate`.
+
+    Args:
+        n (int): Dimensión.
+    """
+
+    domain: tuple[float, float] = (-5.0, 5.0)
+    optimum: float = 0.0
+
+    def __init__(self, n: int):
+        self.n = n
+        self.variables = []
+        self.vector_size = n
+        self.initialize_vector()
+        self.set_bounds(*self.domain)
+
+    @property
+    def vector_size(self) -> int:
+        return self._vector_size
+
+    @vector_size.setter
+    def vector_size(self, val):
+        self._vector_size = val
+
+    @property
+    def variables(self) -> list[float]:
+        return self._variables
+
+    @variables.setter
+    def variables(self, val):
+        self._variables = val
+
+    def initialize_vector(self):
+        """Inicializa el vector con valores cero."""
+        for _ in range(self.vector_size):
+            self.variables.append(0)
+
+    def execute(self) -> float:
+        """Evalúa la función en los valores actuales de `variables`."""
+        return float(self.evaluate(np.array(self.variables, dtype=float))[0])
+
+    def obtain_array_vector(self) -> list[float]:
+        return [0 for _ in self.variables]
+
+
+class SphereFunction(BenchmarkFunction):
+    """
+    Función esfera: f(x) = Σ x_i^2. Unimodal; mínimo 0 en x = 0.
+    """
+
+    domain = (-5.12, 5.12)
+
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        return np.einsum("ij,ij->i", X, X)
+
+
+class AckleyFunction(BenchmarkFunction):
+    """
+    Función de Ackley:
+
+        f(x) = -20 exp(-0.2 sqrt(Σ x_i^2 / n)) - exp(Σ cos(2πx_i) / n) + 20 + e
+
+    Casi plana lejos del origen y con muchos mínimos locales; mínimo 0 en x = 0.
+    """
+
+    domain = (-32.768, 32.768)
+
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        n = X.shape[1]
+        square = np.einsum("ij,ij->i", X, X) / n
+        cosine = np.cos(2 * np.pi * X).sum(axis=1) / n
+        return -20 * np.exp(-0.2 * np.sqrt(square)) - np.exp(cosine) + 20 + math.e
+
+
+class GriewankFunction(BenchmarkFunction):
+    """
+    Función de Griewank: f(x) = 1 + Σ x_i^2 / 4000 - Π cos(x_i / sqrt(i)).
+    Mínimo 0 en x = 0.
+    """
+
+    domain = (-600.0, 600.0)
+
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        i = np.arange(1, X.shape[1] + 1)
+        return 1 + np.einsum("ij,ij->i", X, X) / 4000 - np.prod(np.cos(X / np.sqrt(i)), axis=1)
+
+
+class SchwefelFunction(BenchmarkFunction):
+    """
+    Función de Schwefel: f(x) = 418.9829 n - Σ x_i sin(sqrt(|x_i|)).
+    El mínimo global (0 en x_i ≈ 420.9687) está lejos del segundo mejor, en el borde del dominio.
+    """
+
+    domain = (-500.0, 500.0)
+
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        return 418.9828872724338 * X.shape[1] - np.sum(X * np.sin(np.sqrt(np.abs(X))), axis=1)
+
+
+class LevyFunction(BenchmarkFunction):
+    """
+    Función de Levy, con w_i = 1 + (x_i - 1) / 4:
+
+        f(x) = sin²(πw_1) + Σ_{i<n} (w_i - 1)² [1 + 10 sin²(πw_i + 1)] + (w_n - 1)² [1 + sin²(2πw_n)]
+
+    Mínimo 0 en x = 1.
+    """
+
+    domain = (-10.0, 10.0)
+
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        W = 1 + (X - 1) / 4
+        head = np.sin(np.pi * W[:, 0]) ** 2
+        body = np.sum((W[:, :-1] - 1) ** 2 * (1 + 10 * np.sin(np.pi * W[:, :-1] + 1) ** 2), axis=1)
+        tail = (W[:, -1] - 1) ** 2 * (1 + np.sin(2 * np.pi * W[:, -1]) ** 2)
+        return head + body + tail
+
+
+class RosenbrockNFunction(BenchmarkFunction):
+    """
+    Función de Rosenbrock n-dimensional:
+
+        f(x) = Σ_{i<n} [b (x_{i+1} - x_i^2)^2 + (a - x_i)^2]
+
+    Valle estrecho y curvo; mínimo 0 en x = (a, ..., a).
+
+    Args:
+        n (int): Dimensión (>= 2).
+        a (float), b (float): Parámetros (por defecto 1 y 100).
+    """
+
+    domain = (-5.0, 10.0)
+
+    def __init__(self, n: int, a: float = 1.0, b: float = 100.0):
+        self.a = a
+        self.b = b
+        super().__init__(n)
+
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        head, tail = X[:, :-1], X[:, 1:]
+        return np.sum(self.b * (tail - head ** 2) ** 2 + (self.a - head) ** 2, axis=1)
+
+
+BENCHMARK_FUNCTIONS = {
+    "sphere": SphereFunction,
+    "ackley": AckleyFunction,
+    "griewank": GriewankFunction,
+    "schwefel": SchwefelFunction,
+    "levy": LevyFunction,
+    "rosenbrock": RosenbrockNFunction,
+    "rastrigin": lambda n: RastriginFunction(10, n).set_bounds(-5.12, 5.12),
+}
+
+
+class ScalarFunctionAdapter(IFunction):
+    """
+    Adapta una función escalar de terceros `func(x: np.ndarray) -> float` a `IFunction`.
+
+    La evaluación por lotes llama a `func` fila a fila; sirve para usar con PSO
+    objetivos que no ofrecen versión vectorizada.
+
+    Args:
+        func (Callable[[np.ndarray], float]): Función objetivo escalar.
+        vector_size (int): Dimensión del vector de entrada.
+    """
+
+    def __init__(self, func, vector_size: int):
+        self.func = func
+        self.variables = []
+        self.vector_size = vector_size
+        self.initialize_vector()
+
+    @property
+    def vector_size(self) -> int:
+        return self._vector_size
+
+    @vector_size.setter
+    def vector_size(self, val):
+        self._vector_size = val
+
+    @property
+    def variables(self) -> list[float]:
+        return self._variables
+
+    @variables.setter
+    def variables(self, val):
+        self._variables = val
+
+    def initialize_vector(self):
+        """Inicializa el vector con valores cero."""
+        for _ in range(self.vector_size):
+            self.variables.append(0)
+
+    def execute(self) -> float:
+        """Evalúa la función envuelta en los valores actuales de `variables`."""
+        return float(self.func(np.array(self.variables, dtype=float)))
+
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        """Llama a la función envuelta en cada fila de `X`."""
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        return np.array([float(self.func(row)) for row in X])
+
+    def obtain_array_vector(self) -> list[float]:
+        return [0 for _ in self.variables]
+
+
 class BoundedVariable(Variable):
     """
     Variable con límites numéricos.
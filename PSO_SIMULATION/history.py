@@ -0,0 +1,180 @@
+"""
+Historial de ejecución del PSO
+------------------------------
+Guarda el estado del enjambre por iteración en arrays preasignados en lugar de
+crear objetos por partícula e iteración.
+
+Niveles disponibles:
+- `none`: no se guarda nada.
+- `summary`: por iteración solo gbest, mejor valor y diversidad.
+- `sampled`: resumen + estado completo del enjambre cada `sample_every` iteraciones.
+- `full`: resumen + estado completo del enjambre en todas las iteraciones,
+  en arrays `(iteraciones, partículas, dim)`.
+
+Los accesores `Particle.iterations` y `PSO.iterations` devuelven vistas perezosas
+(`ParticleIterationsView`, `IterationsView`) que construyen los objetos
+`ParticleIteration` / `Iteration` (y truncan los valores) solo al mostrarlos.
+"""
+
+import numpy as np
+
+HISTORY_NONE = "none"
+HISTORY_SUMMARY = "summary"
+HISTORY_SAMPLED = "sampled"
+HISTORY_FULL = "full"
+HISTORY_LEVELS = (HISTORY_NONE, HISTORY_SUMMARY, HISTORY_SAMPLED, HISTORY_FULL)
+
+
+def swarm_diversity(positions: np.ndarray) -> float:
+    """Distancia media de las partículas al centroide del enjambre (vectorizada)."""
+    if len(positions) == 0:
+        return 0.0
+    centroid = positions.mean(axis=0)
+    return float(np.linalg.norm(positions - centroid, axis=1).mean())
+
+
+class SwarmHistory:
+    """
+    Historial del enjambre respaldado por arrays.
+
+    Args:
+        level (str): Nivel de historial (ver `HISTORY_LEVELS`).
+        quantity_of_iterations (int): Iteraciones máximas de la ejecución.
+        quantity_of_particles (int): Partículas del enjambre.
+        dim (int): Dimensión del espacio de búsqueda.
+        sample_every (int): Periodo de muestreo para el nivel `sampled`.
+    """
+
+    def __init__(
+        self,
+        level: str,
+        quantity_of_iterations: int,
+        quantity_of_particles: int,
+        dim: int,
+        sample_every: int = 10,
+    ):
+        if level not in HISTORY_LEVELS:
+            raise ValueError(f"Nivel de historial desconocido: {level!r} (opciones: {HISTORY_LEVELS})")
+        self.level: str = level
+        self.sample_every: int = max(1, sample_every) if level == HISTORY_SAMPLED else 1
+        self.count: int = 0
+        iters = quantity_of_iterations if level != HISTORY_NONE else 0
+        self.gbest: np.ndarray = np.zeros((iters, dim))
+        self.best_value: np.ndarray = np.zeros(iters)
+        self.diversity: np.ndarray = np.zeros(iters)
+
+        # estado completo del enjambre (solo sampled/full)
+        snapshots = 0
+        if level == HISTORY_FULL:
+            snapshots = quantity_of_iterations
+        elif level == HISTORY_SAMPLED:
+            snapshots = -(-quantity_of_iterations // self.sample_every)
+        self.snapshot_count: int = 0
+        self.snapshot_iterations: np.ndarray = np.zeros(snapshots, dtype=int)
+        self.positions: np.ndarray = np.zeros((snapshots, quantity_of_particles, dim))
+        self.velocities: np.ndarray = np.zeros((snapshots, quantity_of_particles, dim))
+        self.pbests: np.ndarray = np.zeros((snapshots, quantity_of_particles, dim))
+
+    def record(self, iteration: int, positions, velocities, pbests, gbest, best_value, diversity):
+        """Guarda el estado de la iteración `iteration` (0-indexada) según el nivel."""
+        if self.level == HISTORY_NONE:
+            return
+        self.gbest[self.count] = gbest
+        self.best_value[self.count] = best_value
+        self.diversity[self.count] = diversity
+        self.count += 1
+        if len(self.positions) and iteration % self.sample_every == 0:
+            k = self.snapshot_count
+            self.snapshot_iterations[k] = iteration
+            self.positions[k] = positions
+            self.velocities[k] = velocities
+            self.pbests[k] = pbests
+            self.snapshot_count += 1
+
+    def particle_iterations(self, particle_id: int) -> "ParticleIterationsView":
+        return ParticleIterationsView(self, particle_id)
+
+    def iterations(self) -> "IterationsView":
+        return IterationsView(self)
+
+
+class ParticleIterationsView:
+    """Secuencia perezosa de `ParticleIteration` de una partícula (una por instantánea guardada)."""
+
+    def __init__(self, history: SwarmHistory, particle_id: int):
+        self.history = history
+        self.particle_id = particle_id
+
+    def __len__(self) -> int:
+        return self.history.snapshot_count
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[i] for i in range(*k.indices(len(self)))]
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError(k)
+        from pso import ParticleIteration
+
+        h, p = self.history, self.particle_id
+        item = ParticleIteration(h.pbests[k, p], h.positions[k, p], h.velocities[k, p])
+        item.iteration = int(h.snapshot_iterations[k]) + 1
+        return item
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
+
+
+class SnapshotParticlesView:
+    """Secuencia perezosa de `ParticleIteration` de todas las partículas en una iteración."""
+
+    def __init__(self, history: SwarmHistory, snapshot: int | None):
+        self.history = history
+        self.snapshot = snapshot
+
+    def __len__(self) -> int:
+        return 0 if self.snapshot is None else self.history.positions.shape[1]
+
+    def __getitem__(self, p: int):
+        if self.snapshot is None:
+            raise IndexError(p)
+        return ParticleIterationsView(self.history, p)[self.snapshot]
+
+    def __iter__(self):
+        for p in range(len(self)):
+            yield self[p]
+
+
+class IterationsView:
+    """Secuencia perezosa de `Iteration` (gbest y diversidad de cada iteración registrada)."""
+
+    def __init__(self, history: SwarmHistory):
+        self.history = history
+
+    def __len__(self) -> int:
+        return self.history.count
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[i] for i in range(*k.indices(len(self)))]
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError(k)
+        from pso import Iteration, trunc_vector
+
+        h = self.history
+        iteration = Iteration()
+        iteration.set_gbest(h.gbest[k])
+        iteration.diversity = float(trunc_vector(np.array([h.diversity[k]]))[0])
+        snapshot = None
+        if h.snapshot_count and k % h.sample_every == 0 and k // h.sample_every < h.snapshot_count:
+            snapshot = k // h.sample_every
+        iteration.particles_iterations = SnapshotParticlesView(h, snapshot)
+        return iteration
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
@@ -0,0 +1,277 @@
+"""
+Historial del PSO en disco
+--------------------------
+`HistoryWriter` escribe el estado del enjambre por iteración en ficheros `.npy`
+mapeados en memoria, agrupados en bloques de `chunk_size` iteraciones, más un
+`index.json` que describe el contenido. La memoria usada es la de un bloque,
+independientemente de la duración de la ejecución.
+
+`HistoryReader` abre ese directorio y pagina iteraciones y partículas de forma
+perezosa (`np.load(..., mmap_mode="r")`); ofrece la misma interfaz que
+`SwarmHistory`, así que `Particle.iterations` y `PSO.iterations` funcionan igual
+sobre un historial en disco y una ejecución puede analizarse o reproducirse
+después sin volver a calcularla.
+
+El índice se reescribe cada vez que se completa un bloque, así que un
+`HistoryReader` abierto durante la ejecución (en otro hilo o proceso) ve las
+iteraciones hasta el último bloque completado; `refresh()` relee el índice.
+
+Estructura del directorio:
+    index.json
+    gbest_00000.npy      (chunk, dim)              gbest por iteración
+    scalars_00000.npy    (chunk, 2)                mejor valor y diversidad
+    snapiter_00000.npy   (chunk,)                  iteración de cada instantánea
+    positions_00000.npy  (chunk, partículas, dim)  (igual velocities_ y pbests_)
+"""
+
+import json
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from history import (
+    HISTORY_FULL,
+    HISTORY_LEVELS,
+    HISTORY_NONE,
+    HISTORY_SAMPLED,
+    IterationsView,
+    ParticleIterationsView,
+)
+
+INDEX_FILE = "index.json"
+SNAPSHOT_FIELDS = ("positions", "velocities", "pbests")
+
+
+def _chunk_file(path: str, prefix: str, chunk: int) -> str:
+    return os.path.join(path, f"{prefix}_{chunk:05d}.npy")
+
+
+class HistoryWriter:
+    """
+    Escribe el historial del enjambre en bloques mapeados en memoria.
+
+    Args:
+        path (str): Directorio de salida (se crea si no existe).
+        level (str): Nivel de historial (ver `history.HISTORY_LEVELS`).
+        quantity_of_particles (int): Partículas del enjambre.
+        dim (int): Dimensión del espacio de búsqueda.
+        sample_every (int): Periodo de instantáneas en el nivel "sampled".
+        chunk_size (int): Iteraciones por bloque.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        level: str,
+        quantity_of_particles: int,
+        dim: int,
+        sample_every: int = 10,
+        chunk_size: int = 256,
+    ):
+        if level not in HISTORY_LEVELS:
+            raise ValueError(f"Nivel de historial desconocido: {level!r} (opciones: {HISTORY_LEVELS})")
+        os.makedirs(path, exist_ok=True)
+        self.path: str = path
+        self.level: str = level
+        self.n_particles: int = quantity_of_particles
+        self.dim: int = dim
+        self.sample_every: int = max(1, sample_every) if level == HISTORY_SAMPLED else 1
+        self.chunk_size: int = chunk_size
+        self.count: int = 0
+        self.snapshot_count: int = 0
+        self._summary: dict[str, np.ndarray] = {}
+        self._snapshot: dict[str, np.ndarray] = {}
+        self._write_index()
+
+    def _open_chunk(self, prefix: str, shape: tuple) -> np.ndarray:
+        chunk = (self.count if prefix in ("gbest", "scalars") else self.snapshot_count) // self.chunk_size
+        return np.lib.format.open_memmap(
+            _chunk_file(self.path, prefix, chunk), mode="w+", dtype=np.float64, shape=shape
+        )
+
+    def record(self, iteration: int, positions, velocities, pbests, gbest, best_value, diversity):
+        """Añade el estado de la iteración `iteration` (misma firma que `SwarmHistory.record`)."""
+        if self.level == HISTORY_NONE:
+            return
+        row = self.count % self.chunk_size
+        if row == 0:
+            self._flush(self._summary)
+            self._summary = {
+                "gbest": self._open_chunk("gbest", (self.chunk_size, self.dim)),
+                "scalars": self._open_chunk("scalars", (self.chunk_size, 2)),
+            }
+        self._summary["gbest"][row] = gbest
+        self._summary["scalars"][row] = (best_value, diversity)
+        self.count += 1
+        summary_complete = row == self.chunk_size - 1
+
+        if self.level in (HISTORY_SAMPLED, HISTORY_FULL) and iteration % self.sample_every == 0:
+            row = self.snapshot_count % self.chunk_size
+            if row == 0:
+                self._flush(self._snapshot)
+                shape = (self.chunk_size, self.n_particles, self.dim)
+                self._snapshot = {name: self._open_chunk(name, shape) for name in SNAPSHOT_FIELDS}
+                self._snapshot["snapiter"] = self._open_chunk("snapiter", (self.chunk_size,))
+            self._snapshot["positions"][row] = positions
+            self._snapshot["velocities"][row] = velocities
+            self._snapshot["pbests"][row] = pbests
+            self._snapshot["snapiter"][row] = iteration
+            self.snapshot_count += 1
+            if row == self.chunk_size - 1:
+                self._publish()
+        if summary_complete:
+            # bloque completo: dejarlo en disco y publicar el índice para los lectores
+            self._publish()
+
+    def _publish(self):
+        """Vuelca los bloques abiertos (sin cerrarlos) y reescribe el índice con lo escrito."""
+        for array in (*self._summary.values(), *self._snapshot.values()):
+            array.flush()
+        self._write_index()
+
+    def _flush(self, arrays: dict):
+        for array in arrays.values():
+            array.flush()
+        arrays.clear()
+
+    def _write_index(self):
+        index = {
+            "version": 1,
+            "level": self.level,
+            "sample_every": self.sample_every,
+            "n_particles": self.n_particles,
+            "dim": self.dim,
+            "chunk_size": self.chunk_size,
+            "count": self.count,
+            "snapshot_count": self.snapshot_count,
+        }
+        tmp = os.path.join(self.path, INDEX_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp, os.path.join(self.path, INDEX_FILE))
+
+    def close(self):
+        """Vuelca los bloques abiertos y escribe el índice definitivo."""
+        self._flush(self._summary)
+        self._flush(self._snapshot)
+        self._write_index()
+
+
+class ChunkedArray:
+    """
+    Array de solo lectura repartido en bloques `.npy`, abiertos bajo demanda con mmap.
+
+    Admite `len()`, `a[k]` y `a[k, p]` (y cualquier índice adicional sobre el bloque).
+    """
+
+    def __init__(self, path: str, prefix: str, count: int, chunk_size: int, max_open: int = 8):
+        self.path = path
+        self.prefix = prefix
+        self.count = count
+        self.chunk_size = chunk_size
+        self.max_open = max_open
+        self._open: OrderedDict[int, np.ndarray] = OrderedDict()
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def shape(self) -> tuple:
+        if self.count == 0:
+            return (0,)
+        return (self.count,) + self._chunk(0).shape[1:]
+
+    def _chunk(self, chunk: int) -> np.ndarray:
+        if chunk in self._open:
+            self._open.move_to_end(chunk)
+            return self._open[chunk]
+        array = np.load(_chunk_file(self.path, self.prefix, chunk), mmap_mode="r")
+        self._open[chunk] = array
+        if len(self._open) > self.max_open:
+            self._open.popitem(last=False)
+        return array
+
+    def __getitem__(self, key):
+        rest = ()
+        if isinstance(key, tuple):
+            key, rest = key[0], key[1:]
+        if isinstance(key, slice):
+            return np.stack([self[(k,) + rest] for k in range(*key.indices(self.count))])
+        if key < 0:
+            key += self.count
+        if not 0 <= key < self.count:
+            raise IndexError(key)
+        chunk, row = divmod(key, self.chunk_size)
+        return self._chunk(chunk)[(row,) + rest]
+
+
+class HistoryReader:
+    """
+    Lector perezoso de un historial escrito por `HistoryWriter`.
+
+    Expone la misma interfaz que `SwarmHistory` (`count`, `gbest`, `best_value`,
+    `diversity`, `positions`, `velocities`, `pbests`, `snapshot_iterations`,
+    `particle_iterations()`, `iterations()`), pero leyendo de disco.
+    """
+
+    def __init__(self, path: str):
+        index = self._read_index(path)
+        self.path: str = path
+        self.level: str = index["level"]
+        self.sample_every: int = index["sample_every"]
+        self.n_particles: int = index["n_particles"]
+        self.dim: int = index["dim"]
+        chunk = index["chunk_size"]
+        self.gbest = ChunkedArray(path, "gbest", 0, chunk)
+        self._scalars = ChunkedArray(path, "scalars", 0, chunk)
+        self.best_value = _Column(self._scalars, 0)
+        self.diversity = _Column(self._scalars, 1)
+        self.snapshot_iterations = ChunkedArray(path, "snapiter", 0, chunk)
+        self.positions = ChunkedArray(path, "positions", 0, chunk)
+        self.velocities = ChunkedArray(path, "velocities", 0, chunk)
+        self.pbests = ChunkedArray(path, "pbests", 0, chunk)
+        self._set_counts(index)
+
+    @staticmethod
+    def _read_index(path: str) -> dict:
+        with open(os.path.join(path, INDEX_FILE), encoding="utf-8") as f:
+            return json.load(f)
+
+    def _set_counts(self, index: dict):
+        self.count: int = index["count"]
+        self.snapshot_count: int = index["snapshot_count"]
+        self.gbest.count = self._scalars.count = self.count
+        for array in (self.snapshot_iterations, self.positions, self.velocities, self.pbests):
+            array.count = self.snapshot_count
+
+    def refresh(self):
+        """Relee el índice: durante la ejecución, incorpora los bloques publicados desde entonces."""
+        self._set_counts(self._read_index(self.path))
+
+    def particle_iterations(self, particle_id: int) -> ParticleIterationsView:
+        return ParticleIterationsView(self, particle_id)
+
+    def iterations(self) -> IterationsView:
+        return IterationsView(self)
+
+    def particle_trajectory(self, particle_id: int, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """Posiciones `(instantáneas, dim)` de una partícula entre `start` y `stop`."""
+        stop = self.snapshot_count if stop is None else min(stop, self.snapshot_count)
+        if start >= stop:
+            return np.empty((0, self.dim))
+        return self.positions[start:stop, particle_id]
+
+
+class _Column:
+    """Columna de un `ChunkedArray` 2-D indexable como un vector."""
+
+    def __init__(self, array: ChunkedArray, column: int):
+        self.array = array
+        self.column = column
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __getitem__(self, k):
+        return self.array[k, self.column]
@@ -0,0 +1,199 @@
+"""
+PSO multi-enjambre (modelo de islas)
+------------------------------------
+`MultiSwarm` ejecuta varios enjambres independientes, cada uno con su propio
+flujo aleatorio (`SeedSequence.spawn` de la semilla base) y sus propios parámetros (`c1`, `c2`, inercia, topología...), en procesos
+de trabajo. La ejecución avanza por épocas de `migration_interval` iteraciones:
+
+1. Cada isla ejecuta su época en paralelo (`_run_epoch`) y devuelve su estado.
+2. Migración en anillo: la isla `i` recibe los `migrants` mejores pbest de la
+   isla `i - 1`, que sustituyen a sus peores partículas.
+3. Las islas que llevan `restart_after` iteraciones sin mejorar su mejor valor
+   reinician su enjambre (conservando su mejor solución en `Island.best_*`).
+
+El mejor global se actualiza al final de cada época; cada vez que cambia se
+llama a `callback` (si se indica) y se añade a `MultiSwarm.improvements`.
+
+La función objetivo se envía a los procesos con pickle, así que debe poder
+serializarse (las funciones de `function.py` lo son).
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from function import IFunction
+from history import HISTORY_NONE, SwarmHistory
+from pso import PSO
+
+
+class Island:
+    """
+    Estado de una isla: su enjambre y su mejor solución histórica.
+
+    Args:
+        index (int): Posición de la isla en el anillo.
+        params (dict): Argumentos de `PSO(...)` de esta isla (c1, c2, w_max, w_min, topology...).
+            No puede incluir `rng`: el generador lo fija la semilla de la isla.
+        seed (np.random.SeedSequence): Semilla de la isla. El generador del enjambre
+            viaja con la isla al proceso de trabajo y vuelve con su estado, así que la
+            secuencia es la misma sea cual sea el proceso que ejecute cada época.
+    """
+
+    def __init__(self, index: int, params: dict, seed: np.random.SeedSequence):
+        if "rng" in params:
+            raise ValueError("Los parámetros de una isla no pueden incluir 'rng'; usa la semilla de MultiSwarm")
+        self.index: int = index
+        self.params: dict = params
+        self.seed: np.random.SeedSequence = seed
+        self.swarm: PSO = PSO(**params, rng=np.random.default_rng(seed))
+        self.best_value: float = float("inf")
+        self.best_position: np.ndarray | None = None
+        self.last_improvement: int = 0
+        self.restarts: int = 0
+        self.epoch: int = 0
+
+    def track(self, iteration: int):
+        """Actualiza la mejor solución de la isla con el gbest actual del enjambre."""
+        if self.swarm.best_value < self.best_value:
+            self.best_value = float(self.swarm.best_value)
+            self.best_position = self.swarm.gbest.copy()
+            self.last_improvement = iteration
+
+    def emigrants(self, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Los `k` mejores pbest del enjambre (posiciones y valores)."""
+        best = np.argsort(self.swarm.pbest_values)[:k]
+        return self.swarm.pbests[best].copy(), self.swarm.pbest_values[best].copy()
+
+
+def _run_epoch(
+    island: Island,
+    function: IFunction,
+    quantity_of_particles: int,
+    quantity_of_iterations: int,
+    start: int,
+    stop: int,
+    useConstrictionFactor: bool,
+    restart_after: int | None,
+) -> Island:
+    """Ejecuta las iteraciones `[start, stop)` de una isla (en un proceso de trabajo)."""
+    swarm = island.swarm
+    if start == 0:
+        swarm.set_parameters(quantity_of_particles, quantity_of_iterations)
+        swarm.set_bounds(function)
+        swarm.history = SwarmHistory(HISTORY_NONE, 0, quantity_of_particles, function.vector_size)
+        swarm.initialize_swarm(function)
+        island.track(0)
+    for i in range(start, stop):
+        swarm.step(i, function, useConstrictionFactor)
+        island.track(i)
+        if restart_after is not None and i - island.last_improvement >= restart_after and i + 1 < quantity_of_iterations:
+            swarm.initialize_swarm(function)
+            island.restarts += 1
+            island.last_improvement = i
+    island.epoch += 1
+    return island
+
+
+class MultiSwarm:
+    """
+    Ejecuta varios enjambres PSO en paralelo con migración y reinicios.
+
+    Args:
+        function (IFunction): Función objetivo (debe poder serializarse con pickle).
+        swarm_params (list[dict]): Parámetros de `PSO(...)` de cada isla (sin `rng`); su
+            longitud es el número de islas.
+        quantity_of_particles (int): Partículas por isla.
+        migration_interval (int): Iteraciones entre migraciones.
+        migrants (int): Partículas que migra cada isla a la siguiente.
+        restart_after (int | None): Iteraciones sin mejora tras las que una isla se reinicia.
+        useConstrictionFactor (bool): Si las islas usan el factor de constricción.
+        processes (int | None): Procesos de trabajo (0 ejecuta las islas en este proceso).
+        seed (int | None): Semilla base; cada isla recibe un flujo independiente derivado de ella.
+    """
+
+    def __init__(
+        self,
+        function: IFunction,
+        swarm_params: list[dict],
+        quantity_of_particles: int = 30,
+        migration_interval: int = 10,
+        migrants: int = 1,
+        restart_after: int | None = 50,
+        useConstrictionFactor: bool = False,
+        processes: int | None = None,
+        seed: int | None = None,
+    ):
+        if not swarm_params:
+            raise ValueError("Se necesita al menos una isla")
+        self.function: IFunction = function
+        self.quantity_of_particles: int = quantity_of_particles
+        self.migration_interval: int = max(1, migration_interval)
+        self.migrants: int = migrants
+        self.restart_after: int | None = restart_after
+        self.useConstrictionFactor: bool = useConstrictionFactor
+        self.processes: int | None = processes
+        seeds = np.random.SeedSequence(seed).spawn(len(swarm_params))
+        self.islands: list[Island] = [Island(i, dict(p), s) for i, (p, s) in enumerate(zip(swarm_params, seeds))]
+        self.gbest: np.ndarray | None = None
+        self.best_value: float = float("inf")
+        self.improvements: list[dict] = []
+
+    def run(self, quantity_of_iterations: int, callback=None) -> np.ndarray | None:
+        """
+        Ejecuta `quantity_of_iterations` iteraciones en cada isla.
+
+        Args:
+            quantity_of_iterations (int): Iteraciones por isla.
+            callback (Callable[[dict], None] | None): Se llama con
+                `{"iteration", "island", "best_value", "position"}` cada vez que mejora
+                el mejor global.
+
+        Returns:
+            np.ndarray | None: Mejor posición global encontrada.
+        """
+        pool = None
+        if self.processes != 0:
+            pool = ProcessPoolExecutor(max_workers=self.processes or min(len(self.islands), 61))
+        try:
+            for start in range(0, quantity_of_iterations, self.migration_interval):
+                stop = min(start + self.migration_interval, quantity_of_iterations)
+                args = (
+                    self.function, self.quantity_of_particles, quantity_of_iterations,
+                    start, stop, self.useConstrictionFactor, self.restart_after,
+                )
+                if pool is None:
+                    self.islands = [_run_epoch(island, *args) for island in self.islands]
+                else:
+                    self.islands = list(pool.map(_run_epoch, self.islands, *([a] * len(self.islands) for a in args)))
+                self._report(stop, callback)
+                if stop < quantity_of_iterations:
+                    self.migrate()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return self.gbest
+
+    def migrate(self):
+        """Migración en anillo: los mejores de la isla `i - 1` reemplazan a los peores de la `i`."""
+        if len(self.islands) < 2 or self.migrants <= 0:
+            return
+        outgoing = [island.emigrants(self.migrants) for island in self.islands]
+        for i, island in enumerate(self.islands):
+            positions, values = outgoing[i - 1]
+            island.swarm.receive_migrants(positions, values)
+
+    def _report(self, iteration: int, callback):
+        best = min(self.islands, key=lambda island: island.best_value)
+        if best.best_value < self.best_value:
+            self.best_value = best.best_value
+            self.gbest = best.best_position.copy()
+            event = {
+                "iteration": iteration,
+                "island": best.index,
+                "best_value": self.best_value,
+                "position": self.gbest.copy(),
+            }
+            self.improvements.append(event)
+            if callback is not None:
+                callback(event)
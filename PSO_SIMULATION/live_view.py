@@ -0,0 +1,268 @@
+"""
+Vista en vivo del enjambre
+--------------------------
+Animación de una ejecución del PSO para la interfaz gráfica sin frenar el cálculo:
+
+- `SnapshotSink` es un sumidero de telemetría que corre en el hilo del PSO. En cada
+  iteración solo añade el mejor valor y la diversidad a dos listas; como mucho
+  cada `min_interval` segundos publica una instantánea (copia de las dos primeras
+  coordenadas de, como máximo, `max_points` partículas). Solo se guarda la última
+  instantánea: si la interfaz va más lenta que el PSO, se salta instantáneas en
+  lugar de acumularlas.
+- `LiveSwarmView` dibuja en una figura de matplotlib embebida en Tk el enjambre
+  sobre el contorno de la función (calculado una sola vez y guardado en caché por
+  función y extensión) y las curvas de mejor valor y diversidad. El fondo se
+  renderiza una vez y cada fotograma solo redibuja los artistas animados (blitting).
+
+Para funciones de más de dos dimensiones el contorno es un corte por las dos
+primeras con el resto en el centro del dominio; con una dimensión se dibuja la
+curva de la función y las partículas sobre ella.
+"""
+
+import copy
+import time
+
+import numpy as np
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+from function import IFunction
+from telemetry import IterationMetrics, TelemetrySink
+
+CONTOUR_RESOLUTION = 150
+CURVE_POINTS = 2000
+
+_contour_cache: dict[tuple, tuple] = {}
+_CONTOUR_CACHE_SIZE = 16
+
+
+class SwarmSnapshot:
+    """Estado del enjambre publicado para la vista (posiciones ya diezmadas)."""
+
+    def __init__(self, iteration: int, positions: np.ndarray, gbest: np.ndarray, count: int, done: bool = False):
+        self.iteration: int = iteration
+        self.positions: np.ndarray = positions
+        self.gbest: np.ndarray = gbest
+        self.count: int = count
+        self.done: bool = done
+
+
+class SnapshotSink(TelemetrySink):
+    """
+    Publica instantáneas limitadas en frecuencia y tamaño del enjambre `swarm`.
+
+    Args:
+        swarm (PSO): Enjambre observado.
+        min_interval (float): Segundos mínimos entre instantáneas.
+        max_points (int): Partículas máximas por instantánea (se elige un
+            subconjunto fijo para que la animación sea coherente).
+    """
+
+    def __init__(self, swarm, min_interval: float = 0.05, max_points: int = 500):
+        self.swarm = swarm
+        self.min_interval: float = min_interval
+        self.max_points: int = max_points
+        self.best_values: list[float] = []
+        self.diversities: list[float] = []
+        self.latest: SwarmSnapshot | None = None
+        self._indices = None
+        self._last: float = float("-inf")
+
+    def on_start(self, info: dict):
+        self.best_values, self.diversities = [], []
+        self.latest, self._indices = None, None
+        self._last = float("-inf")
+
+    def on_iteration(self, metrics: IterationMetrics):
+        self.best_values.append(float(metrics.best_value))
+        self.diversities.append(float(metrics.diversity))
+        now = time.perf_counter()
+        if now - self._last >= self.min_interval:
+            self._last = now
+            self.publish(metrics.iteration, metrics.gbest)
+
+    def on_end(self, summary: dict):
+        self.publish(summary["iterations"] - 1, np.asarray(summary["gbest"]), done=True)
+
+    def publish(self, iteration: int, gbest: np.ndarray, done: bool = False):
+        positions = self.swarm.positions
+        if self._indices is None:
+            n = len(positions)
+            # generador propio: no altera la secuencia aleatoria del PSO
+            self._indices = (
+                np.sort(np.random.default_rng(0).choice(n, self.max_points, replace=False))
+                if n > self.max_points else slice(None)
+            )
+        self.latest = SwarmSnapshot(
+            iteration, positions[self._indices, :2].copy(), np.array(gbest[:2], dtype=float),
+            len(self.best_values), done,
+        )
+
+
+def function_key(function: IFunction) -> tuple:
+    """Identifica una función por su clase y sus parámetros numéricos."""
+    params = sorted(
+        (name, value) for name, value in vars(function).items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    )
+    return type(function).__name__, function.vector_size, tuple(params)
+
+
+def plot_extent(function: IFunction, positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Extensión de las dos primeras dimensiones: los límites de la función o, si no
+    tiene, el rango inicial del PSO ([0, 5]) ampliado para incluir `positions`.
+    """
+    bounds = function.bounds_arrays()
+    if bounds is not None:
+        return bounds[0][:2].copy(), bounds[1][:2].copy()
+    low = np.minimum(positions.min(axis=0), 0.0)
+    high = np.maximum(positions.max(axis=0), 5.0)
+    margin = 0.1 * (high - low)
+    return low - margin, high + margin
+
+
+def contour_grid(function: IFunction, low: np.ndarray, high: np.ndarray, resolution: int = CONTOUR_RESOLUTION):
+    """
+    Valores de la función en una rejilla sobre las dos primeras dimensiones (en caché).
+
+    Returns:
+        `(x, valores)` para funciones de una dimensión y `(x, y, Z)` para el resto.
+    """
+    key = (function_key(function), tuple(np.round(low, 6)), tuple(np.round(high, 6)), resolution)
+    if key in _contour_cache:
+        return _contour_cache[key]
+
+    # copia: la evaluación por defecto escribe en `variables` y el PSO usa la función en otro hilo
+    function = copy.deepcopy(function)
+    bounds = function.bounds_arrays()
+    center = (bounds[0] + bounds[1]) / 2 if bounds is not None else np.zeros(function.vector_size)
+    x = np.linspace(low[0], high[0], resolution)
+    if function.vector_size == 1:
+        grid = (x, np.asarray(function.evaluate(x[:, None]), dtype=float))
+    else:
+        y = np.linspace(low[1], high[1], resolution)
+        xx, yy = np.meshgrid(x, y)
+        X = np.tile(center, (xx.size, 1))
+        X[:, 0], X[:, 1] = xx.ravel(), yy.ravel()
+        grid = (x, y, np.asarray(function.evaluate(X), dtype=float).reshape(xx.shape))
+
+    if len(_contour_cache) >= _CONTOUR_CACHE_SIZE:
+        _contour_cache.pop(next(iter(_contour_cache)))
+    _contour_cache[key] = grid
+    return grid
+
+
+class LiveSwarmView:
+    """
+    Figura embebida en Tk con el enjambre sobre el contorno y la curva de convergencia.
+
+    Args:
+        parent: Contenedor Tk (`self.widget` se coloca con `pack`/`grid`).
+        function (IFunction): Función objetivo de la ejecución.
+        quantity_of_iterations (int): Iteraciones pedidas (eje x de la curva).
+    """
+
+    def __init__(self, parent, function: IFunction, quantity_of_iterations: int):
+        self.function: IFunction = function
+        self.dim: int = function.vector_size
+        self.grid = None
+        self.background = None
+        self.curves_scaled: bool = False
+
+        self.figure = Figure(figsize=(10, 4), dpi=100, tight_layout=True)
+        self.ax_swarm = self.figure.add_subplot(1, 2, 1)
+        self.ax_curve = self.figure.add_subplot(1, 2, 2)
+        self.ax_diversity = self.ax_curve.twinx()
+        self.ax_swarm.set_title("Enjambre")
+        self.ax_curve.set_title("Convergencia")
+        self.ax_curve.set_xlabel("Iteración")
+        self.ax_curve.set_ylabel("Mejor valor", color="tab:blue")
+        self.ax_curve.set_yscale("symlog")
+        self.ax_diversity.set_ylabel("Diversidad", color="tab:orange")
+        self.ax_curve.set_xlim(0, max(1, quantity_of_iterations))
+        self.ax_diversity.set_ylim(0, 1)
+
+        self.scatter = self.ax_swarm.scatter(
+            [], [], s=12, c="white", edgecolors="black", linewidths=0.3, zorder=3, animated=True,
+        )
+        (self.gbest_marker,) = self.ax_swarm.plot(
+            [], [], marker="*", color="red", markersize=14, linestyle="", zorder=4, animated=True,
+        )
+        (self.best_line,) = self.ax_curve.plot([], [], color="tab:blue", animated=True)
+        (self.diversity_line,) = self.ax_diversity.plot([], [], color="tab:orange", animated=True)
+        self.animated = [self.scatter, self.gbest_marker, self.best_line, self.diversity_line]
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=parent)
+        self.widget = self.canvas.get_tk_widget()
+        # cualquier redibujado completo (primer dibujo, cambio de escala, redimensionar) renueva el fondo
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+
+    def on_draw(self, event):
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.draw_animated()
+
+    def draw_animated(self):
+        for artist in self.animated:
+            artist.axes.draw_artist(artist)
+
+    def draw_function(self, positions: np.ndarray):
+        """Dibuja (una sola vez) el contorno o la curva de la función como fondo."""
+        low, high = plot_extent(self.function, positions)
+        self.grid = contour_grid(self.function, low, high)
+        if self.dim == 1:
+            x, values = self.grid
+            self.ax_swarm.plot(x, values, color="tab:blue", zorder=1)
+            span = max(float(values.max() - values.min()), 1e-12)
+            self.ax_swarm.set_ylim(values.min() - 0.05 * span, values.max() + 0.05 * span)
+        else:
+            x, y, Z = self.grid
+            # escala logarítmica de colores: funciones como Rosenbrock abarcan muchos órdenes de magnitud
+            self.ax_swarm.contourf(x, y, np.log1p(Z - Z.min()), levels=30, cmap="viridis", zorder=1)
+            self.ax_swarm.set_ylim(low[1], high[1])
+        self.ax_swarm.set_xlim(low[0], high[0])
+
+    def rescale_curves(self, best: np.ndarray, diversity: np.ndarray) -> bool:
+        """Amplía los ejes de las curvas si los datos se salen; devuelve True si cambiaron."""
+        changed = False
+        low, high = self.ax_curve.get_ylim()
+        if len(best) and (not self.curves_scaled or best.min() < low or best.max() > high):
+            self.curves_scaled = True
+            span = max(float(best.max() - best.min()), 1e-12)
+            self.ax_curve.set_ylim(best.min() - 0.5 * span, best.max() + 0.1 * span)
+            changed = True
+        if len(diversity) and diversity.max() > self.ax_diversity.get_ylim()[1]:
+            self.ax_diversity.set_ylim(0, 1.5 * diversity.max())
+            changed = True
+        return changed
+
+    def update(self, snapshot: SwarmSnapshot, best_values: list[float], diversities: list[float]):
+        """Muestra una instantánea; solo redibuja la figura completa si cambian los ejes."""
+        full_redraw = False
+        if self.grid is None:
+            self.draw_function(snapshot.positions)
+            full_redraw = True
+
+        count = snapshot.count
+        step = max(1, count // CURVE_POINTS)
+        iterations = np.arange(0, count, step)
+        best = np.asarray(best_values[:count:step], dtype=float)
+        diversity = np.asarray(diversities[:count:step], dtype=float)
+        self.best_line.set_data(iterations, best)
+        self.diversity_line.set_data(iterations, diversity)
+        full_redraw = self.rescale_curves(best, diversity) or full_redraw
+
+        positions, gbest = snapshot.positions, snapshot.gbest
+        if self.dim == 1:
+            x, values = self.grid
+            positions = np.column_stack([positions[:, 0], np.interp(positions[:, 0], x, values)])
+            gbest = np.array([gbest[0], np.interp(gbest[0], x, values)])
+        self.scatter.set_offsets(positions)
+        self.gbest_marker.set_data([gbest[0]], [gbest[1]])
+
+        if full_redraw or self.background is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self.background)
+        self.draw_animated()
+        self.canvas.blit(self.figure.bbox)
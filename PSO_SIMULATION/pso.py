@@ -6,80 +6,164 @@ Este archivo contiene una implementación del algoritmo PSO con soporte para:
 - Factor de constricción
 - Registro de iteraciones y diversidad
 - Evaluación mediante interfaz `IFunction`
+- Enjambre vectorizado: posiciones, velocidades y pbest en arrays `(n_particles, dim)`
 
 Las clases principales son:
-- Particle: Representa una partícula del enjambre
+- Particle: Vista de una partícula del enjambre (una fila de los arrays del PSO)
 - PSO: Controla la ejecución del algoritmo
 - ParticleIteration: Guarda el estado de una partícula en una iteración
 - Iteration: Guarda el estado del enjambre en una iteración
 
+El historial se guarda en arrays (ver `history.py`); `ParticleIteration` e
+`Iteration` se construyen de forma perezosa al consultarlo.
+
 Las funciones y métodos han sido documentados para facilitar su entendimiento.
 """
 
 from function import VectorResult, IFunction
 import numpy as np
-import random
 import math
 from default_values import w_max, w_min, c1 as c_1, c2 as c_2
+from history import HISTORY_FULL, HISTORY_NONE, SwarmHistory, swarm_diversity
+from history_store import HistoryReader, HistoryWriter
+from evaluation import EVAL_ASYNC, EVAL_MODES, EVAL_SYNC, ParallelEvaluator
+from cache import CachedFunction
+from telemetry import Telemetry, TelemetrySink, make_telemetry
+from topology import TOPOLOGY_GBEST, Topology
+from stopping import STOP_MAX_ITERATIONS, StopCriteria
+from boundary import BOUNDARY_CLIP, BOUNDARY_POLICIES, apply_boundary, clamp_velocity
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
 
 
 class Particle:
     """
-    Representa una partícula dentro del enjambre PSO.
+    Vista de una partícula dentro del enjambre PSO.
+
+    El estado vive en los arrays `(n_particles, dim)` del `PSO`; la partícula solo
+    guarda su índice y expone sus filas como atributos.
 
     Atributos:
-        id (int): Identificador único de la partícula.
+        id (int): Identificador único de la partícula (fila en los arrays del enjambre).
         pbest (np.ndarray): Mejor posición encontrada por la partícula.
         position (np.ndarray): Posición actual de la partícula.
         velocity (np.ndarray): Velocidad actual.
-        iterations (list[ParticleIteration]): Historial por iteración.
-        current_value (float | None): Valor actual evaluado por la función objetivo.
+        iterations (Sequence[ParticleIteration]): Historial por iteración (vista perezosa).
+        current_value (float | None): Valor de la función objetivo en `pbest`.
     """
 
-    def __init__(self, pbest: np.ndarray, id: int):
+    def __init__(self, swarm: "PSO", id: int):
         self.id: int = id
-        self.pbest: np.ndarray = pbest
-        self.position: np.ndarray = pbest
-        self.iterations: list[ParticleIteration] = []
-        self.current_value: float | None = None
-        self.initialize_velocity()
+        self.swarm: PSO = swarm
+
+    @property
+    def iterations(self):
+        """Historial de la partícula como vista perezosa sobre `PSO.history`."""
+        if self.swarm.history is None:
+            return []
+        return self.swarm.history.particle_iterations(self.id)
+
+    @property
+    def pbest(self) -> np.ndarray:
+        return self.swarm.pbests[self.id]
 
-    def initialize_velocity(self):
-        """Inicializa la velocidad en un vector de ceros del tamaño del espacio de búsqueda."""
-        velocity_vector = [0] * len(self.pbest)
-        self.velocity: np.ndarray = np.array(velocity_vector)
+    @property
+    def position(self) -> np.ndarray:
+        return self.swarm.positions[self.id]
 
-    def save_iteration(self):
-        """Guarda el estado actual de la partícula para la iteración actual."""
-        particleIteration = ParticleIteration(self.pbest, self.position, self.velocity)
-        self.iterations.append(particleIteration)
+    @property
+    def velocity(self) -> np.ndarray:
+        return self.swarm.velocities[self.id]
+
+    @property
+    def current_value(self) -> float | None:
+        return float(self.swarm.pbest_values[self.id])
 
 
 class PSO:
     """
-    Implementación del algoritmo Particle Swarm Optimization.
+    Implementación vectorizada del algoritmo Particle Swarm Optimization.
+
+    El enjambre se guarda como arrays: `positions`, `velocities` y `pbests` de forma
+    `(n_particles, dim)` y `pbest_values` de forma `(n_particles,)`, de modo que cada
+    iteración (velocidad, posición, pbest y gbest) son unas pocas operaciones NumPy.
 
     Parámetros:
         w (float | None): Factor de inercia.
         c1 (float): Peso cognitivo.
         c2 (float): Peso social.
+        topology (str): Vecindario del componente social: "gbest" (por defecto),
+            "ring", "von_neumann" o "random" (ver `topology.py`).
+        neighbours (int): Informantes por partícula en la topología "random".
+        boundary (str): Política para las coordenadas que salen de los límites de la
+            función: "clip", "absorb", "reflect" o "random" (ver `boundary.py`).
+        velocity_clamp (float | None): Velocidad máxima por dimensión como fracción
+            del rango de esa dimensión (`None` para no limitarla).
+        w_max, w_min (float): Inercia inicial y final del decrecimiento lineal.
+        rng (np.random.Generator | int | None): Generador aleatorio propio o semilla
+            (int o `SeedSequence`); `None` usa una semilla aleatoria. El PSO no usa el
+            estado global de `np.random`, así que varios enjambres (en hilos o en
+            procesos) no comparten estado y cada uno es reproducible con su semilla.
+        Los límites, la política y el límite de velocidad solo se aplican si la
+        función declara límites (`IFunction.set_bounds`).
     """
 
-    def __init__(self, w: float | None = None, c1: float = c_1, c2: float = c_2):
+    def __init__(
+        self,
+        w: float | None = None,
+        c1: float = c_1,
+        c2: float = c_2,
+        topology: str = TOPOLOGY_GBEST,
+        neighbours: int = 3,
+        boundary: str = BOUNDARY_CLIP,
+        velocity_clamp: float | None = 0.5,
+        w_max: float = w_max,
+        w_min: float = w_min,
+        rng: np.random.Generator | int | None = None,
+    ):
+        if boundary not in BOUNDARY_POLICIES:
+            raise ValueError(f"Política de frontera desconocida: {boundary!r} (opciones: {BOUNDARY_POLICIES})")
         self.c1: float = c1
         self.c2: float = c2
         self.w: float | None = w
+        self.w_max: float = w_max
+        self.w_min: float = w_min
+        self.topology_kind: str = topology
+        self.neighbours: int = neighbours
+        self.topology: Topology | None = None
+        self.lbests: np.ndarray | None = None
+        self.boundary: str = boundary
+        self.velocity_clamp: float | None = velocity_clamp
+        self.rng: np.random.Generator = np.random.default_rng(rng)
+        self.lower: np.ndarray | None = None
+        self.upper: np.ndarray | None = None
+        self.vmax: np.ndarray | None = None
         self.gbest: np.ndarray | None = None
         self.best_value: float | None = None
+        self.positions: np.ndarray = np.empty((0, 0))
+        self.velocities: np.ndarray = np.empty((0, 0))
+        self.pbests: np.ndarray = np.empty((0, 0))
+        self.pbest_values: np.ndarray = np.empty(0)
         self.particles: list[Particle] = []
-        self.iterations: list[Iteration] = []
+        self.history: SwarmHistory | HistoryReader | None = None
+        self.evaluator: ParallelEvaluator | None = None
+        self.telemetry: Telemetry | None = None
+        self.evaluations: int = 0
+        self.stop: StopCriteria | None = None
+        self.stop_reason: str | None = None
+        self.iterations_run: int = 0
+
+    @property
+    def iterations(self):
+        """Historial por iteración (gbest, diversidad) como vista perezosa sobre `history`."""
+        if self.history is None:
+            return []
+        return self.history.iterations()
 
     def update_inertia(self, current_iteration: int, quantity_of_iterations: int):
         """
         Actualiza dinámicamente la inercia según el progreso de iteraciones.
         """
-        self.w = w_max - (w_max - w_min) * (current_iteration / quantity_of_iterations)
-        print("Actualizando inercia")
+        self.w = self.w_max - (self.w_max - self.w_min) * (current_iteration / quantity_of_iterations)
 
     def calculate_function(
         self,
@@ -87,6 +171,14 @@ class PSO:
         quantity_of_iterations: int,
         function: IFunction,
         useConstrictionFactor: bool = False,
+        history: str = HISTORY_FULL,
+        sample_every: int = 10,
+        history_path: str | None = None,
+        executor: str | Executor | None = None,
+        workers: int | None = None,
+        evaluation: str = EVAL_SYNC,
+        telemetry: TelemetrySink | list | None = None,
+        stop: StopCriteria | None = None,
     ) -> np.ndarray | None:
         """
         Ejecuta el algoritmo PSO completo.
@@ -96,133 +188,399 @@ class PSO:
             quantity_of_iterations (int): Número de iteraciones.
             function (IFunction): Función objetivo.
             useConstrictionFactor (bool): Si se usa el factor de constricción.
+            history (str): Nivel de historial: "none", "summary", "sampled" o "full"
+                (ver `history.py`).
+            sample_every (int): Periodo de muestreo del nivel "sampled".
+            history_path (str | None): Si se indica, el historial se escribe en ese
+                directorio en bloques mapeados en memoria (ver `history_store.py`) en
+                lugar de en RAM; `history` es un `HistoryReader` perezoso (durante la
+                ejecución llega hasta el último bloque completado, ver `refresh()`).
+            executor (str | Executor | None): Evaluación en paralelo: "thread",
+                "process" o un `Executor` propio (ver `evaluation.py`). `None` evalúa
+                en el hilo principal.
+            workers (int | None): Trabajadores del pool creado para `executor`.
+            evaluation (str): "sync" (el enjambre completo por iteración) o "async"
+                (estado estacionario: cada partícula se mueve y se vuelve a evaluar
+                en cuanto llega su resultado; usa hilos si no se indica `executor`).
+            telemetry (TelemetrySink | Callable | list | None): Sumidero(s) de
+                telemetría o función `callback(metrics)` llamada en cada iteración
+                (ver `telemetry.py`). Por defecto la ejecución es silenciosa.
+            stop (StopCriteria | None): Criterios de parada anticipada (diversidad
+                mínima, estancamiento, valor objetivo, evaluaciones, tiempo; ver
+                `stopping.py`). El motivo de la parada queda en `stop_reason`.
 
         Returns:
             np.ndarray | None: Mejor solución encontrada (gbest).
         """
+        if evaluation not in EVAL_MODES:
+            raise ValueError(f"Modo de evaluación desconocido: {evaluation!r} (opciones: {EVAL_MODES})")
+        if executor is None and evaluation == EVAL_ASYNC:
+            executor = "thread"
+        self.evaluator = ParallelEvaluator(executor, workers) if executor is not None else None
+        self.telemetry = make_telemetry(telemetry)
+        self.stop = stop
+        try:
+            return self._run(
+                quantity_of_particles, quantity_of_iterations, function, useConstrictionFactor,
+                history, sample_every, history_path, evaluation,
+            )
+        finally:
+            if self.evaluator is not None:
+                self.evaluator.shutdown()
+                self.evaluator = None
+
+    def _run(
+        self,
+        quantity_of_particles: int,
+        quantity_of_iterations: int,
+        function: IFunction,
+        useConstrictionFactor: bool,
+        history: str,
+        sample_every: int,
+        history_path: str | None,
+        evaluation: str,
+    ) -> np.ndarray | None:
+        """Cuerpo de `calculate_function` una vez preparados el evaluador y la telemetría."""
         self.set_parameters(quantity_of_particles, quantity_of_iterations)
+        self.set_bounds(function)
+        self.evaluations = 0
+        self.iterations_run = 0
+        self.stop_reason = STOP_MAX_ITERATIONS
+        if self.stop is not None:
+            self.stop.start()
+        if self.telemetry is not None:
+            self.telemetry.start({
+                "particles": quantity_of_particles,
+                "iterations": quantity_of_iterations,
+                "dim": function.vector_size,
+                "function": type(function).__name__,
+                "c1": self.c1,
+                "c2": self.c2,
+                "constriction": useConstrictionFactor,
+                "evaluation": evaluation,
+            })
+        self.initialize_swarm(function)
+        if history_path is not None:
+            recorder = HistoryWriter(
+                history_path, history, quantity_of_particles, function.vector_size, sample_every
+            )
+            # lector sobre el directorio: `history.refresh()` muestra los bloques ya completados
+            self.history = HistoryReader(history_path)
+        else:
+            recorder = SwarmHistory(
+                history, quantity_of_iterations, quantity_of_particles, function.vector_size, sample_every
+            )
+            self.history = recorder
+
+        if evaluation == EVAL_ASYNC:
+            self.run_steady_state(function, useConstrictionFactor, recorder)
+        else:
+            for i in range(self.quantity_of_iterations):
+                self.step(i, function, useConstrictionFactor)
+                if self.end_iteration(i, recorder):
+                    break
+
+        if history_path is not None:
+            recorder.close()
+            self.history = HistoryReader(history_path)
+
+        if self.telemetry is not None:
+            self.telemetry.end(
+                self.best_value, self.gbest, self.evaluations, self.iterations_run, self.stop_reason
+            )
+        return self.gbest
+
+    def initialize_swarm(self, function: IFunction):
+        """Crea (o reinicia) el enjambre, su topología y sus mejores global y locales."""
+        self.best_value = None
         self.initialize_particles(function.vector_size, function)
+        self.topology = Topology(self.topology_kind, self.quantity_of_particles, k=self.neighbours, rng=self.rng)
         self.define_gbest()
+        self.define_lbest()
+
+    def step(self, i: int, function: IFunction, useConstrictionFactor: bool):
+        """Una iteración síncrona: velocidad, movimiento, evaluación, pbest, gbest y lbest."""
+        telemetry = self.telemetry
+        if telemetry is not None:
+            telemetry.begin_phase()
+        if useConstrictionFactor:
+            self.calculate_velocity_by_constriction()
+        else:
+            self.update_inertia(i, self.quantity_of_iterations)
+            self.calculate_velocity_by_inertia()
+
+        self.update_position()
+        if telemetry is not None:
+            telemetry.phase("move")
+        self.update_pbest(function)
+        if telemetry is not None:
+            telemetry.phase("evaluate")
+        previous_best = self.best_value
+        self.define_gbest()
+        self.topology.update(self.best_value < previous_best)
+        self.define_lbest()
 
-        print(
-            f"Información relevante: \n - c1: {self.c1}\n - c2: {self.c2}\n - gbest: {self.gbest}\n"
-        )
-
-        for i in range(self.quantity_of_iterations):
-            iteration = Iteration()
-
-            for particle in self.particles:
-                if useConstrictionFactor:
-                    self.calculate_velocity_by_constriction(particle)
-                else:
-                    self.update_inertia(i, quantity_of_iterations)
-                    self.calculate_velocity_by_inertia(particle)
-
-                self.update_position(particle)
-                self.update_pbest(particle, function)
-                particle.save_iteration()
-                iteration.add_particle_iteration(particle.iterations[i])
+    def receive_migrants(self, positions: np.ndarray, values: np.ndarray):
+        """
+        Sustituye las peores partículas (por pbest) por los migrantes recibidos de otro
+        enjambre: pasan a ser su posición y su pbest, con velocidad nula.
+        """
+        k = min(len(positions), self.quantity_of_particles)
+        if k == 0:
+            return
+        worst = np.argsort(self.pbest_values)[-k:]
+        self.positions[worst] = positions[:k]
+        self.pbests[worst] = positions[:k]
+        self.pbest_values[worst] = values[:k]
+        self.velocities[worst] = 0.0
+        self.define_gbest()
+        self.define_lbest()
 
-            self.define_gbest()
-            if self.gbest is not None:
-                iteration.set_gbest(self.gbest)
-            iteration.calculate_diversity()
-            self.iterations.append(iteration)
+    def end_iteration(self, i: int, recorder) -> str | None:
+        """
+        Cierra la iteración `i`: la guarda en el historial, la publica en la telemetría
+        y comprueba los criterios de parada. Devuelve el motivo de parada o None.
+        """
+        self.iterations_run = i + 1
+        telemetry, stop = self.telemetry, self.stop
+        diversity = None
+        if recorder.level != HISTORY_NONE or telemetry is not None or (stop is not None and stop.needs_diversity):
+            diversity = swarm_diversity(self.positions)
+        recorder.record(
+            i, self.positions, self.velocities, self.pbests,
+            self.gbest, self.best_value, diversity,
+        )
+        if telemetry is not None:
+            telemetry.phase("history")
+            telemetry.iteration(i, self.best_value, self.gbest, diversity, self.evaluations)
+        if stop is not None:
+            reason = stop.check(i, self.best_value, diversity, self.evaluations)
+            if reason is not None:
+                self.stop_reason = reason
+                return reason
+        return None
+
+    def run_steady_state(self, function: IFunction, useConstrictionFactor: bool, recorder):
+        """
+        PSO asíncrono de estado estacionario sobre `self.evaluator`.
 
-        print(f"Mejor valor encontrado: {self.gbest}")
-        return self.gbest
+        Cada partícula se mueve y se envía a evaluar por separado; al llegar su
+        resultado se actualizan su pbest y, si mejora, el gbest de inmediato, y la
+        partícula se vuelve a mover con el gbest vigente. Se hacen en total
+        `partículas * iteraciones` evaluaciones; cada `partículas` resultados cuentan
+        como una iteración (inercia e historial).
+        """
+        n = self.quantity_of_particles
+        total = n * self.quantity_of_iterations
+        submitted = completed = 0
+        pending = {}
+        if not useConstrictionFactor:
+            self.update_inertia(0, self.quantity_of_iterations)
+        for p in range(min(n, total)):
+            future, evaluated = self.submit_particle(function, p, useConstrictionFactor)
+            pending[future] = (p, evaluated)
+            submitted += 1
+
+        telemetry = self.telemetry
+        if telemetry is not None:
+            telemetry.begin_phase()
+        iteration_best = self.best_value
+        while pending:
+            if telemetry is not None:
+                telemetry.phase("update")
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            if telemetry is not None:
+                telemetry.phase("wait")
+            for future in done:
+                p, evaluated = pending.pop(future)
+                value = float(future.result()[0])
+                if evaluated:
+                    self.evaluations += 1
+                    if isinstance(function, CachedFunction):
+                        function.store(self.positions[p], value)
+                if value < self.pbest_values[p]:
+                    self.pbests[p] = self.positions[p]
+                    self.pbest_values[p] = value
+                    if value < self.best_value:
+                        self.gbest = self.pbests[p].copy()
+                        self.best_value = value
+                completed += 1
+
+                if completed % n == 0:
+                    i = completed // n - 1
+                    if telemetry is not None:
+                        telemetry.phase("update")
+                    if self.end_iteration(i, recorder):
+                        for future in pending:
+                            future.cancel()
+                        return
+                    self.topology.update(self.best_value < iteration_best)
+                    iteration_best = self.best_value
+                    if not useConstrictionFactor and i + 1 < self.quantity_of_iterations:
+                        self.update_inertia(i + 1, self.quantity_of_iterations)
+
+                if submitted < total:
+                    future, evaluated = self.submit_particle(function, p, useConstrictionFactor)
+                    pending[future] = (p, evaluated)
+                    submitted += 1
+
+    def submit_particle(self, function: IFunction, p: int, useConstrictionFactor: bool) -> tuple[Future, bool]:
+        """
+        Mueve la partícula `p` con el gbest actual y lanza su evaluación. Devuelve el
+        futuro y si hubo evaluación real (False si el valor salió de la caché).
+        """
+        r1, r2 = self.rng.random((2, self.positions.shape[1]))
+        social_best = self.pbests[self.topology.local_best_index(p, self.pbest_values)]
+        cognitive_component = self.c1 * r1 * (self.pbests[p] - self.positions[p])
+        social_component = self.c2 * r2 * (social_best - self.positions[p])
+        if useConstrictionFactor:
+            velocity = self.constriction_factor() * (
+                self.velocities[p] + cognitive_component + social_component
+            )
+        else:
+            velocity = self.velocities[p] * self.w + cognitive_component + social_component
+        positions, velocities = self.move(self.positions[p:p + 1], velocity[None])
+        self.positions[p], self.velocities[p] = positions[0], velocities[0]
+        if isinstance(function, CachedFunction):
+            # la caché se consulta aquí: al pool solo va la función envuelta
+            value = function.lookup(self.positions[p])
+            if value is not None:
+                future = Future()
+                future.set_result(np.array([value]))
+                return future, False
+            return self.evaluator.submit(function.function, self.positions[p]), True
+        return self.evaluator.submit(function, self.positions[p]), True
 
     def set_parameters(self, quantity_of_particles: int, quantity_of_iterations: int):
         """Guarda los parámetros básicos del algoritmo."""
         self.quantity_of_particles = quantity_of_particles
         self.quantity_of_iterations = quantity_of_iterations
 
+    def set_bounds(self, function: IFunction):
+        """Toma los límites declarados por la función y calcula la velocidad máxima."""
+        bounds = function.bounds_arrays()
+        self.lower, self.upper = bounds if bounds is not None else (None, None)
+        self.vmax = None
+        if bounds is not None and self.velocity_clamp is not None:
+            self.vmax = self.velocity_clamp * (self.upper - self.lower)
+
     def define_gbest(self):
         """
-        Busca entre todas las partículas el mejor valor global.
+        Busca entre todos los pbest el mejor valor global (argmin vectorizado).
         """
-        best_value: float | None = self.best_value
-        gbest: np.ndarray | None = self.gbest
-
-        for particle in self.particles:
-            if gbest is not None:
-                if (
-                    particle.current_value is not None
-                    and best_value is not None
-                    and particle.current_value < best_value
-                ):
-                    gbest = particle.pbest
-                    best_value = particle.current_value
-            else:
-                gbest = particle.pbest
-                best_value = particle.current_value
-
-        self.gbest = gbest
-        self.best_value = best_value
-
-    def calculate_velocity_by_inertia(self, particle: Particle):
-        """Calcula la nueva velocidad usando la fórmula con inercia variable."""
-        inertia_component = particle.velocity * self.w
-        r1 = random.random()
-        r2 = random.random()
-
-        cognitive_component = self.c1 * r1 * (particle.pbest - particle.position)
-        social_component = self.c2 * r2 * (self.gbest - particle.position)
-
-        new_velocity = inertia_component + cognitive_component + social_component
-        particle.velocity = new_velocity
-
-    def calculate_velocity_by_constriction(self, particle: Particle):
-        """Calcula la velocidad aplicando un factor de constricción (Clerc)."""
-        r1 = random.random()
-        r2 = random.random()
-        phi = self.c1 + self.c2
+        best = int(np.argmin(self.pbest_values))
+        value = float(self.pbest_values[best])
+        if self.best_value is None or value < self.best_value:
+            self.gbest = self.pbests[best].copy()
+            self.best_value = value
+
+    def define_lbest(self):
+        """
+        Mejor pbest del vecindario de cada partícula (gather + argmin sobre la topología).
+
+        Con la topología "gbest" no se materializa: el componente social usa `gbest`.
+        """
+        if self.topology is None or self.topology.is_global:
+            self.lbests = None
+            return
+        self.lbests = self.pbests[self.topology.local_best_indices(self.pbest_values)]
+
+    def social_best(self) -> np.ndarray:
+        """Atractor social: `gbest` (difundido) o los mejores locales `(n, dim)`."""
+        return self.gbest if self.lbests is None else self.lbests
+
+    def random_coefficients(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Coeficientes aleatorios r1, r2 (uno por partícula y dimensión) con forma
+        `(n, dim)`, generados en una sola llamada al generador.
+        """
+        r1, r2 = self.rng.random((2, *self.positions.shape))
+        return r1, r2
+
+    def calculate_velocity_by_inertia(self):
+        """Calcula la nueva velocidad de todo el enjambre usando la fórmula con inercia variable."""
+        r1, r2 = self.random_coefficients()
+        inertia_component = self.velocities * self.w
+        cognitive_component = self.c1 * r1 * (self.pbests - self.positions)
+        social_component = self.c2 * r2 * (self.social_best() - self.positions)
 
-        constrictionFactor = 2 / np.abs(2 - phi - math.sqrt(phi**2 - 4 * phi))
+        self.velocities = inertia_component + cognitive_component + social_component
 
-        cognitive_component = self.c1 * r1 * (particle.pbest - particle.position)
-        social_component = self.c2 * r2 * (self.gbest - particle.position)
+    def calculate_velocity_by_constriction(self):
+        """Calcula la velocidad de todo el enjambre aplicando un factor de constricción (Clerc)."""
+        r1, r2 = self.random_coefficients()
+        constrictionFactor = self.constriction_factor()
 
-        new_velocity = constrictionFactor * (
-            particle.velocity + cognitive_component + social_component
+        cognitive_component = self.c1 * r1 * (self.pbests - self.positions)
+        social_component = self.c2 * r2 * (self.social_best() - self.positions)
+
+        self.velocities = constrictionFactor * (
+            self.velocities + cognitive_component + social_component
         )
-        particle.velocity = new_velocity
 
-    def update_position(self, particle: Particle):
-        """Actualiza la posición de la partícula."""
-        particle.position = particle.position + particle.velocity
+    def constriction_factor(self) -> float:
+        """Factor de constricción de Clerc para `phi = c1 + c2`."""
+        phi = self.c1 + self.c2
+        return 2 / np.abs(2 - phi - math.sqrt(phi**2 - 4 * phi))
+
+    def update_position(self):
+        """Actualiza la posición de todas las partículas (dentro de los límites si los hay)."""
+        self.positions, self.velocities = self.move(self.positions, self.velocities)
 
-    def update_pbest(self, particle: Particle, function: IFunction):
+    def move(self, positions: np.ndarray, velocities: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
         """
-        Actualiza pbest si la nueva posición es mejor.
+        Aplica el límite de velocidad, desplaza las filas dadas y aplica la política
+        de frontera. Devuelve `(positions, velocities)` nuevas.
         """
-        new_value = self.executeFunctionValues(function, particle.position)
+        if self.vmax is not None:
+            velocities = clamp_velocity(velocities, self.vmax)
+        positions = positions + velocities
+        if self.lower is not None:
+            positions, velocities = apply_boundary(
+                self.boundary, positions, velocities, self.lower, self.upper, rng=self.rng
+            )
+        return positions, velocities
 
-        if particle.current_value is not None and new_value < particle.current_value:
-            particle.pbest = particle.position
-            particle.current_value = new_value
+    def update_pbest(self, function: IFunction):
+        """
+        Evalúa el enjambre y actualiza pbest en las partículas que mejoran.
+        """
+        values = self.evaluate(function, self.positions)
+        improved = values < self.pbest_values
+        self.pbests[improved] = self.positions[improved]
+        self.pbest_values[improved] = values[improved]
 
-    def executeFunctionValues(
-        self, function: IFunction, variables: np.ndarray
-    ) -> float:
-        """Ejecuta la función objetivo con las variables dadas."""
-        for i in range(function.vector_size):
-            function.variables[i] = variables[i]
-        return function.execute()
+    def evaluate(self, function: IFunction, positions: np.ndarray) -> np.ndarray:
+        """
+        Evalúa la función objetivo en todas las filas de `positions` con `IFunction.evaluate`,
+        repartidas en el evaluador paralelo si hay uno.
 
-    def initialize_particles(self, quantityOfVariables: int, function: IFunction):
-        """Crea partículas iniciales con posiciones aleatorias."""
-        for i in range(self.quantity_of_particles):
-            particle = Particle(self.createRandomVector(quantityOfVariables), i)
-            particle.current_value = self.executeFunctionValues(
-                function, particle.pbest
-            )
-            print(f"pbest: {particle.pbest} - value {particle.current_value}")
-            self.particles.append(particle)
+        Con una `CachedFunction` la caché se consulta en este proceso; solo las celdas
+        nuevas se evalúan (y cuentan en `evaluations`).
+        """
+        if isinstance(function, CachedFunction):
+            return function.evaluate(positions, evaluate=lambda rows: self.evaluate(function.function, rows))
+        self.evaluations += len(positions)
+        if self.evaluator is not None:
+            return self.evaluator.evaluate(function, positions)
+        return np.asarray(function.evaluate(positions), dtype=float)
 
-    def createRandomVector(self, quantityOfVariables: int) -> np.ndarray:
-        """Crea un vector aleatorio dentro del rango [0, 5]."""
-        return np.array([random.uniform(0, 5) for _ in range(quantityOfVariables)])
+    def initialize_particles(self, quantityOfVariables: int, function: IFunction):
+        """Crea el enjambre inicial con posiciones aleatorias y velocidades nulas."""
+        self.positions = self.createRandomVector((self.quantity_of_particles, quantityOfVariables))
+        self.velocities = np.zeros_like(self.positions)
+        self.pbests = self.positions.copy()
+        self.pbest_values = self.evaluate(function, self.positions)
+        self.particles = [Particle(self, i) for i in range(self.quantity_of_particles)]
+
+    def createRandomVector(self, shape) -> np.ndarray:
+        """
+        Crea un array aleatorio (vector o matriz con forma `shape`) dentro de los límites
+        de la función, o en el rango [0, 5] si no los declara.
+        """
+        if self.lower is not None:
+            return self.rng.uniform(self.lower, self.upper, size=shape)
+        return self.rng.uniform(0, 5, size=shape)
 
 
 class ParticleIteration:
@@ -246,22 +604,20 @@ class Iteration:
         """Añade el estado de una partícula en esta iteración."""
         self.particles_iterations.append(particle_iteration)
 
+    def positions(self) -> np.ndarray:
+        """Posiciones de las partículas de la iteración como matriz `(n, dim)`."""
+        return np.array([p.position for p in self.particles_iterations], dtype=float)
+
     def calculate_diversity(self):
-        """Calcula la diversidad del enjambre mediante la distancia al centroide."""
-        centroid = self.calculate_centroid()
-        norm_sumatory: float = sum(
-            float(np.linalg.norm(p.position - centroid))
-            for p in self.particles_iterations
-        )
-        diversity = norm_sumatory / len(self.particles_iterations)
+        """Calcula la diversidad del enjambre mediante la distancia al centroide (vectorizada)."""
+        diversity = swarm_diversity(self.positions())
         self.diversity = math.trunc(diversity * 10**5) / 10**5
 
     def calculate_centroid(self):
         """Calcula el centroide de las posiciones de las partículas."""
-        if not self.particles_iterations:
+        if not len(self.particles_iterations):
             return None
-        sumatory = sum((p.position for p in self.particles_iterations))
-        return sumatory / len(self.particles_iterations)
+        return self.positions().mean(axis=0)
 
     def set_gbest(self, gbest: np.ndarray):
         """Guarda el gbest truncado para esta iteración."""
@@ -270,4 +626,5 @@ class Iteration:
 
 def trunc_vector(vector: np.ndarray):
     """Trunca un vector a 5 decimales."""
-    return np.array([math.trunc(v * 10**5) / 10**5 for v in vector])
+    # + 0.0 normaliza -0.0 a 0.0 (como hacía math.trunc)
+    return np.trunc(np.asarray(vector, dtype=float) * 10**5) / 10**5 + 0.0
@@ -1,28 +1,92 @@
-import ttkbootstrap as tb
-from PIL import Image, ImageTk
+from __future__ import annotations
+
+import importlib.util
 import math
-from default_values import quadratic_title, rosenbrock_title, rastrigin_title, constriction_factor, inertia_factor
-from function import QuadraticFunction, RosenbrockFunction, RastriginFunction
-from pso import PSO, Particle
-import numpy as np
+import os
+import threading
+import tkinter as tk
+from typing import TYPE_CHECKING
 
-def show_parameters(event):
+import ttkbootstrap as tb
+from default_values import quadratic_title, rosenbrock_title, rastrigin_title, constriction_factor, inertia_factor
+from stopping import (
+    STOP_CANCELLED, STOP_DIVERSITY, STOP_MAX_EVALUATIONS, STOP_MAX_ITERATIONS, STOP_STAGNATION,
+    STOP_TARGET, STOP_TIME_BUDGET, StopCriteria,
+)
+from virtual_table import VirtualTable
+
+if TYPE_CHECKING:
+    from function import IFunction
+    from pso import PSO
+
+# Arranque rápido: numpy, el PSO, PIL y matplotlib se importan la primera vez que se
+# necesitan (al calcular, al crear una miniatura o al abrir la vista en vivo).
+# matplotlib es opcional: sin él no hay vista en vivo.
+LIVE_VIEW_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
+
+IMAGES_DIR = "images"
+PREVIEW_CACHE_DIR = os.path.join(IMAGES_DIR, ".cache")
+PREVIEW_SCALE = 0.5
+
+# título -> (encabezado del panel, imagen, título de los parámetros, parámetros)
+FUNCTION_PANELS = {
+    quadratic_title: ("Función Cuadrática", "Quadratic", "Coeficientes", ["a", "b", "c", "d"]),
+    rosenbrock_title: ("Función Rosenbrock", "Rosenbrock", "Parámetros", ["a", "b"]),
+    rastrigin_title: ("Función Rastrigin", "Rastrigin", "Parámetros", ["A", "n"]),
+}
+
+function_frames: dict[str, tb.Frame] = {}
+function_entries: dict[str, list[tb.Entry]] = {}
+function_previews: dict[str, tk.PhotoImage] = {}  # Tk no guarda referencia a las imágenes
+
+def load_preview(name: str) -> tk.PhotoImage:
+    """
+    Miniatura de `images/<name>.png` reducida a `PREVIEW_SCALE`. Solo la primera vez
+    (o si la imagen original cambia) se reduce con PIL y se guarda en `images/.cache`;
+    después Tk la carga directamente, sin importar PIL.
+    """
+    source = os.path.join(IMAGES_DIR, f"{name}.png")
+    cached = os.path.join(PREVIEW_CACHE_DIR, f"{name}_{PREVIEW_SCALE:g}.png")
+    if not os.path.exists(cached) or os.path.getmtime(cached) < os.path.getmtime(source):
+        from PIL import Image
+
+        image = Image.open(source)
+        image = image.resize((math.trunc(image.size[0]*PREVIEW_SCALE), math.trunc(image.size[1]*PREVIEW_SCALE)))
+        os.makedirs(PREVIEW_CACHE_DIR, exist_ok=True)
+        temporary = f"{cached}.{os.getpid()}.tmp"
+        image.save(temporary, format="PNG")
+        os.replace(temporary, cached)
+    return tk.PhotoImage(file=cached)
+
+def build_function_frame(title: str) -> tb.Frame:
+    """Construye el panel de parámetros de una función (la primera vez que se selecciona)."""
+    heading, image_name, parameters_title, parameters = FUNCTION_PANELS[title]
+    frame = tb.Frame(frame_funciones)
+
+    tb.Label(frame, text=heading, font=("Arial", 13, "bold")).grid(row=0, column=0, columnspan=2, pady=15)
+
+    function_previews[title] = load_preview(image_name)
+    tb.Label(frame, image=function_previews[title]).grid(row=1, column=0, columnspan=2)
+
+    tb.Label(frame, text=parameters_title, font=("Arial", 12, "bold")).grid(row=2, column=0, columnspan=2)
+
+    entries = []
+    for row, parameter in enumerate(parameters, start=3):
+        tb.Label(frame, text=f"{parameter}:", font=("Arial", 12), foreground="white").grid(row=row, column=0, pady=10)
+        entry = tb.Entry(frame)
+        entry.grid(row=row, column=1, pady=10)
+        entries.append(entry)
+    function_entries[title] = entries
+    return frame
+
+def show_parameters(event=None):
     selection = function_box.get()
-    if selection == quadratic_title:
-        quadratic_frame.pack()
-        rosenbrock_frame.pack_forget()
-        rastrigin_frame.pack_forget()
-        return
-    if selection == rosenbrock_title:
-        rosenbrock_frame.pack()
-        quadratic_frame.pack_forget()
-        rastrigin_frame.pack_forget()
-        return
-    if selection == rastrigin_title:
-        rastrigin_frame.pack()
-        rosenbrock_frame.pack_forget()
-        quadratic_frame.pack_forget()
-        return
+    for title, frame in function_frames.items():
+        if title != selection:
+            frame.pack_forget()
+    if selection not in function_frames:
+        function_frames[selection] = build_function_frame(selection)
+    function_frames[selection].pack()
 
 app = tb.Window(themename="superhero")
 app.title("Simulación algoritmo PSO")
@@ -74,132 +138,151 @@ function_box.grid(row=3, column=1, padx=10)
 function_box.bind("<<ComboboxSelected>>", show_parameters)
 function_box.set(quadratic_title)
 
-# FUNCIONES 
-# Función cuadrática
-quadratic_frame = tb.Frame(frame_funciones)
-quadratic_frame.pack()
-
-quad_img = Image.open("images/Quadratic.png")
-quad_img = quad_img.resize((math.trunc(quad_img.size[0]*0.5), math.trunc(quad_img.size[1]*0.5)))
-quad_photo = ImageTk.PhotoImage(quad_img)
-
-quad_title_label = tb.Label(quadratic_frame, text="Función Cuadrática", font=("Arial", 13, "bold"))
-quad_title_label.grid(row=0, column=0, columnspan=2, pady=15)
-
-image_label = tb.Label(quadratic_frame, image=quad_photo)
-image_label.grid(row=1, column=0, columnspan=2)
-
-quad_param_label = tb.Label(quadratic_frame, text="Coeficientes", font=("Arial", 12, "bold"))
-quad_param_label.grid(row=2, column=0, columnspan=2)
-
-quad_a_label = tb.Label(quadratic_frame, text="a:", font=("Arial", 12), foreground="white")
-quad_a_label.grid(row=3, column=0, pady=10)
-
-quad_entry_a = tb.Entry(quadratic_frame)
-quad_entry_a.grid(row=3, column=1, pady=10)
-
-quad_b_label = tb.Label(quadratic_frame, text="b:", font=("Arial", 12), foreground="white")
-quad_b_label.grid(row=4, column=0, pady=10)
-
-quad_entry_b = tb.Entry(quadratic_frame)
-quad_entry_b.grid(row=4, column=1, pady=10)
-
-quad_c_label = tb.Label(quadratic_frame, text="c:", font=("Arial", 12), foreground="white")
-quad_c_label.grid(row=5, column=0, pady=10)
-
-quad_entry_c = tb.Entry(quadratic_frame)
-quad_entry_c.grid(row=5, column=1, pady=10)
+show_parameters()
 
-quad_d_label = tb.Label(quadratic_frame, text="d:", font=("Arial", 12), foreground="white")
-quad_d_label.grid(row=6, column=0, pady=10)
 
-quad_entry_d = tb.Entry(quadratic_frame)
-quad_entry_d.grid(row=6, column=1, pady=10)
+def build_function() -> IFunction:
+    """Crea la función objetivo seleccionada con los parámetros introducidos (ValueError si no son válidos)."""
+    from function import QuadraticFunction, RosenbrockFunction, RastriginFunction
 
+    selection = function_box.get()
+    values = [entry.get() for entry in function_entries.get(selection, [])]
+    if selection == quadratic_title:
+        return QuadraticFunction(*(float(value) for value in values))
+    if selection == rosenbrock_title:
+        return RosenbrockFunction(float(values[0]), float(values[1]))
+    if selection == rastrigin_title:
+        return RastriginFunction(float(values[0]), int(values[1]))
+    raise ValueError("Selecciona una función")
+
+
+class SolveJob:
+    """
+    Ejecución del PSO en un hilo de trabajo para no bloquear la ventana.
+
+    El hilo solo escribe `progress` (desde la telemetría del PSO), `error` y, con
+    `live`, las instantáneas de `snapshots`; la interfaz los lee periódicamente con
+    `app.after`, de modo que ningún widget se toca fuera del hilo principal.
+    `cancel()` detiene el PSO al final de la iteración en curso.
+    """
+
+    def __init__(self, simulator: PSO, quantity_of_particles: int, quantity_of_iterations: int,
+                 function: IFunction, useConstrictionFactor: bool, live: bool = False):
+        self.simulator: PSO = simulator
+        self.quantity_of_iterations: int = quantity_of_iterations
+        self.stop: StopCriteria = StopCriteria()
+        self.progress: tuple[int, float | None] = (0, None)
+        self.error: Exception | None = None
+        self.snapshots = None
+        if live:
+            from live_view import SnapshotSink
+
+            self.snapshots = SnapshotSink(simulator)
+        self.view = None
+        self.shown = None
+        self.thread = threading.Thread(
+            target=self.run,
+            args=(quantity_of_particles, quantity_of_iterations, function, useConstrictionFactor),
+            daemon=True,
+        )
+
+    def run(self, quantity_of_particles, quantity_of_iterations, function, useConstrictionFactor):
+        try:
+            self.simulator.calculate_function(
+                quantity_of_particles, quantity_of_iterations, function, useConstrictionFactor,
+                telemetry=[self.on_iteration, self.snapshots] if self.snapshots else self.on_iteration,
+                stop=self.stop,
+            )
+        except Exception as error:
+            self.error = error
+
+    def on_iteration(self, metrics):
+        # una sola asignación: la interfaz siempre lee un par coherente
+        self.progress = (metrics.iteration + 1, metrics.best_value)
+
+    def cancel(self):
+        self.stop.cancel()
 
-# Función rosenbrock
-rosenbrock_frame = tb.Frame(frame_funciones)
-#rosenbrock_frame.pack(pady=20)
-
-rosenb_img = Image.open("images/Rosenbrock.png")
-rosenb_img = rosenb_img.resize((math.trunc(rosenb_img.size[0]*0.5), math.trunc(rosenb_img.size[1]*0.5)))
-rosenb_photo = ImageTk.PhotoImage(rosenb_img)
-
-rosenb_title_label = tb.Label(rosenbrock_frame, text="Función Rosenbrock", font=("Arial", 13, "bold"))
-rosenb_title_label.grid(row=0, column=0, columnspan=2)
-
-image_label = tb.Label(rosenbrock_frame, image=rosenb_photo)
-image_label.grid(row=1, column=0, columnspan=2)
-
-rosenb_param_label = tb.Label(rosenbrock_frame, text="Parámetros")
-rosenb_param_label.grid(row=2, column=0, columnspan=2)
-
-rosenb_a_label = tb.Label(rosenbrock_frame, text="a:", font=("Arial", 12), foreground="white")
-rosenb_a_label.grid(row=3, column=0, pady=10)
-
-rosenb_entry_a = tb.Entry(rosenbrock_frame)
-rosenb_entry_a.grid(row=3, column=1, pady=10)
-
-rosenb_b_label = tb.Label(rosenbrock_frame, text="b:", font=("Arial", 12), foreground="white")
-rosenb_b_label.grid(row=4, column=0, pady=10)
-
-rosenb_entry_b = tb.Entry(rosenbrock_frame)
-rosenb_entry_b.grid(row=4, column=1, pady=10)
-
-
-# Función rastrigin
-rastrigin_frame = tb.Frame(frame_funciones)
-#rastrigin_frame.pack(pady=20)
-
-ras_img = Image.open("images/Rastrigin.png")
-ras_img = ras_img.resize((math.trunc(ras_img.size[0]*0.5), math.trunc(ras_img.size[1]*0.5)))
-ras_photo = ImageTk.PhotoImage(ras_img)
-
-ras_title_label = tb.Label(rastrigin_frame, text="Función Rastrigin", font=("Arial", 13, "bold"))
-ras_title_label.grid(row=0, column=0, columnspan=2)
 
-image_label = tb.Label(rastrigin_frame, image=ras_photo)
-image_label.grid(row=1, column=0, columnspan=2)
+def calculate():
+    try:
+        quantity_of_particles = int(quantity_particles_entry.get())
+        quantity_of_iterations = int(quantity_iterations_entry.get())
+        function = build_function()
+    except ValueError:
+        status_label.configure(text="Revisa los parámetros: deben ser números válidos")
+        return
+    if quantity_of_particles <= 0 or quantity_of_iterations <= 0:
+        status_label.configure(text="Las partículas y las iteraciones deben ser positivas")
+        return
 
-ras_param_label = tb.Label(rastrigin_frame, text="Parámetros")
-ras_param_label.grid(row=2, column=0, columnspan=2)
+    from pso import PSO
+
+    job = SolveJob(PSO(), quantity_of_particles, quantity_of_iterations, function,
+                   factor_box.get()==constriction_factor, live=live_var.get())
+    if job.snapshots is not None:
+        open_live_view(job, function)
+    calculate_button.configure(state="disabled")
+    cancel_button.configure(state="normal", command=job.cancel)
+    progress_bar.configure(maximum=quantity_of_iterations, value=0)
+    status_label.configure(text="Calculando...")
+    job.thread.start()
+    app.after(POLL_MS, poll_job, job)
+
+def open_live_view(job: SolveJob, function: IFunction):
+    """Abre la ventana con el enjambre y la convergencia en vivo."""
+    from live_view import LiveSwarmView
+
+    window = tb.Toplevel(title="Simulación en vivo")
+    job.view = LiveSwarmView(window, function, job.quantity_of_iterations)
+    job.view.widget.pack(fill="both", expand=True)
+
+    def close():
+        job.view = None
+        window.destroy()
+
+    window.protocol("WM_DELETE_WINDOW", close)
+
+def poll_job(job: SolveJob):
+    """Refresca el progreso y la vista en vivo y, cuando el hilo termina, muestra los resultados."""
+    iteration, best_value = job.progress
+    progress_bar.configure(value=iteration)
+    if best_value is not None:
+        status_label.configure(text=f"Iteración {iteration}/{job.quantity_of_iterations} - mejor valor {best_value:.6g}")
+    snapshot = job.snapshots.latest if job.snapshots is not None else None
+    if job.view is not None and snapshot is not None and snapshot is not job.shown:
+        job.shown = snapshot
+        job.view.update(snapshot, job.snapshots.best_values, job.snapshots.diversities)
+    if job.thread.is_alive():
+        app.after(POLL_MS, poll_job, job)
+        return
 
-ras_A_label = tb.Label(rastrigin_frame, text="A:", font=("Arial", 12), foreground="white")
-ras_A_label.grid(row=3, column=0, pady=10)
+    calculate_button.configure(state="normal")
+    cancel_button.configure(state="disabled")
+    if job.error is not None:
+        status_label.configure(text=f"Error en el cálculo: {job.error}")
+        return
+    status_label.configure(text="")
+    show_results(job.simulator)
 
-ras_entry_A = tb.Entry(rastrigin_frame)
-ras_entry_A.grid(row=3, column=1, pady=10)
+POLL_MS = 50
 
-ras_n_label = tb.Label(rastrigin_frame, text="n:", font=("Arial", 12), foreground="white")
-ras_n_label.grid(row=4, column=0, pady=10)
+live_var = tb.BooleanVar(value=LIVE_VIEW_AVAILABLE)
+live_check = tb.Checkbutton(frame_inferior, text="Vista en vivo", variable=live_var, bootstyle="round-toggle",
+                            state="normal" if LIVE_VIEW_AVAILABLE else "disabled")
+live_check.grid(row=1, column=0, columnspan=2, pady=5)
 
-ras_entry_n = tb.Entry(rastrigin_frame)
-ras_entry_n.grid(row=4, column=1, pady=10)
+calculate_button = tb.Button(frame_inferior, text="Calcular", command=calculate)
+calculate_button.grid(row=2, column=0, padx=5, pady=10)
 
+cancel_button = tb.Button(frame_inferior, text="Cancelar", bootstyle="danger", state="disabled")
+cancel_button.grid(row=2, column=1, padx=5, pady=10)
 
-def calculate():
-    selection = function_box.get()
-    if selection == quadratic_title:
-        function = QuadraticFunction(float(quad_entry_a.get()),float(quad_entry_b.get()),float(quad_entry_c.get()),float(quad_entry_d.get()))
-        simulator = PSO()
-        simulator.calculate_function(int(quantity_particles_entry.get()), int(quantity_iterations_entry.get()), function, factor_box.get()==constriction_factor)
-        show_results(simulator)
-        return
-    if selection == rosenbrock_title:
-        function = RosenbrockFunction(float(rosenb_entry_a.get()),float(rosenb_entry_b.get()))
-        simulator = PSO()
-        simulator.calculate_function(int(quantity_particles_entry.get()), int(quantity_iterations_entry.get()), function, factor_box.get()==constriction_factor)
-        show_results(simulator)
-        return
-    if selection == rastrigin_title:
-        function = RastriginFunction(float(ras_entry_A.get()), int(ras_entry_n.get()))
-        simulator = PSO()
-        simulator.calculate_function(int(quantity_particles_entry.get()), int(quantity_iterations_entry.get()), function, factor_box.get()==constriction_factor)
-        show_results(simulator)
-        return
+progress_bar = tb.Progressbar(frame_inferior, length=300, bootstyle="success-striped")
+progress_bar.grid(row=3, column=0, columnspan=2, pady=5)
 
-calculate_button = tb.Button(frame_inferior, text="Calcular", command=calculate)
-calculate_button.grid(row=2, column=0, pady=10, columnspan=2)
+status_label = tb.Label(frame_inferior, text="", font=("Arial", 11))
+status_label.grid(row=4, column=0, columnspan=2)
 
 results_frame = tb.Frame(app)
 
@@ -209,27 +292,48 @@ def obtain_name_particles(simulator:PSO)->list[str]:
         particles_names.append(f"Partícula {particle.id}")
     return particles_names
 
-def show_particle_iterations(table, particle:Particle):
-    iteration_id = 1
-    for iteration in particle.iterations:
-        table.insert("", "end", values=(iteration_id, np.array2string(iteration.position, precision=3),
-        np.array2string(iteration.velocity, precision=3),
-        np.array2string(iteration.pbest, precision=3)))
-        iteration_id += 1
-        
+def format_vector(vector) -> str:
+    import numpy as np
+
+    return np.array2string(vector, precision=3)
+
+def show_particle_iterations(table: VirtualTable, simulator: PSO, particle_id: int):
+    """Asocia la tabla al historial de la partícula; solo se formatean las filas visibles."""
+    iterations = simulator.particles[particle_id].iterations
+
+    def row(k):
+        iteration = iterations[k]
+        return (getattr(iteration, "iteration", k + 1), format_vector(iteration.position),
+                format_vector(iteration.velocity), format_vector(iteration.pbest))
+
+    table.set_rows(len(iterations), row)
+
 def obtain_particle_id(particles_combobox:tb.Combobox):
     particle_name = particles_combobox.get()
     particle_id = particle_name.replace("Partícula", "")
-    print(f"Partícula id: {particle_id}")
     return int(particle_id)
 
-def update_table(table, simulator:PSO, particles_combobox):
-    for row in table.get_children():
-        table.delete(row)
+def update_table(table: VirtualTable, simulator:PSO, particles_combobox):
+    show_particle_iterations(table, simulator, obtain_particle_id(particles_combobox))
 
-    pid = obtain_particle_id(particles_combobox)
+STOP_MESSAGES = {
+    STOP_CANCELLED: "Cancelado",
+    STOP_TARGET: "Se alcanzó el valor objetivo",
+    STOP_DIVERSITY: "El enjambre colapsó (diversidad mínima)",
+    STOP_STAGNATION: "Estancamiento del mejor valor",
+    STOP_MAX_EVALUATIONS: "Se agotaron las evaluaciones",
+    STOP_TIME_BUDGET: "Se agotó el tiempo",
+}
+
+
+def stop_message(simulator: PSO) -> str:
+    """Motivo de una parada anticipada para mostrarlo con los resultados ("" si terminó)."""
+    reason = simulator.stop_reason
+    if reason is None or reason == STOP_MAX_ITERATIONS:
+        return ""
+    message = STOP_MESSAGES.get(reason, reason)
+    return f"{message} en la iteración {simulator.iterations_run} de {simulator.quantity_of_iterations}"
 
-    show_particle_iterations(table, simulator.particles[pid])
 
 def show_results(simulator: PSO):
     principal_frame.pack_forget()
@@ -248,12 +352,20 @@ def show_results(simulator: PSO):
 
     best_result = ""
     if simulator.gbest is not None:
+        import numpy as np
+
         best_result:str = np.array2string(simulator.gbest)
     result_text = tb.Label(title_frame, text=f"La mejor configuración de parámetros fue:", font=("Arial", 14))
     result_text.grid(row=1, column=0, pady= 20)
     result_text = tb.Label(title_frame, text=f"{best_result}", font=("Arial", 14, "bold"))
     result_text.grid(row=1, column=1, pady= 20)
 
+    # motivo de la parada (cancelación o criterio): los resultados son parciales
+    stop_text = stop_message(simulator)
+    if stop_text:
+        stop_label = tb.Label(title_frame, text=stop_text, font=("Arial", 13), bootstyle="warning")
+        stop_label.grid(row=2, column=0, columnspan=2)
+
     left_frame = tb.Frame(results_frame)
     left_frame.grid(row=1, column=0, padx=20, pady=20, sticky="n")
 
@@ -268,47 +380,12 @@ def show_results(simulator: PSO):
     particles_combobox.grid(row=1, column=1, pady=10)
     particles_combobox.set("Partícula 0")
 
-    table_frame = tb.Frame(left_frame, width=650, height=800)
-    
-    columns = ("col1", "col2", "col3", "col4")
+    # Tabla virtualizada: el Treeview solo contiene la página visible
+    table = VirtualTable(left_frame, [("#Iter.", 50), ("Posición", 200), ("Velocidad", 200), ("Pbest", 200)])
+    show_particle_iterations(table, simulator, obtain_particle_id(particles_combobox))
 
-    table = tb.Treeview(table_frame, columns=columns, show="headings", height=20)
-
-    # Definir encabezados
-    table.heading("col1", text="#Iter.")
-    table.heading("col2", text="Posición")
-    table.heading("col3", text="Velocidad")
-    table.heading("col4", text="Pbest")
-
-    # Definir ancho de columnas
-    table.column("col1", width=50, minwidth=50, stretch=False)
-    table.column("col2", width=200, minwidth=200, stretch=False)
-    table.column("col3", width=200, minwidth=200, stretch=False)
-    table.column("col4", width=200, minwidth=200, stretch=False)
-
-    # Insertar filas
-    show_particle_iterations(table, simulator.particles[obtain_particle_id(particles_combobox)])
-    
-    # Scroll vertical
-    scroll_y = tb.Scrollbar(table_frame, orient="vertical", command=table.yview)
-    scroll_y.grid(row=0, column=1, sticky="ns")
-
-    # Scroll horizontal
-    scroll_x = tb.Scrollbar(table_frame, orient="horizontal", command=table.xview)
-    scroll_x.grid(row=1, column=0, sticky="we")
-
-    # Conectar scrollbars
-    table.configure(yscrollcommand=scroll_y.set, xscrollcommand=scroll_x.set)
-
-    # Ubicar la tabla
-    table.grid(row=0, column=0, sticky="nsew")
-
-    # Expandir tamaño del frame para que la tabla crezca
-    table_frame.grid_rowconfigure(0, weight=1)
-    table_frame.grid_columnconfigure(0, weight=1)
-    
     particles_combobox.bind("<<ComboboxSelected>>", lambda event: update_table(table, simulator, particles_combobox))
-    table_frame.grid(row=2, column=0, pady=10, columnspan=2)
+    table.frame.grid(row=2, column=0, pady=10, columnspan=2)
     
     right_frame = tb.Frame(results_frame)
     right_frame.grid(row=1, column=1, padx=20, pady=20, sticky="nsew")
@@ -316,48 +393,15 @@ def show_results(simulator: PSO):
     right_title_text = tb.Label(right_frame, text="Iteraciones completas", font=("Arial", 14, "bold"))
     right_title_text.grid(row=0, column=0, pady=20)
 
-    iterations_table_frame = tb.Frame(right_frame)
-    iterations_table_frame.grid(row=1, column=0, pady=20)
-    #iterations_table_frame = tb.Frame(right_frame, width=350)
-    #iterations_table_frame.grid(row=1, column=0, pady=10)
-    #iterations_table_frame.grid_propagate(False) 
-
-    iterations_columns = ("col1", "col2")
+    iterations_table = VirtualTable(right_frame, [("Gbest", 300), ("Diversidad", 100)])
+    iterations = simulator.iterations
 
-    iterations_table = tb.Treeview(iterations_table_frame, columns=iterations_columns, show="headings", height=20)
+    def iteration_row(k):
+        iteration = iterations[k]
+        return (iteration.gbest, iteration.diversity)
 
-    particles_combobox.bind("<<ComboboxSelected>>", lambda event: update_table(table, simulator, particles_combobox))
-    
-    # Definir encabezados
-    iterations_table.heading("col1", text="Gbest")
-    iterations_table.heading("col2", text="Diversidad")
-
-    # Definir ancho de columnas
-    iterations_table.column("col1", width=300, minwidth=200, stretch=True)
-    iterations_table.column("col2", width=100, minwidth=100, stretch=True)
-
-    # Insertar filas
-    for iteration in simulator.iterations:
-        iterations_table.insert("", "end", values=(iteration.gbest, iteration.diversity))
-    
-    # Scroll vertical
-    iterations_scroll_y = tb.Scrollbar(iterations_table_frame, orient="vertical", command=iterations_table.yview)
-    iterations_scroll_y.grid(row=0, column=1, sticky="ns")
-
-    # Scroll horizontal
-    iterations_scroll_x = tb.Scrollbar(iterations_table_frame, orient="horizontal", command=iterations_table.xview)
-    iterations_scroll_x.grid(row=1, column=0, sticky="we")
-
-    # Conectar scrollbars
-    iterations_table.configure(yscrollcommand=iterations_scroll_y.set, xscrollcommand=iterations_scroll_x.set)
-
-    # Ubicar la tabla
-
-    # Expandir tamaño del frame para que la tabla crezca
-    iterations_table_frame.grid_rowconfigure(0, weight=1)
-    iterations_table_frame.grid_columnconfigure(0, weight=1)
-    
-    iterations_table.grid(row=0, column=0, sticky="nsew")
+    iterations_table.set_rows(len(iterations), iteration_row)
+    iterations_table.frame.grid(row=1, column=0, pady=20)
     
 
     
@@ -0,0 +1,112 @@
+"""
+Criterios de parada del PSO
+---------------------------
+Por defecto el PSO ejecuta todas las iteraciones pedidas. Con `StopCriteria` la
+ejecución termina antes si se cumple alguno de los criterios configurados, que
+se comprueban al final de cada iteración:
+
+- `target_value`: el mejor valor alcanza el objetivo.
+- `min_diversity`: el enjambre ha colapsado (diversidad por debajo del umbral).
+- `stagnation_window`: el mejor valor no mejora más de `min_improvement` en ese
+  número de iteraciones.
+- `max_evaluations`: se agotó el presupuesto de evaluaciones.
+- `time_budget`: se agotó el tiempo (segundos de reloj).
+
+Además `cancel()` (que puede llamarse desde otro hilo, p. ej. la interfaz
+gráfica) detiene la ejecución al final de la iteración en curso.
+
+El motivo de la parada queda en `PSO.stop_reason` (`STOP_MAX_ITERATIONS` si se
+completaron todas las iteraciones).
+"""
+
+import threading
+import time
+
+STOP_MAX_ITERATIONS = "max_iterations"
+STOP_TARGET = "target_value"
+STOP_DIVERSITY = "min_diversity"
+STOP_STAGNATION = "stagnation"
+STOP_MAX_EVALUATIONS = "max_evaluations"
+STOP_TIME_BUDGET = "time_budget"
+STOP_CANCELLED = "cancelled"
+
+
+class StopCriteria:
+    """
+    Criterios de parada anticipada (los que valen `None` no se comprueban).
+
+    Args:
+        target_value (float | None): Parar cuando el mejor valor sea <= `target_value`.
+        min_diversity (float | None): Parar cuando la diversidad sea < `min_diversity`.
+        stagnation_window (int | None): Parar tras tantas iteraciones sin mejora.
+        min_improvement (float): Mejora mínima del mejor valor para contar como mejora.
+        max_evaluations (int | None): Parar al alcanzar tantas evaluaciones.
+        time_budget (float | None): Parar tras tantos segundos.
+    """
+
+    def __init__(
+        self,
+        target_value: float | None = None,
+        min_diversity: float | None = None,
+        stagnation_window: int | None = None,
+        min_improvement: float = 0.0,
+        max_evaluations: int | None = None,
+        time_budget: float | None = None,
+    ):
+        self.target_value = target_value
+        self.min_diversity = min_diversity
+        self.stagnation_window = stagnation_window
+        self.min_improvement = min_improvement
+        self.max_evaluations = max_evaluations
+        self.time_budget = time_budget
+        self._cancelled = threading.Event()
+        self.start()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_cancelled"] = self._cancelled.is_set()
+        return state
+
+    def __setstate__(self, state):
+        cancelled = state.pop("_cancelled")
+        self.__dict__.update(state)
+        self._cancelled = threading.Event()
+        if cancelled:
+            self._cancelled.set()
+
+    @property
+    def needs_diversity(self) -> bool:
+        return self.min_diversity is not None
+
+    def cancel(self):
+        """Pide detener la ejecución al final de la iteración en curso."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def start(self):
+        """Reinicia el reloj y el seguimiento de mejoras (al empezar cada ejecución)."""
+        self.start_time: float = time.perf_counter()
+        self.reference_value: float = float("inf")
+        self.last_improvement: int = 0
+
+    def check(self, iteration: int, best_value: float, diversity: float | None, evaluations: int) -> str | None:
+        """Devuelve el motivo de parada tras la iteración `iteration`, o None para seguir."""
+        if self._cancelled.is_set():
+            return STOP_CANCELLED
+        if best_value < self.reference_value - self.min_improvement:
+            self.reference_value = best_value
+            self.last_improvement = iteration
+        if self.target_value is not None and best_value <= self.target_value:
+            return STOP_TARGET
+        if self.min_diversity is not None and diversity is not None and diversity < self.min_diversity:
+            return STOP_DIVERSITY
+        if self.stagnation_window is not None and iteration - self.last_improvement >= self.stagnation_window:
+            return STOP_STAGNATION
+        if self.max_evaluations is not None and evaluations >= self.max_evaluations:
+            return STOP_MAX_EVALUATIONS
+        if self.time_budget is not None and time.perf_counter() - self.start_time >= self.time_budget:
+            return STOP_TIME_BUDGET
+        return None
@@ -0,0 +1,253 @@
+"""
+Telemetría del PSO
+------------------
+Sustituye a los `print` del algoritmo: en cada iteración el PSO construye un
+`IterationMetrics` (mejor valor, gbest, diversidad, evaluaciones, tiempo por fase
+y evaluaciones por segundo) y lo entrega a los sumideros (`sinks`) conectados.
+
+Sumideros disponibles:
+- `NullSink`: no hace nada (equivale a no pasar telemetría).
+- `LoggingSink`: escribe en el logger `pso` (módulo `logging`).
+- `CSVSink` / `JSONLSink`: una fila / línea JSON por iteración en un fichero.
+- `CallbackSink`: llama a una función con cada `IterationMetrics`.
+
+Sin telemetría (`telemetry=None`, por defecto) el PSO no mide tiempos ni crea
+métricas, así que la ejecución es silenciosa y sin sobrecoste.
+"""
+
+import csv
+import json
+import logging
+import time
+
+import numpy as np
+
+
+class IterationMetrics:
+    """
+    Métricas de una iteración del PSO.
+
+    Atributos:
+        iteration (int): Iteración (0-indexada).
+        best_value (float): Mejor valor de la función hasta ahora.
+        gbest (np.ndarray): Mejor posición global.
+        diversity (float): Distancia media al centroide del enjambre.
+        evaluations (int): Evaluaciones acumuladas de la función objetivo.
+        phase_times (dict[str, float]): Segundos por fase en esta iteración.
+        elapsed (float): Segundos desde el inicio de la ejecución.
+        evals_per_second (float): Evaluaciones acumuladas / `elapsed`.
+    """
+
+    def __init__(
+        self,
+        iteration: int,
+        best_value: float,
+        gbest: np.ndarray,
+        diversity: float,
+        evaluations: int,
+        phase_times: dict[str, float],
+        elapsed: float,
+    ):
+        self.iteration: int = iteration
+        self.best_value: float = best_value
+        self.gbest: np.ndarray = gbest
+        self.diversity: float = diversity
+        self.evaluations: int = evaluations
+        self.phase_times: dict[str, float] = phase_times
+        self.elapsed: float = elapsed
+        self.evals_per_second: float = evaluations / elapsed if elapsed > 0 else 0.0
+
+    def as_dict(self) -> dict:
+        """Representación plana (serializable a JSON) de las métricas."""
+        return {
+            "iteration": self.iteration,
+            "best_value": float(self.best_value),
+            "gbest": [float(x) for x in self.gbest],
+            "diversity": float(self.diversity),
+            "evaluations": int(self.evaluations),
+            "elapsed": self.elapsed,
+            "evals_per_second": self.evals_per_second,
+            **{f"time_{name}": t for name, t in self.phase_times.items()},
+        }
+
+
+class TelemetrySink:
+    """Interfaz de un sumidero de telemetría; por defecto todos los métodos no hacen nada."""
+
+    def on_start(self, info: dict):
+        """Inicio de la ejecución (`info`: parámetros del PSO y de la función)."""
+
+    def on_iteration(self, metrics: IterationMetrics):
+        """Fin de una iteración."""
+
+    def on_end(self, summary: dict):
+        """Fin de la ejecución (`summary`: motivo de parada, mejor valor, gbest, evaluaciones, tiempo...)."""
+
+
+class NullSink(TelemetrySink):
+    """Sumidero que descarta todo."""
+
+
+class LoggingSink(TelemetrySink):
+    """
+    Envía la telemetría al módulo `logging`.
+
+    Args:
+        logger (logging.Logger | None): Logger de destino (por defecto `logging.getLogger("pso")`).
+        level (int): Nivel de los mensajes.
+        every (int): Registrar una de cada `every` iteraciones.
+    """
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.INFO, every: int = 1):
+        self.logger: logging.Logger = logger or logging.getLogger("pso")
+        self.level: int = level
+        self.every: int = max(1, every)
+
+    def on_start(self, info: dict):
+        self.logger.log(self.level, "Inicio PSO: %s", info)
+
+    def on_iteration(self, metrics: IterationMetrics):
+        if metrics.iteration % self.every == 0:
+            self.logger.log(
+                self.level,
+                "Iteración %d: mejor valor %.6g, diversidad %.4g, %d evaluaciones (%.0f eval/s)",
+                metrics.iteration, metrics.best_value, metrics.diversity,
+                metrics.evaluations, metrics.evals_per_second,
+            )
+
+    def on_end(self, summary: dict):
+        self.logger.log(self.level, "Fin PSO: %s", summary)
+
+
+class CSVSink(TelemetrySink):
+    """Escribe una fila por iteración en un CSV (gbest como lista JSON)."""
+
+    def __init__(self, path: str):
+        self.path: str = path
+        self._file = None
+        self._writer = None
+
+    def on_start(self, info: dict):
+        self._file = open(self.path, "w", newline="", encoding="utf-8")
+        self._writer = None
+
+    def on_iteration(self, metrics: IterationMetrics):
+        row = metrics.as_dict()
+        row["gbest"] = json.dumps(row["gbest"])
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=list(row))
+            self._writer.writeheader()
+        self._writer.writerow(row)
+
+    def on_end(self, summary: dict):
+        self._file.close()
+
+
+class JSONLSink(TelemetrySink):
+    """Escribe una línea JSON por evento (`start`, `iteration`, `end`)."""
+
+    def __init__(self, path: str):
+        self.path: str = path
+        self._file = None
+
+    def _write(self, event: str, data: dict):
+        self._file.write(json.dumps({"event": event, **data}, default=_to_json) + "\n")
+
+    def on_start(self, info: dict):
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._write("start", info)
+
+    def on_iteration(self, metrics: IterationMetrics):
+        self._write("iteration", metrics.as_dict())
+
+    def on_end(self, summary: dict):
+        self._write("end", summary)
+        self._file.close()
+
+
+class CallbackSink(TelemetrySink):
+    """Llama a `callback(metrics)` al final de cada iteración."""
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def on_iteration(self, metrics: IterationMetrics):
+        self.callback(metrics)
+
+
+def _to_json(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+class Telemetry:
+    """
+    Reparte los eventos a varios sumideros y mide el tiempo por fase.
+
+    Args:
+        sinks (list[TelemetrySink]): Sumideros conectados.
+    """
+
+    def __init__(self, sinks: list[TelemetrySink]):
+        self.sinks: list[TelemetrySink] = sinks
+        self.start_time: float = time.perf_counter()
+        self.phase_times: dict[str, float] = {}
+        self._mark: float = self.start_time
+
+    def start(self, info: dict):
+        self.start_time = self._mark = time.perf_counter()
+        for sink in self.sinks:
+            sink.on_start(info)
+
+    def begin_phase(self):
+        """Marca el inicio de la primera fase de una iteración."""
+        self._mark = time.perf_counter()
+
+    def phase(self, name: str):
+        """Cierra la fase `name` (tiempo desde la marca anterior) y abre la siguiente."""
+        now = time.perf_counter()
+        self.phase_times[name] = self.phase_times.get(name, 0.0) + now - self._mark
+        self._mark = now
+
+    def iteration(self, iteration: int, best_value: float, gbest: np.ndarray, diversity: float, evaluations: int):
+        metrics = IterationMetrics(
+            iteration, best_value, gbest.copy(), diversity, evaluations,
+            self.phase_times, time.perf_counter() - self.start_time,
+        )
+        self.phase_times = {}
+        for sink in self.sinks:
+            sink.on_iteration(metrics)
+
+    def end(self, best_value: float, gbest: np.ndarray, evaluations: int, iterations: int, stop_reason: str | None = None):
+        elapsed = time.perf_counter() - self.start_time
+        summary = {
+            "stop_reason": stop_reason,
+            "best_value": float(best_value),
+            "gbest": [float(x) for x in gbest],
+            "evaluations": int(evaluations),
+            "iterations": int(iterations),
+            "elapsed": elapsed,
+            "evals_per_second": evaluations / elapsed if elapsed > 0 else 0.0,
+        }
+        for sink in self.sinks:
+            sink.on_end(summary)
+
+
+def make_telemetry(telemetry) -> Telemetry | None:
+    """
+    Normaliza el argumento `telemetry` del PSO: `None`, un sumidero, una función
+    (se envuelve en `CallbackSink`) o una lista de ellos. Devuelve `None` si no hay
+    ningún sumidero activo.
+    """
+    if telemetry is None:
+        return None
+    items = telemetry if isinstance(telemetry, (list, tuple)) else [telemetry]
+    sinks = []
+    for item in items:
+        if isinstance(item, NullSink):
+            continue
+        sinks.append(item if isinstance(item, TelemetrySink) else CallbackSink(item))
+    return Telemetry(sinks) if sinks else None
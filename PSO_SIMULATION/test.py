@@ -5,8 +5,12 @@ print(np.abs(-3))
 #operation = vector*0.9
 #print(operation)
 
+import logging
 from function import QuadraticFunction, RosenbrockFunction, RastriginFunction
 from pso import PSO
+from telemetry import LoggingSink
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 #function = QuadraticFunction(1,2,3,4)
 #simulator = PSO()
@@ -14,7 +18,7 @@ from pso import PSO
 
 function = RosenbrockFunction(1,2)
 simulator = PSO()
-simulator.calculate_function(30, 80, function, True)
+simulator.calculate_function(30, 80, function, True, telemetry=LoggingSink(every=10))
 
 #function = RastriginFunction(10, 2)
 #simulator = PSO()
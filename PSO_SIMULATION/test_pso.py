@@ -0,0 +1,94 @@
+"""
+Pruebas deterministas del motor PSO (semillas fijas con `rng=`).
+
+Se ejecutan con `python -m pytest` desde esta carpeta, o directamente con
+`python test_pso.py`.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from cache import CachedFunction
+from experiments import run_study
+from function import BENCHMARK_FUNCTIONS, SphereFunction
+from history import HISTORY_NONE
+from islands import MultiSwarm
+from pso import PSO
+from stopping import STOP_MAX_ITERATIONS, STOP_TARGET, StopCriteria
+
+
+def solve(function, seed, particles=20, iterations=60, **kwargs):
+    swarm = PSO(rng=seed)
+    swarm.calculate_function(particles, iterations, function, history=HISTORY_NONE, **kwargs)
+    return swarm
+
+
+def test_same_seed_same_result():
+    a = solve(BENCHMARK_FUNCTIONS["rastrigin"](3), seed=7)
+    b = solve(BENCHMARK_FUNCTIONS["rastrigin"](3), seed=7)
+    assert a.best_value == b.best_value
+    assert np.array_equal(a.gbest, b.gbest)
+    assert a.evaluations == b.evaluations
+
+
+def test_converges_on_sphere():
+    swarm = solve(SphereFunction(2), seed=1, iterations=100)
+    assert swarm.stop_reason == STOP_MAX_ITERATIONS
+    assert swarm.best_value < 1e-3
+
+
+def test_stops_at_target_value():
+    swarm = solve(SphereFunction(2), seed=1, iterations=500, stop=StopCriteria(target_value=1e-2))
+    assert swarm.stop_reason == STOP_TARGET
+    assert swarm.best_value <= 1e-2
+    assert swarm.iterations_run < 500
+
+
+def test_cache_counts_misses_and_respects_max_size():
+    cached = CachedFunction(SphereFunction(2), max_size=3)
+    X = np.array([[0.0, 1.0], [1.0, 1.0], [0.0, 1.0]])
+    assert np.allclose(cached.evaluate(X), [1.0, 2.0, 1.0])
+    assert (cached.hits, cached.misses) == (1, 2)
+    cached.evaluate(np.array([[2.0, 0.0], [3.0, 0.0], [4.0, 0.0]]))
+    assert cached.stats()["size"] == 3
+
+
+def test_islands_are_reproducible():
+    def best(seed):
+        islands = MultiSwarm(SphereFunction(2), [{}, {"c1": 1.5}], quantity_of_particles=10,
+                             migration_interval=5, processes=0, seed=seed)
+        islands.run(20)
+        return islands.best_value, islands.gbest
+
+    (value_a, gbest_a), (value_b, gbest_b) = best(3), best(3)
+    assert value_a == value_b
+    assert np.array_equal(gbest_a, gbest_b)
+
+
+def test_island_params_reject_rng():
+    try:
+        MultiSwarm(SphereFunction(2), [{"rng": 1}], processes=0)
+    except ValueError:
+        return
+    raise AssertionError("se esperaba ValueError")
+
+
+def test_study_resumes_from_checkpoint():
+    configs = [{"particles": 8, "iterations": 10}]
+    with tempfile.TemporaryDirectory() as directory:
+        checkpoint = os.path.join(directory, "study.jsonl")
+        first = run_study(configs, ["sphere"], [2], seeds=2, checkpoint=checkpoint, workers=0)
+        calls = []
+        second = run_study(configs, ["sphere"], [2], seeds=2, checkpoint=checkpoint, workers=0,
+                           callback=lambda *args: calls.append(args))
+    assert calls == []
+    assert [r["best_value"] for r in first] == [r["best_value"] for r in second]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,114 @@
+"""
+Topologías de vecindario del PSO
+--------------------------------
+Con la topología `gbest` todas las partículas siguen al mejor global, lo que
+converge pronto (y a menudo a un óptimo local) en funciones multimodales como
+Rastrigin. Las topologías locales hacen que cada partícula siga al mejor pbest de
+su vecindario, de modo que la información se propaga más despacio y el enjambre
+explora más.
+
+Cada vecindario se guarda como un array de índices `(n_particles, m)` (la propia
+partícula incluida), así que el mejor local de todo el enjambre se obtiene con un
+único gather + argmin:
+
+    idx = neighbours[arange(n), argmin(pbest_values[neighbours], axis=1)]
+
+Topologías disponibles:
+- `gbest`: totalmente conectada (equivale al PSO clásico).
+- `ring`: anillo, `radius` vecinos a cada lado.
+- `von_neumann`: rejilla toroidal, vecinos arriba, abajo, izquierda y derecha.
+- `random`: `k` informantes aleatorios por partícula, que se vuelven a sortear
+  tras cada iteración sin mejora del mejor global (topología adaptativa de SPSO).
+"""
+
+import math
+
+import numpy as np
+
+TOPOLOGY_GBEST = "gbest"
+TOPOLOGY_RING = "ring"
+TOPOLOGY_VON_NEUMANN = "von_neumann"
+TOPOLOGY_RANDOM = "random"
+TOPOLOGIES = (TOPOLOGY_GBEST, TOPOLOGY_RING, TOPOLOGY_VON_NEUMANN, TOPOLOGY_RANDOM)
+
+
+def ring_neighbours(n: int, radius: int = 1) -> np.ndarray:
+    """Índices `(n, 2 * radius + 1)` del anillo: la partícula y `radius` vecinos a cada lado."""
+    offsets = np.arange(-radius, radius + 1)
+    return (np.arange(n)[:, None] + offsets) % n
+
+
+def von_neumann_neighbours(n: int) -> np.ndarray:
+    """Índices `(n, 5)` en una rejilla toroidal lo más cuadrada posible (centro, N, S, O, E)."""
+    rows = max(1, int(math.sqrt(n)))
+    cols = -(-n // rows)
+    i = np.arange(n)
+    r, c = i // cols, i % cols
+    neighbours = np.stack([
+        i,
+        ((r - 1) % rows) * cols + c,
+        ((r + 1) % rows) * cols + c,
+        r * cols + (c - 1) % cols,
+        r * cols + (c + 1) % cols,
+    ], axis=1)
+    # si la última fila está incompleta, las celdas vacías se pliegan sobre el enjambre
+    return neighbours % n
+
+
+def random_neighbours(n: int, k: int, rng: np.random.Generator) -> np.ndarray:
+    """Índices `(n, k + 1)`: la partícula y `k` informantes aleatorios (con reemplazo)."""
+    return np.concatenate([np.arange(n)[:, None], rng.integers(0, n, size=(n, k))], axis=1)
+
+
+class Topology:
+    """
+    Vecindario del enjambre.
+
+    Args:
+        kind (str): Una de `TOPOLOGIES`.
+        quantity_of_particles (int): Partículas del enjambre.
+        k (int): Informantes por partícula en la topología `random`.
+        radius (int): Vecinos a cada lado en la topología `ring`.
+        rng (np.random.Generator | int | None): Generador (o semilla) de la topología `random`.
+    """
+
+    def __init__(
+        self, kind: str, quantity_of_particles: int, k: int = 3, radius: int = 1,
+        rng: np.random.Generator | int | None = None,
+    ):
+        if kind not in TOPOLOGIES:
+            raise ValueError(f"Topología desconocida: {kind!r} (opciones: {TOPOLOGIES})")
+        self.kind: str = kind
+        self.n: int = quantity_of_particles
+        self.k: int = k
+        self.rng: np.random.Generator = np.random.default_rng(rng)
+        self.neighbours: np.ndarray | None = None
+        if kind == TOPOLOGY_RING:
+            self.neighbours = ring_neighbours(self.n, radius)
+        elif kind == TOPOLOGY_VON_NEUMANN:
+            self.neighbours = von_neumann_neighbours(self.n)
+        elif kind == TOPOLOGY_RANDOM:
+            self.neighbours = random_neighbours(self.n, k, self.rng)
+
+    @property
+    def is_global(self) -> bool:
+        return self.neighbours is None
+
+    def local_best_indices(self, pbest_values: np.ndarray) -> np.ndarray:
+        """Índice del mejor pbest del vecindario de cada partícula (gather + argmin)."""
+        if self.neighbours is None:
+            return np.full(self.n, int(np.argmin(pbest_values)))
+        best = np.argmin(pbest_values[self.neighbours], axis=1)
+        return self.neighbours[np.arange(self.n), best]
+
+    def local_best_index(self, particle: int, pbest_values: np.ndarray) -> int:
+        """Índice del mejor pbest del vecindario de una sola partícula."""
+        if self.neighbours is None:
+            return int(np.argmin(pbest_values))
+        row = self.neighbours[particle]
+        return int(row[np.argmin(pbest_values[row])])
+
+    def update(self, improved: bool):
+        """Tras una iteración: la topología `random` se vuelve a sortear si no hubo mejora."""
+        if self.kind == TOPOLOGY_RANDOM and not improved:
+            self.neighbours = random_neighbours(self.n, self.k, self.rng)
@@ -0,0 +1,107 @@
+"""
+Tabla virtualizada para la interfaz gráfica
+-------------------------------------------
+`VirtualTable` muestra una secuencia de filas de cualquier longitud en un
+`Treeview` que solo contiene las filas visibles (`height`). Las filas se piden y
+se formatean bajo demanda con `row(k)` al desplazarse, así que el coste de
+mostrar o cambiar una tabla no depende del número de filas.
+
+Navegación: barra de desplazamiento, rueda del ratón, teclas RePág/AvPág/Inicio/Fin
+y los botones de página.
+"""
+
+from typing import Callable
+
+import ttkbootstrap as tb
+
+
+class VirtualTable:
+    """
+    Tabla paginada sobre un `Treeview` con las filas generadas bajo demanda.
+
+    Args:
+        parent: Contenedor de la tabla (`self.frame` se coloca con `grid`/`pack`).
+        columns (list[tuple[str, int]]): Título y ancho de cada columna.
+        height (int): Filas visibles (tamaño de página).
+    """
+
+    def __init__(self, parent, columns: list[tuple[str, int]], height: int = 20):
+        self.height: int = height
+        self.first: int = 0
+        self.length: int = 0
+        self.row: Callable[[int], tuple] | None = None
+
+        self.frame = tb.Frame(parent)
+        ids = [f"col{i + 1}" for i in range(len(columns))]
+        self.tree = tb.Treeview(self.frame, columns=ids, show="headings", height=height, selectmode="none")
+        for col, (title, width) in zip(ids, columns):
+            self.tree.heading(col, text=title)
+            self.tree.column(col, width=width, minwidth=width, stretch=False)
+
+        # La barra vertical no desplaza el Treeview (solo tiene una página): mueve la ventana de filas
+        self.scroll_y = tb.Scrollbar(self.frame, orient="vertical", command=self.on_scroll)
+        self.scroll_x = tb.Scrollbar(self.frame, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(xscrollcommand=self.scroll_x.set)
+
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scroll_y.grid(row=0, column=1, sticky="ns")
+        self.scroll_x.grid(row=1, column=0, sticky="we")
+        self.frame.grid_rowconfigure(0, weight=1)
+        self.frame.grid_columnconfigure(0, weight=1)
+
+        nav = tb.Frame(self.frame)
+        nav.grid(row=2, column=0, columnspan=2, pady=5)
+        tb.Button(nav, text="<<", bootstyle="secondary", command=lambda: self.scroll_to(0)).pack(side="left", padx=2)
+        tb.Button(nav, text="<", bootstyle="secondary", command=lambda: self.scroll_by(-self.height)).pack(side="left", padx=2)
+        self.status = tb.Label(nav, text="", width=24, anchor="center")
+        self.status.pack(side="left", padx=10)
+        tb.Button(nav, text=">", bootstyle="secondary", command=lambda: self.scroll_by(self.height)).pack(side="left", padx=2)
+        tb.Button(nav, text=">>", bootstyle="secondary", command=lambda: self.scroll_to(self.length)).pack(side="left", padx=2)
+
+        self.tree.bind("<MouseWheel>", self.on_wheel)
+        self.tree.bind("<Button-4>", lambda event: self.scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda event: self.scroll_by(3))
+        self.tree.bind("<Button-1>", lambda event: self.tree.focus_set())
+        self.tree.bind("<Prior>", lambda event: self.scroll_by(-self.height))
+        self.tree.bind("<Next>", lambda event: self.scroll_by(self.height))
+        self.tree.bind("<Home>", lambda event: self.scroll_to(0))
+        self.tree.bind("<End>", lambda event: self.scroll_to(self.length))
+
+    def set_rows(self, length: int, row: Callable[[int], tuple]):
+        """Sustituye el contenido: `length` filas, la `k`-ésima se obtiene con `row(k)`."""
+        self.length = length
+        self.row = row
+        self.first = 0
+        self.render()
+
+    def scroll_to(self, first: int):
+        """Muestra la página que empieza en la fila `first`."""
+        self.first = max(0, min(first, self.length - self.height))
+        self.render()
+
+    def scroll_by(self, delta: int):
+        self.scroll_to(self.first + delta)
+
+    def on_scroll(self, action: str, value: str, unit: str | None = None):
+        """Comando de la barra vertical (`moveto fracción` o `scroll n units|pages`)."""
+        if action == "moveto":
+            self.scroll_to(round(float(value) * self.length))
+        elif action == "scroll":
+            self.scroll_by(int(value) * (self.height if unit == "pages" else 1))
+
+    def on_wheel(self, event):
+        self.scroll_by(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def render(self):
+        """Formatea y muestra solo las filas de la página actual."""
+        self.tree.delete(*self.tree.get_children())
+        last = min(self.first + self.height, self.length)
+        for k in range(self.first, last):
+            self.tree.insert("", "end", values=self.row(k))
+        if self.length:
+            self.scroll_y.set(self.first / self.length, last / self.length)
+            self.status.configure(text=f"Filas {self.first + 1}-{last} de {self.length}")
+        else:
+            self.scroll_y.set(0, 1)
+            self.status.configure(text="Sin filas")
@@ -0,0 +1,111 @@
+"""
+Benchmark de arranque de las interfaces gráficas
+------------------------------------------------
+Mide, para cada GUI (`PSO_SIMULATION/simulation.py` y `ACO/app.py`), el tiempo
+desde que arranca el proceso hasta que la ventana está dibujada por primera vez
+y lista para recibir eventos. Cada ejecución es un proceso nuevo: el script se
+lanza con `mainloop` sustituido por un `update()` que procesa el primer dibujado,
+anota el tiempo y cierra la ventana.
+
+Se informa la mediana y el mínimo de `--runs` ejecuciones en frío de proceso
+(el arranque del intérprete se mide aparte, con un proceso que no importa nada),
+y con `--imports` los módulos cuya importación fue más costosa (`-X importtime`).
+Con `--clear-cache` se borran antes las miniaturas en caché del simulador PSO
+para medir también el primer arranque.
+
+Ejemplo:
+    python startup_benchmark.py --runs 5 --imports
+"""
+
+import argparse
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# (nombre, script, directorio de trabajo: simulation.py busca `images/` en el directorio actual)
+GUIS = {
+    "pso": (os.path.join(ROOT, "PSO_SIMULATION", "simulation.py"), ROOT),
+    "aco": (os.path.join(ROOT, "ACO", "app.py"), os.path.join(ROOT, "ACO")),
+}
+
+DRIVER = """
+import os, runpy, sys, time, tkinter
+start = time.perf_counter()
+script = sys.argv[1]
+
+def mainloop(self, n=0):
+    self.update()
+    print("STARTUP", time.perf_counter() - start, flush=True)
+    self.destroy()
+
+tkinter.Misc.mainloop = mainloop
+sys.argv = [script]
+sys.path.insert(0, os.path.dirname(script))
+runpy.run_path(script, run_name="__main__")
+"""
+
+
+def run_once(script: str, cwd: str, importtime: bool = False) -> tuple[float, float, str]:
+    """Una ejecución: (segundos hasta la ventana lista dentro del proceso, segundos de reloj del proceso, stderr)."""
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", DRIVER, script]
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=cwd, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    match = re.search(r"STARTUP ([0-9.eE+-]+)", result.stdout)
+    if result.returncode != 0 or match is None:
+        raise RuntimeError(f"{script} no arrancó:\n{result.stderr[-2000:]}")
+    return float(match.group(1)), wall, result.stderr
+
+
+def interpreter_startup(runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def slowest_imports(stderr: str, top: int) -> list[tuple[int, str]]:
+    """Módulos de nivel superior con mayor tiempo acumulado de importación (µs)."""
+    rows = []
+    for line in stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)", line)
+        if match and not match.group(2):
+            rows.append((int(match.group(1)), match.group(3)))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiempo de arranque de las interfaces gráficas")
+    parser.add_argument("--gui", choices=[*GUIS, "all"], default="all")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--imports", action="store_true", help="Mostrar las importaciones más costosas")
+    parser.add_argument("--clear-cache", action="store_true", help="Borrar las miniaturas en caché del simulador PSO")
+    args = parser.parse_args()
+
+    if args.clear_cache:
+        shutil.rmtree(os.path.join(ROOT, "images", ".cache"), ignore_errors=True)
+
+    print(f"Arranque del intérprete: {interpreter_startup(args.runs) * 1000:.0f} ms")
+    print(f"{'GUI':<6}{'ventana (mediana)':>20}{'ventana (mín.)':>17}{'proceso (mediana)':>20}")
+    for name in GUIS if args.gui == "all" else [args.gui]:
+        script, cwd = GUIS[name]
+        runs = [run_once(script, cwd) for _ in range(args.runs)]
+        ready = [r[0] for r in runs]
+        wall = [r[1] for r in runs]
+        print(f"{name:<6}{statistics.median(ready) * 1000:>17.0f} ms{min(ready) * 1000:>14.0f} ms"
+              f"{statistics.median(wall) * 1000:>17.0f} ms")
+        if args.imports:
+            for micros, module in slowest_imports(run_once(script, cwd, importtime=True)[2], 10):
+                print(f"      {micros / 1000:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()